@@ -4,16 +4,28 @@ Create a SQLite database that stores XRPL Testnet wallets (address + signing sec
 
 Usage:
     python create_xrpl_testnet_wallet_db.py wallets.db 10
+    python create_xrpl_testnet_wallet_db.py wallets.db 1000 --workers 8
+    python create_xrpl_testnet_wallet_db.py wallets.db 50000 --offline
 
 This will:
   - create/open wallets.db
   - create a `xrpl_wallets` table (if it doesn't exist)
   - generate 10 XRPL *Testnet* wallets via the Testnet faucet
   - store address, seed, public key, private key in the database
+
+With --workers N, up to N faucet calls run at once and the wallets are
+written in chunked transactions. With --offline, keypairs are derived
+locally (on all cores) and funded with pipelined payments from the wallet
+in SEED_PHRASE_1 instead of the faucet; each chunk is stored before it is
+funded, so no funded key is ever lost.
 """
 
+import os
 import sys
 import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Optional
 
@@ -23,6 +35,12 @@ from xrpl.wallet import Wallet, generate_faucet_wallet
 # Testnet JSON-RPC endpoint (Ripple-operated)
 JSON_RPC_TESTNET_URL = "https://s.altnet.rippletest.net:51234"
 
+# Rows written per transaction in the bulk modes.
+INSERT_CHUNK_SIZE = 1000
+
+# The offline mode funds wallets with the sibling XRPL playground's payment engine.
+XRPL_PLAYGROUND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "xrpl_playground")
+
 DB_SCHEMA = """
 CREATE TABLE IF NOT EXISTS xrpl_wallets (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,6 +67,42 @@ def init_db(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def configure_for_bulk(conn: sqlite3.Connection) -> None:
+    """
+    WAL journaling with synchronous=NORMAL: a commit appends to the log
+    without an fsync of its own, and readers are never blocked by the
+    writer. A power loss can drop the last commits but never corrupts the DB.
+    """
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+
+
+def insert_wallets(
+    conn: sqlite3.Connection,
+    rows,
+    chunk_size: int = INSERT_CHUNK_SIZE,
+) -> int:
+    """
+    Insert (label, address, seed, public_key, private_key) rows with
+    executemany, one transaction per `chunk_size` rows. Returns the count.
+    """
+    rows = list(rows)
+    for start in range(0, len(rows), chunk_size):
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO xrpl_wallets (label, address, seed, public_key, private_key)
+                VALUES (?, ?, ?, ?, ?);
+                """,
+                rows[start:start + chunk_size],
+            )
+    return len(rows)
+
+
+def wallet_row(wallet: Wallet, label: Optional[str]) -> tuple:
+    return (label, wallet.classic_address, wallet.seed, wallet.public_key, wallet.private_key)
+
+
 def insert_wallet(
     conn: sqlite3.Connection,
     address: str,
@@ -104,27 +158,133 @@ def generate_and_store_wallets(
         print(f"[+] Stored TESTNET wallet {i}: {wallet.classic_address}")
 
 
+def generate_and_store_wallets_parallel(
+    conn: sqlite3.Connection,
+    client: JsonRpcClient,
+    count: int,
+    label_prefix: Optional[str] = "wallet",
+    workers: int = 8,
+    chunk_size: int = 100,
+) -> int:
+    """
+    Like generate_and_store_wallets, with up to `workers` faucet calls in
+    flight at once. Finished wallets are written `chunk_size` at a time, in
+    completion order. Returns the number stored.
+    """
+    pending = []
+    stored = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generate_faucet_wallet, client): i for i in range(1, count + 1)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                wallet = future.result()
+            except Exception as e:
+                print(f"[!] Faucet failed for wallet {i}: {e}", file=sys.stderr)
+                continue
+            pending.append(wallet_row(wallet, f"{label_prefix}_{i}" if label_prefix else None))
+            if len(pending) >= chunk_size:
+                stored += insert_wallets(conn, pending)
+                pending = []
+                print(f"[+] Stored {stored}/{count} TESTNET wallets "
+                      f"({stored / (time.perf_counter() - started):.1f}/s)")
+    stored += insert_wallets(conn, pending)
+    return stored
+
+
+def _derive_rows(labels):
+    # Runs in a worker process: key derivation is the CPU-heavy part.
+    return [wallet_row(Wallet.create(), label) for label in labels]
+
+
+def generate_and_store_wallets_offline(
+    conn: sqlite3.Connection,
+    client: JsonRpcClient,
+    master_wallet: Wallet,
+    count: int,
+    amount_xrp: Decimal = Decimal(10),
+    label_prefix: Optional[str] = "wallet",
+    chunk_size: int = INSERT_CHUNK_SIZE,
+) -> int:
+    """
+    Derive `count` keypairs locally and fund each one with `amount_xrp` (at
+    least the base reserve) from `master_wallet`, a chunk at a time: store
+    the chunk, then send its payments through xrpl_payment_engine. Returns
+    the number funded; unfunded wallets stay in the DB and are listed.
+    """
+    sys.path.append(XRPL_PLAYGROUND)
+    from xrpl_payment_engine import PaymentEngine
+
+    if count <= 0:
+        return 0
+    engine = PaymentEngine(client, master_wallet)
+    labels = [f"{label_prefix}_{i}" if label_prefix else None for i in range(1, count + 1)]
+    funded = 0
+    started = time.perf_counter()
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def derive(start):
+            chunk = labels[start:start + chunk_size]
+            per_worker = -(-len(chunk) // workers)
+            return [executor.submit(_derive_rows, chunk[i:i + per_worker]) for i in range(0, len(chunk), per_worker)]
+
+        # The next chunk's keys are derived while the current one is being funded.
+        derived = derive(0)
+        for start in range(0, count, chunk_size):
+            rows = [row for future in derived for row in future.result()]
+            derived = derive(start + chunk_size) if start + chunk_size < count else []
+            insert_wallets(conn, rows, chunk_size)
+
+            results = engine.send_payments([(row[1], amount_xrp) for row in rows])
+            for record in results:
+                if record["result"] == "tesSUCCESS":
+                    funded += 1
+                else:
+                    print(f"[!] Funding {record['destination']} failed: {record['result']}", file=sys.stderr)
+            print(f"[+] Funded {funded}/{count} wallets ({funded / (time.perf_counter() - started):.1f}/s)")
+    return funded
+
+
 def parse_args(argv):
-    if len(argv) < 3:
-        print(
-            "Usage: python create_xrpl_testnet_wallet_db.py <db_path> <num_wallets> [label_prefix]",
-            file=sys.stderr,
-        )
+    usage = (
+        "Usage: python create_xrpl_testnet_wallet_db.py <db_path> <num_wallets> [label_prefix] "
+        "[--workers N] [--offline [--amount XRP]]"
+    )
+    options = {"workers": 1, "offline": False, "amount": Decimal(10)}
+    positional = []
+    args = iter(argv[1:])
+    try:
+        for arg in args:
+            if arg == "--workers":
+                options["workers"] = int(next(args))
+            elif arg == "--amount":
+                options["amount"] = Decimal(next(args))
+            elif arg == "--offline":
+                options["offline"] = True
+            else:
+                positional.append(arg)
+    except (StopIteration, ValueError, InvalidOperation):
+        print(usage, file=sys.stderr)
         sys.exit(1)
 
-    db_path = argv[1]
+    if len(positional) < 2:
+        print(usage, file=sys.stderr)
+        sys.exit(1)
+
+    db_path = positional[0]
     try:
-        num_wallets = int(argv[2])
+        num_wallets = int(positional[1])
     except ValueError:
         print("Error: <num_wallets> must be an integer.", file=sys.stderr)
         sys.exit(1)
 
-    label_prefix = argv[3] if len(argv) >= 4 else "wallet"
-    return db_path, num_wallets, label_prefix
+    label_prefix = positional[2] if len(positional) >= 3 else "wallet"
+    return db_path, num_wallets, label_prefix, options
 
 
 def main():
-    db_path, num_wallets, label_prefix = parse_args(sys.argv)
+    db_path, num_wallets, label_prefix, options = parse_args(sys.argv)
 
     # Ensure directory exists
     db_file = Path(db_path)
@@ -134,15 +294,38 @@ def main():
     print(f"[*] Using database: {db_path}")
     conn = get_connection(db_path)
 
-    # XRPL Testnet client
-    client = JsonRpcClient(JSON_RPC_TESTNET_URL)
+    rpc_url = os.getenv("XRPL_RPC_URL", JSON_RPC_TESTNET_URL)
 
     try:
         init_db(conn)
         print("[*] Initialized xrpl_wallets table (if not already present).")
-        print("[*] Creating funded TESTNET wallets via faucet...")
-        generate_and_store_wallets(conn, client, num_wallets, label_prefix)
-        print("[*] Done.")
+        started = time.perf_counter()
+        if options["offline"]:
+            sys.path.append(XRPL_PLAYGROUND)
+            from dotenv import load_dotenv
+            from xrpl_base import PooledJsonRpcClient
+
+            load_dotenv()
+            master_seed = os.getenv("SEED_PHRASE_1")
+            if not master_seed:
+                print("Error: --offline needs the funding wallet's seed in SEED_PHRASE_1.", file=sys.stderr)
+                sys.exit(1)
+            configure_for_bulk(conn)
+            print(f"[*] Deriving wallets locally and funding them with {options['amount']} XRP each...")
+            generate_and_store_wallets_offline(
+                conn, PooledJsonRpcClient(rpc_url), Wallet.from_seed(master_seed),
+                num_wallets, options["amount"], label_prefix,
+            )
+        elif options["workers"] > 1:
+            configure_for_bulk(conn)
+            print(f"[*] Creating funded TESTNET wallets via faucet, {options['workers']} at a time...")
+            generate_and_store_wallets_parallel(
+                conn, JsonRpcClient(rpc_url), num_wallets, label_prefix, options["workers"]
+            )
+        else:
+            print("[*] Creating funded TESTNET wallets via faucet...")
+            generate_and_store_wallets(conn, JsonRpcClient(rpc_url), num_wallets, label_prefix)
+        print(f"[*] Done in {time.perf_counter() - started:.1f}s.")
     finally:
         conn.close()
 
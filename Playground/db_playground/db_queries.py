@@ -13,6 +13,8 @@ Usage example:
 
 import sqlite3
 import os
+import threading
+from collections import OrderedDict
 import xrpl
 from xrpl.wallet import Wallet
 from xrpl.clients import JsonRpcClient
@@ -23,9 +25,14 @@ class WalletRecord:
     Represents a wallet loaded from the database.
     Contains:
         - DB fields (address, seed, keys)
-        - An xrpl-py Wallet object for signing
+        - An xrpl-py Wallet object for signing, built on first use
+
+    Records are kept compact (__slots__, no key object until needed) so
+    large listings stay cheap.
     """
 
+    __slots__ = ("id", "label", "address", "seed", "public_key", "private_key", "created_at", "_xrpl_wallet")
+
     def __init__(self, row):
         self.id = row["id"]
         self.label = row["label"]
@@ -34,13 +41,18 @@ class WalletRecord:
         self.public_key = row["public_key"]
         self.private_key = row["private_key"]
         self.created_at = row["created_at"]
+        self._xrpl_wallet = None
 
+    @property
+    def xrpl_wallet(self) -> Wallet:
         # Re create usable XRPL Wallet object
-        self.xrpl_wallet = Wallet(
-        seed=self.seed,
-        public_key=self.public_key,
-        private_key=self.private_key,
-)
+        if self._xrpl_wallet is None:
+            self._xrpl_wallet = Wallet(
+                seed=self.seed,
+                public_key=self.public_key,
+                private_key=self.private_key,
+            )
+        return self._xrpl_wallet
 
 
     def __repr__(self):
@@ -51,40 +63,158 @@ class WalletRecord:
 
 
 class WalletLoader:
-    """Handles loading wallets from the SQLite database."""
+    """
+    Handles loading wallets from the SQLite database.
+
+    cache_size: decoded WalletRecords kept in an LRU cache (0 disables it),
+                so hot wallets skip the SELECT and keep their built Wallet
+    read_only:  open the DB read-only with one connection per thread, so
+                many signing threads can share this loader
+    """
 
-    def __init__(self, db_filename="wallets.db"):
+    def __init__(self, db_filename="wallets.db", cache_size: int = 1024, read_only: bool = False):
         # DB is in the same directory as this script
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.db_path = os.path.join(script_dir, db_filename)
-
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row  # return dict-like rows
+        self.read_only = read_only
+        self.cache_size = cache_size
+
+        self._cache = OrderedDict()  # address -> WalletRecord, least recently used first
+        self._cached_ids = {}        # id -> address, for the cached records
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = []
+
+        if not read_only:
+            self._shared_conn = self._connect()
+
+    def _connect(self):
+        if self.read_only:
+            # Each thread gets its own; close() may run on another thread.
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row  # return dict-like rows
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if not self.read_only:
+            return self._shared_conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- cache --------------------------------------------------------------
+
+    def _cached(self, address):
+        with self._lock:
+            record = self._cache.get(address)
+            if record is not None:
+                self._cache.move_to_end(address)
+            return record
+
+    def _remember(self, record):
+        if not self.cache_size:
+            return record
+        with self._lock:
+            self._cache[record.address] = record
+            self._cache.move_to_end(record.address)
+            self._cached_ids[record.id] = record.address
+            while len(self._cache) > self.cache_size:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_ids.pop(evicted.id, None)
+        return record
+
+    def invalidate(self, address: str = None, wallet_id: int = None):
+        """Drops one wallet (by address or id) from the cache, or all of them without arguments."""
+        with self._lock:
+            if address is None and wallet_id is None:
+                self._cache.clear()
+                self._cached_ids.clear()
+                return
+            if address is None:
+                address = self._cached_ids.get(wallet_id)
+            record = self._cache.pop(address, None)
+            if record is not None:
+                self._cached_ids.pop(record.id, None)
+
+    # --- lookups ------------------------------------------------------------
 
     def get_wallet_by_id(self, wallet_id: int) -> WalletRecord:
+        with self._lock:
+            address = self._cached_ids.get(wallet_id)
+        record = self._cached(address) if address is not None else None
+        if record is not None:
+            return record
         cur = self.conn.execute(
             "SELECT * FROM xrpl_wallets WHERE id = ?;", (wallet_id,)
         )
         row = cur.fetchone()
         if not row:
             raise ValueError(f"No wallet found with id {wallet_id}")
-        return WalletRecord(row)
+        return self._remember(WalletRecord(row))
 
     def get_wallet_by_address(self, address: str) -> WalletRecord:
+        record = self._cached(address)
+        if record is not None:
+            return record
         cur = self.conn.execute(
             "SELECT * FROM xrpl_wallets WHERE address = ?;", (address,)
         )
         row = cur.fetchone()
         if not row:
             raise ValueError(f"No wallet found with address {address}")
-        return WalletRecord(row)
+        return self._remember(WalletRecord(row))
+
+    def get_wallets_by_addresses(self, addresses, chunk_size: int = 500) -> dict:
+        """
+        {address: WalletRecord} for every address found, from the cache or
+        one `IN (...)` query per `chunk_size` missing addresses. Addresses
+        not in the DB are simply absent from the result.
+        """
+        found = {}
+        missing = []
+        for address in dict.fromkeys(addresses):
+            record = self._cached(address)
+            if record is not None:
+                found[address] = record
+            else:
+                missing.append(address)
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            placeholders = ", ".join("?" * len(chunk))
+            cur = self.conn.execute(
+                f"SELECT * FROM xrpl_wallets WHERE address IN ({placeholders});", chunk
+            )
+            for row in cur.fetchall():
+                found[row["address"]] = self._remember(WalletRecord(row))
+        return found
+
+    def iter_wallets(self, batch_size: int = 500):
+        """Streams every wallet in id order, reading `batch_size` rows at a time."""
+        cur = self.conn.execute("SELECT * FROM xrpl_wallets ORDER BY id;")
+        try:
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield WalletRecord(row)
+        finally:
+            cur.close()
 
     def list_wallets(self):
-        cur = self.conn.execute("SELECT * FROM xrpl_wallets ORDER BY id;")
-        return [WalletRecord(row) for row in cur.fetchall()]
+        return list(self.iter_wallets())
 
     def close(self):
-        self.conn.close()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Sign transactions for many DB wallets across all CPU cores.
+
+Signing (secp256k1 / ed25519) is pure CPU work, so signing one transaction
+per payout wallet on the caller's thread keeps a single core busy while
+the rest sit idle. SigningService runs a pool of worker processes; each one
+opens the wallet DB itself (read-only) and caches the WalletRecords it
+loads, so seeds and private keys never cross the process boundary. The
+parent sends serialized transactions (tx_json dicts) and gets back only
+(hash, blob).
+
+Usage example:
+
+    with SigningService("wallets.db") as signer:
+        signed = signer.sign_many([payment_1, payment_2, ...])
+
+    for tx_hash, blob in signed:
+        ...submit blob...
+
+Transactions must already carry Sequence, Fee and LastLedgerSequence; the
+service only signs. Each one is signed by the DB wallet of its Account.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from xrpl.models.transactions.transaction import Transaction
+from xrpl.transaction import sign
+
+from db_queries import WalletLoader
+
+# Transactions sent to a worker per task: big enough to amortize the
+# pickling round trip, small enough to keep every core busy until the end.
+DEFAULT_CHUNK_SIZE = 256
+
+# Per-process loader, set up by _init_worker. Its LRU cache keeps the
+# records (and their built Wallets) of the accounts signed for recently.
+_loader = None
+
+
+def _init_worker(db_filename, cache_size):
+    global _loader
+    _loader = WalletLoader(db_filename, cache_size=cache_size, read_only=True)
+
+
+def _sign_chunk(tx_jsons):
+    # One IN-query for the chunk's accounts that are not cached yet.
+    records = _loader.get_wallets_by_addresses(
+        tx_json.get("Account") for tx_json in tx_jsons if tx_json.get("Account")
+    )
+    signed = []
+    for tx_json in tx_jsons:
+        try:
+            record = records.get(tx_json.get("Account"))
+            if record is None:
+                raise ValueError(f"No wallet found with address {tx_json.get('Account')}")
+            transaction = sign(Transaction.from_xrpl(tx_json), record.xrpl_wallet)
+            signed.append((transaction.get_hash(), transaction.blob()))
+        except Exception as e:
+            # One bad record must not sink the rest of the batch.
+            signed.append((None, f"{type(e).__name__}: {e}"))
+    return signed
+
+
+class SigningService:
+    """
+    Process pool that signs transactions with the wallets in the DB.
+
+    db_filename: wallet DB, resolved like WalletLoader does
+    processes:   worker processes (default: one per core)
+    chunk_size:  transactions per worker task
+    cache_size:  wallets each worker keeps loaded
+    """
+
+    def __init__(self, db_filename="wallets.db", processes=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 cache_size=10_000):
+        self.db_filename = db_filename
+        self.processes = processes or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=_init_worker,
+            initargs=(db_filename, cache_size),
+        )
+
+    def sign_many(self, transactions):
+        """
+        Signs every transaction (xrpl-py models or tx_json dicts) and returns
+        one (hash, blob) per transaction, in order. A transaction that could
+        not be signed (e.g. its Account is not in the DB) comes back as
+        (None, error message).
+        """
+        tx_jsons = [tx if isinstance(tx, dict) else tx.to_xrpl() for tx in transactions]
+        chunks = [tx_jsons[i:i + self.chunk_size] for i in range(0, len(tx_jsons), self.chunk_size)]
+        signed = []
+        for chunk in self.executor.map(_sign_chunk, chunks):
+            signed.extend(chunk)
+        return signed
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from xrpl.models.transactions import Payment
+    from xrpl.utils import xrp_to_drops
+
+    db_filename = sys.argv[1] if len(sys.argv) > 1 else "db_xrpl.db"
+
+    # One payment from every wallet to the next one; fields are filled in
+    # directly since this only measures signing.
+    loader = WalletLoader(db_filename)
+    wallets = loader.list_wallets()
+    loader.close()
+    payments = [
+        Payment(
+            account=wallet.address,
+            destination=wallets[(i + 1) % len(wallets)].address,
+            amount=xrp_to_drops(1),
+            sequence=1,
+            fee="12",
+            last_ledger_sequence=1000,
+        )
+        for i, wallet in enumerate(wallets)
+    ]
+
+    started = time.perf_counter()
+    for payment, wallet in zip(payments, wallets):
+        sign(payment, wallet.xrpl_wallet)
+    inline = time.perf_counter() - started
+    print(f"Inline: {len(payments)} signed in {inline:.2f}s")
+
+    with SigningService(db_filename) as signer:
+        started = time.perf_counter()
+        signed = signer.sign_many(payments)
+        elapsed = time.perf_counter() - started
+    failed = [error for tx_hash, error in signed if tx_hash is None]
+    print(f"{signer.processes} processes: {len(signed) - len(failed)} signed in {elapsed:.2f}s "
+          f"({len(failed)} failed)")
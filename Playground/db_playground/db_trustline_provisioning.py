@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Open a trust line to one issued currency from every wallet in the DB.
+
+XrplTransactionClient.set_trust_line sends one TrustSet for one wallet and
+waits for it to validate. For thousands of wallets, TrustLineProvisioner
+works through the xrpl_wallets table a batch at a time:
+
+  1. one JSON-RPC batch of account_lines (peer = issuer) + account_info
+     per wallet builds the pre-check index: which wallets already have the
+     line, and the next Sequence of those that don't;
+  2. a TrustSet is signed for each remaining wallet. Every wallet has its
+     own Sequence, so none of them waits on another, and the whole batch
+     is submitted at once;
+  3. one ValidationTracker resolves them all as ledgers close; rejected or
+     expired ones go back to step 1 (which also notices lines that did get
+     created) up to `max_attempts` times.
+
+Usage:
+
+    python db_trustline_provisioning.py db_xrpl.db <issuer> <currency> [limit]
+"""
+
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import wait
+
+from xrpl.models import requests
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.transactions import TrustSet
+from xrpl.transaction import sign
+
+from db_queries import WalletLoader
+
+# The XRPL helpers live in the sibling playground.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "xrpl_playground"))
+
+from xrpl_autofill import AutofillContext  # noqa: E402
+from xrpl_validation_tracker import PENDING_PREFIXES, ValidationTracker  # noqa: E402
+
+
+def wallet_batches(loader: WalletLoader, batch_size: int):
+    """Yields lists of WalletRecords in id order, `batch_size` at a time."""
+    wallets = loader.iter_wallets(batch_size)
+    while True:
+        batch = list(itertools.islice(wallets, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class TrustLineProvisioner:
+    """
+    client:     a JsonRpcClient with request_batch (xrpl_base.PooledJsonRpcClient)
+    loader:     WalletLoader for the wallet DB
+    batch_size: wallets read, checked and submitted together
+    signer:     optional db_signing_service.SigningService to sign on all cores
+    """
+
+    def __init__(
+        self,
+        client,
+        loader: WalletLoader,
+        issuer: str,
+        currency: str,
+        limit: str = "1000000000",
+        batch_size: int = 500,
+        signer=None,
+        tracker: ValidationTracker = None,
+        autofill: AutofillContext = None,
+        max_attempts: int = 3,
+    ):
+        self.client = client
+        self.loader = loader
+        self.issuer = issuer
+        self.currency = currency
+        self.limit = limit
+        self.batch_size = batch_size
+        self.signer = signer
+        self.tracker = tracker
+        self.autofill = autofill or AutofillContext(client)
+        self.max_attempts = max_attempts
+        self.stats = {"wallets": 0, "created": 0, "existing": 0, "unfunded": 0, "failed": 0}
+        self.failures = {}
+        self._started = None
+
+    # --- pre-check ----------------------------------------------------------
+
+    def _precheck(self, wallets):
+        """Returns [(wallet, sequence)] for the wallets still missing the line."""
+        # The issuer can't hold a trust line to itself.
+        wallets = [wallet for wallet in wallets if wallet.address != self.issuer]
+        if not wallets:
+            return []
+        request_list = []
+        for wallet in wallets:
+            request_list.append(requests.AccountLines(account=wallet.address, peer=self.issuer))
+            request_list.append(requests.AccountInfo(account=wallet.address, ledger_index="current"))
+        responses = self.client.request_batch(request_list)
+
+        todo = []
+        for i, wallet in enumerate(wallets):
+            lines, info = responses[2 * i].result, responses[2 * i + 1].result
+            if info.get("error") == "actNotFound":
+                self.stats["unfunded"] += 1
+            elif any(line["currency"] == self.currency for line in lines.get("lines", [])):
+                self.stats["existing"] += 1
+                self.failures.pop(wallet.address, None)
+            elif "account_data" not in info:
+                self.failures[wallet.address] = info.get("error", "unknown")
+            else:
+                todo.append((wallet, info["account_data"]["Sequence"]))
+        return todo
+
+    # --- submission ---------------------------------------------------------
+
+    def _sign(self, todo):
+        last_ledger = self.autofill.last_ledger_sequence()
+        fee = self.autofill.fee()
+        transactions = [
+            TrustSet(
+                account=wallet.address,
+                limit_amount=IssuedCurrencyAmount(currency=self.currency, issuer=self.issuer, value=self.limit),
+                sequence=sequence,
+                fee=fee,
+                last_ledger_sequence=last_ledger,
+            )
+            for wallet, sequence in todo
+        ]
+        if self.signer is not None:
+            return last_ledger, self.signer.sign_many(transactions)
+        signed = []
+        for transaction, (wallet, _) in zip(transactions, todo):
+            transaction = sign(transaction, wallet.xrpl_wallet)
+            signed.append((transaction.get_hash(), transaction.blob()))
+        return last_ledger, signed
+
+    def _submit(self, todo):
+        """Signs and submits a TrustSet per wallet; returns the wallets to try again."""
+        last_ledger, signed = self._sign(todo)
+        futures = {}
+        submits = []
+        for (wallet, _), (tx_hash, blob) in zip(todo, signed):
+            if tx_hash is None:
+                # The signing service could not sign it; `blob` is the error.
+                self.failures[wallet.address] = blob
+                continue
+            futures[wallet.address] = self.tracker.track(tx_hash, last_ledger)
+            submits.append((wallet, tx_hash, requests.SubmitOnly(tx_blob=blob)))
+
+        responses = self.client.request_batch([submit for _, _, submit in submits])
+        for (wallet, tx_hash, _), response in zip(submits, responses):
+            engine_result = response.result.get("engine_result") or response.result.get("error") or "unknown"
+            if not engine_result.startswith(PENDING_PREFIXES):
+                self.tracker.untrack(tx_hash, engine_result)
+
+        wait(futures.values())
+        retry = []
+        for wallet, _ in todo:
+            if wallet.address not in futures:
+                continue
+            record = futures[wallet.address].result()
+            if record["validated"] and record["result"] == "tesSUCCESS":
+                self.stats["created"] += 1
+                self.failures.pop(wallet.address, None)
+            else:
+                self.failures[wallet.address] = record["result"]
+                # A validated tec result already cost the fee and would only fail again.
+                if not record["validated"] and not record["result"].startswith("tem"):
+                    retry.append(wallet)
+        return retry
+
+    # --- main loop ----------------------------------------------------------
+
+    def provision(self):
+        """Runs over every wallet in the DB; returns the stats dict."""
+        own_tracker = self.tracker is None
+        if own_tracker:
+            self.tracker = ValidationTracker(self.client)
+            self.tracker.add_ledger_listener(self.autofill.on_ledger_closed)
+        self.tracker.start()
+        self._started = time.perf_counter()
+        try:
+            for wallets in wallet_batches(self.loader, self.batch_size):
+                self.stats["wallets"] += len(wallets)
+                for _ in range(self.max_attempts):
+                    todo = self._precheck(wallets)
+                    if not todo:
+                        break
+                    wallets = self._submit(todo)
+                    if not wallets:
+                        break
+                self._report()
+        finally:
+            if own_tracker:
+                self.tracker.stop()
+                self.tracker = None
+        self.stats["failed"] = len(self.failures)
+        return self.stats
+
+    def _report(self):
+        elapsed = time.perf_counter() - self._started
+        print(
+            f"[*] {self.stats['wallets']} wallets: {self.stats['created']} created, "
+            f"{self.stats['existing']} existing, {self.stats['unfunded']} unfunded, "
+            f"{len(self.failures)} failing ({self.stats['wallets'] / elapsed:.1f} wallets/s)"
+        )
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    from xrpl_base import PooledJsonRpcClient  # noqa: E402
+
+    load_dotenv()
+
+    if len(sys.argv) < 4:
+        print("Usage: python db_trustline_provisioning.py <db_path> <issuer> <currency> [limit]", file=sys.stderr)
+        sys.exit(1)
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    db_path, issuer, currency = sys.argv[1:4]
+    limit = sys.argv[4] if len(sys.argv) > 4 else "1000000000"
+
+    loader = WalletLoader(db_path)
+    provisioner = TrustLineProvisioner(PooledJsonRpcClient(RPC_URL), loader, issuer, currency, limit)
+    started = time.perf_counter()
+    stats = provisioner.provision()
+    print(f"[*] Done in {time.perf_counter() - started:.1f}s: {stats}")
+    for address, result in provisioner.failures.items():
+        print(f"    {address}: {result}")
+    loader.close()
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+from xrpl.wallet import Wallet
+
+# The playground modules import each other as top-level modules.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_creation import DB_SCHEMA, insert_wallets, wallet_row  # noqa: E402
+from db_queries import WalletLoader  # noqa: E402
+
+
+class WalletLoaderCacheTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.wallets = [Wallet.create() for _ in range(4)]
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(DB_SCHEMA)
+        insert_wallets(conn, [wallet_row(wallet, f"w{i}") for i, wallet in enumerate(self.wallets)])
+        conn.close()
+        self.loader = WalletLoader(self.db_path, cache_size=2)
+
+    def tearDown(self):
+        self.loader.close()
+        os.remove(self.db_path)
+
+    def rename(self, address, label):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("UPDATE xrpl_wallets SET label = ? WHERE address = ?;", (label, address))
+        conn.close()
+
+    def test_cached_record_is_reused_until_invalidated(self):
+        address = self.wallets[0].classic_address
+        record = self.loader.get_wallet_by_address(address)
+        self.rename(address, "renamed")
+
+        self.assertIs(self.loader.get_wallet_by_address(address), record)
+        self.assertIs(self.loader.get_wallet_by_id(record.id), record)
+
+        self.loader.invalidate(address)
+        self.assertEqual(self.loader.get_wallet_by_address(address).label, "renamed")
+
+    def test_invalidate_by_id_and_all(self):
+        first = self.loader.get_wallet_by_id(1)
+        second = self.loader.get_wallet_by_id(2)
+
+        self.loader.invalidate(wallet_id=1)
+        self.assertIsNot(self.loader.get_wallet_by_id(1), first)
+        self.assertIs(self.loader.get_wallet_by_id(2), second)
+
+        self.loader.invalidate()
+        self.assertIsNot(self.loader.get_wallet_by_id(2), second)
+
+    def test_least_recently_used_is_evicted(self):
+        first = self.loader.get_wallet_by_id(1)
+        second = self.loader.get_wallet_by_id(2)
+        self.loader.get_wallet_by_id(1)  # 2 is now the least recently used
+        self.loader.get_wallet_by_id(3)
+
+        self.assertIs(self.loader.get_wallet_by_id(1), first)
+        self.assertIsNot(self.loader.get_wallet_by_id(2), second)
+
+    def test_bulk_lookup_fills_cache_and_skips_unknown_addresses(self):
+        addresses = [wallet.classic_address for wallet in self.wallets[:2]]
+        found = self.loader.get_wallets_by_addresses(addresses + ["rUnknown"])
+
+        self.assertEqual(sorted(found), sorted(addresses))
+        self.assertIs(self.loader.get_wallet_by_address(addresses[0]), found[addresses[0]])
+
+    def test_read_only_loader_gives_each_thread_its_own_connection(self):
+        loader = WalletLoader(self.db_path, read_only=True)
+        connections = []
+        try:
+            threads = [threading.Thread(target=lambda: connections.append(loader.conn)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertIsNot(connections[0], connections[1])
+            self.assertEqual(loader.get_wallet_by_id(1).address, self.wallets[0].classic_address)
+        finally:
+            loader.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from xrpl.utils import str_to_hex
+from xrpl.wallet import Wallet
+
+# The playground modules import each other as top-level modules.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xrpl_base  # noqa: E402
+from xrpl_base import PooledJsonRpcClient  # noqa: E402
+from xrpl_bulk_mint import BulkMinter, load_checkpoint  # noqa: E402
+from xrpl_stub_server import StubRippled  # noqa: E402
+from xrpl_tickets import TicketPool  # noqa: E402
+
+URIS = [f"https://example.com/nft/{i}.json" for i in range(12)]
+
+
+class Crash(Exception):
+    pass
+
+
+class BulkMinterTest(unittest.TestCase):
+    """BulkMinter against StubRippled: checkpoints, crashes and resumes."""
+
+    def setUp(self):
+        handle, self.checkpoint = tempfile.mkstemp(suffix=".ndjson")
+        os.close(handle)
+        self.wallet = Wallet.create()
+        self.stub = StubRippled(ledger_interval=0.2)
+        self.stub.start()
+        self.client = PooledJsonRpcClient(self.stub.url)
+
+    def tearDown(self):
+        self.stub.stop()
+        os.remove(self.checkpoint)
+
+    def minter(self, tickets=False):
+        pool = TicketPool(self.client, self.wallet, target=30) if tickets else None
+        return BulkMinter(self.client, self.wallet, checkpoint_path=self.checkpoint, ticket_pool=pool,
+                          window=4, workers=4)
+
+    def minted_uris(self):
+        return sorted(
+            entry["tx_json"]["URI"] for entry in self.stub.transactions.values()
+            if entry["tx_json"]["TransactionType"] == "NFTokenMint"
+            and entry["meta"]["TransactionResult"] == "tesSUCCESS"
+        )
+
+    def assert_minted_once(self, uris):
+        self.assertEqual(self.minted_uris(), sorted(str_to_hex(uri).upper() for uri in uris))
+        finished = {
+            uri: entry for uri, entries in load_checkpoint(self.checkpoint).items()
+            for entry in entries if entry.get("result") == "tesSUCCESS"
+        }
+        self.assertEqual(sorted(finished), sorted(uris))
+        self.assertTrue(all(entry["nftoken_id"] for entry in finished.values()))
+
+    def crash_after(self, minter, count):
+        finish = minter._finish
+        finished = []
+
+        def crashing_finish(item, record):
+            if len(finished) == count:
+                raise Crash()
+            finished.append(item)
+            finish(item, record)
+
+        minter._finish = crashing_finish
+
+    def test_mints_everything_once_and_skips_it_on_rerun(self):
+        self.assertEqual(self.minter().mint(URIS), (12, 0))
+        self.assertEqual(self.minter().mint(URIS), (0, 0))
+        self.assert_minted_once(URIS)
+
+    def test_resume_after_crash_does_not_mint_in_flight_items_again(self):
+        minter = self.minter()
+        self.crash_after(minter, 2)
+        with self.assertRaises(Crash):
+            minter.mint(URIS)
+        # The rest of the first window was submitted but never recorded.
+        self.assertGreater(len(self.minted_uris()), 2)
+
+        # Reordered, with one new item: nothing is skipped or minted twice.
+        manifest = list(reversed(URIS)) + ["https://example.com/nft/new.json"]
+        self.minter().mint(manifest)
+        self.assert_minted_once(manifest)
+
+    def test_submission_that_never_landed_is_minted_again(self):
+        validated = self.stub.validated_ledger
+        with open(self.checkpoint, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"uri": URIS[0], "state": "submitted", "hash": "AB" * 32,
+                                "sequence": 1, "last_ledger": validated}) + "\n")
+
+        self.assertEqual(self.minter().mint(URIS[:1]), (1, 0))
+        self.assert_minted_once(URIS[:1])
+
+    def test_ticket_mode_does_not_mint_twice_when_submit_raises(self):
+        submit = xrpl_base.submit
+        calls = []
+
+        def lost_response(signed, client):
+            calls.append(signed)
+            response = submit(signed, client)
+            if len(calls) % 3 == 0:
+                raise ConnectionError("connection reset after sending")
+            return response
+
+        with mock.patch.object(xrpl_base, "submit", lost_response):
+            self.assertEqual(self.minter(tickets=True).mint(URIS), (12, 0))
+        self.assertGreaterEqual(len(calls), 12)
+        self.assert_minted_once(URIS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+from decimal import Decimal
+
+from xrpl.wallet import Wallet
+
+# The playground modules import each other as top-level modules.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xrpl_base import PooledJsonRpcClient  # noqa: E402
+from xrpl_payment_engine import PaymentEngine  # noqa: E402
+from xrpl_stub_server import StubRippled  # noqa: E402
+
+
+class PaymentEngineTest(unittest.TestCase):
+    """PaymentEngine end to end against StubRippled, with chosen submissions failing."""
+
+    def setUp(self):
+        self.wallet = Wallet.create()
+        self.destinations = [Wallet.create().classic_address for _ in range(5)]
+        self.failures = {}  # destination -> engine results to answer, one per submission
+
+    def reject(self, tx_json):
+        if tx_json["TransactionType"] != "Payment":
+            return None
+        results = self.failures.get(tx_json["Destination"])
+        return results.pop(0) if results else None
+
+    def send(self, max_attempts=3):
+        with StubRippled(ledger_interval=0.2, reject=self.reject) as stub:
+            engine = PaymentEngine(
+                PooledJsonRpcClient(stub.url), self.wallet,
+                last_ledger_offset=3, max_attempts=max_attempts, poll_interval=0.05,
+            )
+            records = engine.send_payments([(destination, Decimal("1.5")) for destination in self.destinations])
+            applied = [entry["tx_json"] for entry in stub.transactions.values()]
+        return records, applied
+
+    def payments_to(self, applied, destination):
+        return [tx for tx in applied if tx.get("Destination") == destination and tx["TransactionType"] == "Payment"]
+
+    def test_all_payments_validate(self):
+        records, applied = self.send()
+
+        self.assertEqual([record["result"] for record in records], ["tesSUCCESS"] * 5)
+        self.assertEqual([record["sequence"] for record in records], [1, 2, 3, 4, 5])
+        self.assertEqual({tx["Amount"] for tx in applied}, {"1500000"})
+
+    def test_rejected_sequence_is_filled_and_payment_retried(self):
+        self.failures[self.destinations[1]] = ["telINSUF_FEE_P"]
+
+        records, applied = self.send()
+
+        self.assertEqual([record["result"] for record in records], ["tesSUCCESS"] * 5)
+        self.assertEqual(records[1]["attempts"], 2)
+        # Sequence 2 was filled with a no-op so 3..5 could go through.
+        fillers = [tx for tx in applied if tx["TransactionType"] == "AccountSet"]
+        self.assertEqual([tx["Sequence"] for tx in fillers], [2])
+        for destination in self.destinations:
+            self.assertEqual(len(self.payments_to(applied, destination)), 1)
+
+    def test_expired_payment_is_signed_again(self):
+        # Accepted for later, then never applied: it can only expire.
+        self.failures[self.destinations[0]] = ["terQUEUED"]
+
+        records, applied = self.send()
+
+        self.assertEqual([record["result"] for record in records], ["tesSUCCESS"] * 5)
+        self.assertEqual(records[0]["attempts"], 2)
+        for destination in self.destinations:
+            self.assertEqual(len(self.payments_to(applied, destination)), 1)
+
+    def test_gives_up_after_max_attempts(self):
+        self.failures[self.destinations[2]] = ["telINSUF_FEE_P"] * 2
+
+        records, applied = self.send(max_attempts=2)
+
+        self.assertEqual(records[2]["result"], "telINSUF_FEE_P")
+        self.assertEqual(records[2]["attempts"], 2)
+        self.assertEqual(self.payments_to(applied, self.destinations[2]), [])
+        self.assertEqual([record["result"] for i, record in enumerate(records) if i != 2], ["tesSUCCESS"] * 4)
+
+    def test_malformed_payment_is_not_retried(self):
+        self.failures[self.destinations[3]] = ["temBAD_AMOUNT"]
+
+        records, _ = self.send()
+
+        self.assertEqual(records[3]["result"], "temBAD_AMOUNT")
+        self.assertEqual(records[3]["attempts"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import unittest
+
+from xrpl.wallet import Wallet
+
+# The playground modules import each other as top-level modules.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xrpl_base import PooledJsonRpcClient  # noqa: E402
+from xrpl_stub_server import StubRippled  # noqa: E402
+from xrpl_tickets import TicketPool, TicketRefillError  # noqa: E402
+
+
+class TicketPoolTest(unittest.TestCase):
+    """TicketPool refills against StubRippled, with chosen TicketCreates failing."""
+
+    def setUp(self):
+        self.failures = []  # engine results for the next TicketCreates, in order
+        self.creates = []   # when each TicketCreate was submitted
+
+    def reject(self, tx_json):
+        if tx_json["TransactionType"] != "TicketCreate":
+            return None
+        self.creates.append(time.monotonic())
+        return self.failures.pop(0) if self.failures else None
+
+    def stub(self):
+        return StubRippled(ledger_interval=0.1, reject=self.reject)
+
+    def test_refill_creates_tickets(self):
+        with self.stub() as stub:
+            pool = TicketPool(PooledJsonRpcClient(stub.url), Wallet.create(), target=10)
+            ticket = pool.acquire(timeout=30)
+
+            self.assertEqual(pool.created, 10)
+            self.assertIn(ticket, stub.accounts[pool.account]["Tickets"])
+            self.assertEqual(len(pool), 9)
+            pool.release(ticket)
+            self.assertEqual(len(pool), 10)
+            pool.consume(pool.acquire(timeout=30))
+            self.assertEqual(len(pool), 9)
+
+    def test_failed_refills_back_off_then_raise(self):
+        self.failures = ["tecINSUFFICIENT_RESERVE"] * 3
+        with self.stub() as stub:
+            pool = TicketPool(PooledJsonRpcClient(stub.url), Wallet.create(), target=10,
+                              backoff=0.3, max_failures=3)
+            with self.assertRaises(TicketRefillError) as raised:
+                pool.acquire(timeout=60)
+
+        self.assertIn("tecINSUFFICIENT_RESERVE", str(raised.exception))
+        self.assertEqual(len(self.creates), 3)
+        gaps = [later - earlier for earlier, later in zip(self.creates, self.creates[1:])]
+        self.assertGreaterEqual(gaps[0], 0.3)
+        self.assertGreaterEqual(gaps[1], 0.6)
+        self.assertEqual(pool.created, 0)
+
+    def test_refill_recovers_after_a_failure(self):
+        self.failures = ["tecINSUFFICIENT_RESERVE"]
+        with self.stub() as stub:
+            pool = TicketPool(PooledJsonRpcClient(stub.url), Wallet.create(), target=10,
+                              backoff=0.1, max_failures=3)
+            pool.acquire(timeout=60)
+
+        self.assertEqual(len(self.creates), 2)
+        self.assertEqual(pool.failures, 0)
+        self.assertEqual(pool.created, 10)
+
+    def test_load_clears_failures(self):
+        self.failures = ["tecINSUFFICIENT_RESERVE"]
+        with self.stub() as stub:
+            pool = TicketPool(PooledJsonRpcClient(stub.url), Wallet.create(), target=10,
+                              backoff=0.1, max_failures=1)
+            with self.assertRaises(TicketRefillError):
+                pool.acquire(timeout=60)
+
+            pool.load()
+            self.assertEqual(pool.failures, 0)
+            pool.acquire(timeout=60)
+            self.assertEqual(pool.created, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Subscription-based account monitor.
+
+Instead of calling AccountInfo for every address on a timer (see
+xrpl_adress_monitoring.py), AccountMonitor opens ONE WebSocket, subscribes
+to the `accounts` and `ledger` streams, loads each account's AccountRoot
+once, and from then on keeps an in-memory table up to date from the
+AffectedNodes in each validated transaction's metadata. Idle accounts cost
+nothing.
+
+Usage:
+
+    monitor = AccountMonitor(WS_URL, addresses)
+    monitor.add_listener(lambda address, old, new, tx: print(address, new["Balance"]))
+    await monitor.run()
+
+    monitor.accounts[address]   # latest AccountRoot fields, always current
+"""
+
+import asyncio
+import os
+import sys
+
+from dotenv import load_dotenv
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.models.requests import AccountInfo, Subscribe, Unsubscribe, StreamParameter
+from xrpl.utils import drops_to_xrp
+
+# How many AccountInfo requests the bootstrap keeps in flight at once.
+BOOTSTRAP_CONCURRENCY = 50
+
+
+def affected_entries(meta, ledger_entry_type: str = None):
+    """
+    Yields (change, fields, previous_fields) for every node in a transaction's
+    metadata, optionally filtered by LedgerEntryType. `change` is "created",
+    "modified" or "deleted"; `fields` is the entry's state after the
+    transaction (its last state for deleted nodes).
+    """
+    for node in meta.get("AffectedNodes", []):
+        for kind, change in (("CreatedNode", "created"), ("ModifiedNode", "modified"), ("DeletedNode", "deleted")):
+            if kind not in node:
+                continue
+            entry = node[kind]
+            if ledger_entry_type and entry.get("LedgerEntryType") != ledger_entry_type:
+                continue
+            fields = entry.get("NewFields") if change == "created" else entry.get("FinalFields")
+            fields = dict(fields or {})
+            fields["index"] = entry.get("LedgerIndex")
+            yield change, fields, entry.get("PreviousFields", {})
+
+
+class AccountMonitor:
+    """
+    Maintains `accounts` ({address: AccountRoot fields}) for every watched
+    address from one WebSocket subscription, and calls listeners with
+    (address, old_state, new_state, transaction_message) on every change.
+    `new_state` is None when the account was deleted.
+    """
+
+    def __init__(self, url: str, addresses=(), reconnect_delay: float = 5.0):
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.watched = set(addresses)
+        self.accounts = {}
+        # Ledger each account's bootstrap snapshot was read from; stream
+        # messages from that ledger or older are already reflected in it.
+        self._snapshot_ledger = {}
+        self.ledger_index = None
+        self._listeners = []
+        self._ledger_listeners = []
+        self._client = None
+
+    def add_listener(self, callback):
+        """callback(address, old_state, new_state, message); may be a coroutine function."""
+        self._listeners.append(callback)
+
+    def add_ledger_listener(self, callback):
+        """callback(ledger_index) on every ledger close, e.g. LedgerCache.on_ledger_closed."""
+        self._ledger_listeners.append(callback)
+
+    async def watch(self, addresses):
+        """Starts tracking more addresses; takes effect immediately if connected."""
+        new = set(addresses) - self.watched
+        self.watched |= new
+        if new and self._client is not None:
+            await self._subscribe(self._client, sorted(new))
+
+    async def unwatch(self, addresses):
+        gone = set(addresses) & self.watched
+        self.watched -= gone
+        for address in gone:
+            self.accounts.pop(address, None)
+            self._snapshot_ledger.pop(address, None)
+        if gone and self._client is not None:
+            await self._client.request(Unsubscribe(accounts=sorted(gone)))
+
+    async def run(self):
+        """Connects and processes stream messages forever, reconnecting on errors."""
+        while True:
+            try:
+                async with AsyncWebsocketClient(self.url) as client:
+                    self._client = client
+                    await client.request(Subscribe(streams=[StreamParameter.LEDGER]))
+                    await self._subscribe(client, sorted(self.watched))
+                    async for message in client:
+                        self.handle_message(message)
+            except Exception as e:
+                print(f"Account monitor connection lost: {e}")
+            finally:
+                self._client = None
+            # Whatever happened while we were away is re-read on reconnect.
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _subscribe(self, client, addresses):
+        if not addresses:
+            return
+        await client.request(Subscribe(accounts=addresses))
+        semaphore = asyncio.Semaphore(BOOTSTRAP_CONCURRENCY)
+
+        async def load(address):
+            async with semaphore:
+                response = await client.request(AccountInfo(account=address, ledger_index="validated"))
+            if response.is_successful():
+                self._snapshot_ledger[address] = response.result["ledger_index"]
+                self._set_state(address, response.result["account_data"], None)
+
+        await asyncio.gather(*(load(address) for address in addresses))
+
+    def handle_message(self, message):
+        """Applies one stream message; returns the addresses whose state changed."""
+        message_type = message.get("type")
+        if message_type == "ledgerClosed":
+            self.ledger_index = message["ledger_index"]
+            for callback in self._ledger_listeners:
+                callback(self.ledger_index)
+            return []
+        if message_type != "transaction" or not message.get("validated"):
+            return []
+        return self.apply_transaction(message)
+
+    def apply_transaction(self, message):
+        """Updates watched AccountRoots from a validated transaction's metadata."""
+        ledger_index = message.get("ledger_index")
+        changed = []
+        for change, fields, _ in affected_entries(message.get("meta", {}), "AccountRoot"):
+            address = fields.get("Account")
+            if address not in self.watched:
+                continue
+            if ledger_index is not None and self._snapshot_ledger.get(address, -1) >= ledger_index:
+                continue
+            if change == "deleted":
+                new_state = None
+            else:
+                new_state = {**self.accounts.get(address, {}), **fields}
+            self._set_state(address, new_state, message)
+            changed.append(address)
+        return changed
+
+    def _set_state(self, address, new_state, message):
+        old_state = self.accounts.get(address)
+        if new_state is None:
+            self.accounts.pop(address, None)
+        else:
+            self.accounts[address] = new_state
+        if old_state == new_state:
+            return
+        for callback in self._listeners:
+            result = callback(address, old_state, new_state, message)
+            if asyncio.iscoroutine(result):
+                asyncio.ensure_future(result)
+
+
+def print_change(address, old_state, new_state, message):
+    if new_state is None:
+        print(f"[-] {address} was deleted")
+        return
+    balance = drops_to_xrp(new_state["Balance"])
+    source = f" (tx {message['hash']})" if message else ""
+    print(f"[*] {address}: {balance} XRP, Sequence {new_state['Sequence']}, Flags {new_state['Flags']}{source}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    WS_URL = os.getenv("XRPL_WS_URL", "wss://s.altnet.rippletest.net:51233")
+    addresses = sys.argv[1:] or [
+        address for address in (
+            os.getenv("wallet_1"), os.getenv("wallet_2"), os.getenv("wallet_3")
+        ) if address
+    ]
+
+    monitor = AccountMonitor(WS_URL, addresses)
+    monitor.add_listener(print_change)
+    try:
+        asyncio.run(monitor.run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,311 @@
+import asyncio
+import os
+import time
+from json import JSONDecodeError
+from pprint import pprint
+
+import httpx
+from dotenv import load_dotenv
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.clients.utils import json_to_response, request_to_json_rpc
+from xrpl.models import requests
+
+from xrpl_base import MAX_BATCH_SIZE, batch_to_json_rpc, json_to_batch_responses
+from xrpl_metrics import default_registry, reply_error
+from xrpl_pagination import AsyncMarkerIterator
+from xrpl_singleflight import AsyncSingleFlight
+
+
+class AsyncXrplQueryClient:
+    """
+    Asyncio counterpart of XrplQueryClient (see xrpl_base.py).
+    Exposes the same READ-ONLY methods as coroutines and sends them over
+    one keep-alive HTTP connection pool, so many queries can be in flight
+    at the same time without paying a new TCP/TLS handshake for each one.
+
+    Usage:
+        async with AsyncXrplQueryClient(url) as client:
+            infos = await client.gather_many(
+                client.account_info(address) for address in addresses
+            )
+    """
+    def __init__(
+        self,
+        url: str,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        timeout: float = 10.0,
+        cache=None,
+        coalesce: bool = True,
+        metrics=default_registry,
+    ):
+        self.url = url
+        # Per-method call metrics, an xrpl_metrics.MetricsRegistry (None disables).
+        self.metrics = metrics
+        # Optional response cache shared with sync clients, e.g. xrpl_cache.LedgerCache().
+        self.cache = cache
+        # Identical read-only requests from concurrent tasks share one RPC.
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        # Default fan-out limit for gather_many: never queue more requests
+        # than the pool can actually have open at once.
+        self.concurrency = max_connections
+        self.http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    async def _request(self, request, use_cache: bool = True):
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(request)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            result = await self.single_flight.request(request, lambda: self._send(request))
+        else:
+            result = await self._send(request)
+        if use_cache and self.cache is not None:
+            self.cache.put(request, result)
+        return result
+
+    async def _fetch_page(self, request):
+        return await self._request(request, use_cache=False)
+
+    async def _send(self, request):
+        return json_to_response(await self._post(request_to_json_rpc(request))).result
+
+    async def _post(self, payload):
+        started = time.perf_counter()
+        try:
+            response = await self.http.post(self.url, json=payload)
+        except httpx.HTTPError as e:
+            if self.metrics is not None:
+                self.metrics.record_call(payload["method"], time.perf_counter() - started, error=type(e).__name__)
+            raise
+        try:
+            reply = response.json()
+        except JSONDecodeError:
+            reply = None
+        if self.metrics is not None:
+            self.metrics.record_call(
+                payload["method"],
+                time.perf_counter() - started,
+                bytes_out=len(response.request.content),
+                bytes_in=len(response.content),
+                error=reply_error(reply) if reply is not None else response.status_code,
+            )
+        if reply is None:
+            raise XRPLRequestFailureException(
+                {"error": response.status_code, "error_message": response.text}
+            )
+        return reply
+
+    async def request_batch(self, request_list, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        Async version of XrplQueryClient.request_batch: sends the requests
+        as JSON-RPC batches (chunks of `max_batch_size`, all chunks in
+        parallel) and returns their results in order.
+        """
+        request_list = list(request_list)
+        chunks = [
+            request_list[start:start + max_batch_size]
+            for start in range(0, len(request_list), max_batch_size)
+        ]
+
+        async def post_batch(chunk):
+            try:
+                return await self._post(batch_to_json_rpc(chunk))
+            except XRPLRequestFailureException:
+                return None
+
+        replies = await asyncio.gather(*(post_batch(chunk) for chunk in chunks))
+
+        results = []
+        for chunk, reply in zip(chunks, replies):
+            if isinstance(reply, list) and len(reply) == len(chunk):
+                results.extend(response.result for response in json_to_batch_responses(reply))
+            else:
+                # No batch support on this server: fall back to one call each.
+                results.extend(await asyncio.gather(*(self._request(request) for request in chunk)))
+        return results
+
+    async def gather_many(self, awaitables, limit: int = None, return_exceptions: bool = False):
+        """
+        Awaits every query in `awaitables` with at most `limit` of them in
+        flight at once, and returns their results in the same order.
+        `limit` defaults to the size of the connection pool.
+        """
+        semaphore = asyncio.Semaphore(limit or self.concurrency)
+
+        async def run(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(
+            *(run(awaitable) for awaitable in awaitables),
+            return_exceptions=return_exceptions,
+        )
+
+    async def get_server_info(self):
+        return await self._request(requests.ServerInfo())
+
+    async def get_server_state(self):
+        return await self._request(requests.ServerState())
+
+    async def get_ledger(self, ledger_index="validated", transactions=True, expand=True):
+        # transactions=False gives just the header, e.g. to read the ledger index.
+        return await self._request(requests.Ledger(
+            ledger_index=ledger_index,
+            transactions=transactions,
+            expand=expand
+        ))
+
+    async def get_ledger_closed(self):
+        return await self._request(requests.LedgerClosed())
+
+    async def get_ledger_current(self):
+        return await self._request(requests.LedgerCurrent())
+
+    async def account_info(self, account: str, ledger_index=None):
+        return await self._request(requests.AccountInfo(account=account, ledger_index=ledger_index))
+
+    async def account_currencies(self, account: str):
+        return await self._request(requests.AccountCurrencies(account=account))
+
+    async def account_lines(self, account: str, peer: str = None, ledger_index=None):
+        return await self._request(requests.AccountLines(account=account, peer=peer, ledger_index=ledger_index))
+
+    async def account_nfts(self, account: str, ledger_index=None):
+        return await self._request(requests.AccountNFTs(account=account, ledger_index=ledger_index))
+
+    async def account_channels(self, account: str):
+        # Same as XrplQueryClient: channels are read through account_objects.
+        return await self._request(requests.AccountObjects(
+            account=account,
+            type="payment_channel"
+        ))
+
+    async def account_objects(self, account: str, type: str = None):
+        return await self._request(requests.AccountObjects(account=account, type=type))
+
+    async def account_offers(self, account: str):
+        return await self._request(requests.AccountOffers(account=account))
+
+    async def book_offers(self, taker_gets, taker_pays, limit=10, ledger_index=None):
+        return await self._request(requests.BookOffers(
+            taker_gets=taker_gets,
+            taker_pays=taker_pays,
+            limit=limit,
+            ledger_index=ledger_index
+        ))
+
+    async def nft_info(self, nft_id):
+        return await self._request(requests.NFTokenInfo(nft_id=nft_id))
+
+    async def nft_buy_offers(self, nft_id):
+        return await self._request(requests.NFTBuyOffers(nft_id=nft_id))
+
+    async def nft_sell_offers(self, nft_id):
+        return await self._request(requests.NFTSellOffers(nft_id=nft_id))
+
+    async def ripple_path_find(self, source_account, destination_account, destination_amount):
+        return await self._request(requests.RipplePathFind(
+            source_account=source_account,
+            destination_account=destination_account,
+            destination_amount=destination_amount
+        ))
+
+    async def path_find(self, subcommand="create", **kwargs):
+        return await self._request(requests.PathFind(subcommand=subcommand, **kwargs))
+
+    async def ledger_data(self, limit=10, marker=None):
+        return await self._request(requests.LedgerData(limit=limit, marker=marker))
+
+    async def manifest(self, public_key):
+        return await self._request(requests.Manifest(public_key=public_key))
+
+    # --- Streaming variants of the paginated methods, used with `async for` ---
+
+    def iter_ledger_data(self, limit=256, marker=None, ledger_index="validated"):
+        return AsyncMarkerIterator(self._fetch_page, requests.LedgerData(
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "state")
+
+    def iter_account_lines(self, account: str, peer: str = None, limit=400, marker=None, ledger_index="validated"):
+        return AsyncMarkerIterator(self._fetch_page, requests.AccountLines(
+            account=account,
+            peer=peer,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "lines")
+
+    def iter_account_objects(self, account: str, type: str = None, limit=400, marker=None, ledger_index="validated"):
+        return AsyncMarkerIterator(self._fetch_page, requests.AccountObjects(
+            account=account,
+            type=type,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "account_objects")
+
+    def iter_account_offers(self, account: str, limit=400, marker=None, ledger_index="validated"):
+        return AsyncMarkerIterator(self._fetch_page, requests.AccountOffers(
+            account=account,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "offers")
+
+    def iter_account_nfts(self, account: str, limit=400, marker=None, ledger_index="validated"):
+        return AsyncMarkerIterator(self._fetch_page, requests.AccountNFTs(
+            account=account,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "account_nfts")
+
+
+async def main():
+    load_dotenv()
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    addresses = [
+        address for address in (
+            os.getenv("wallet_1"), os.getenv("wallet_2"), os.getenv("wallet_3")
+        ) if address
+    ]
+
+    async with AsyncXrplQueryClient(RPC_URL) as query_client:
+        # Seven account methods per wallet, all sent concurrently.
+        snapshots = await query_client.gather_many(
+            method(address)
+            for address in addresses
+            for method in (
+                query_client.account_info,
+                query_client.account_currencies,
+                query_client.account_lines,
+                query_client.account_nfts,
+                query_client.account_channels,
+                query_client.account_objects,
+                query_client.account_offers,
+            )
+        )
+        pprint(snapshots)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
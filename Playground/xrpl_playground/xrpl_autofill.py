@@ -0,0 +1,221 @@
+"""
+Shared autofill for transactions.
+
+xrpl-py's autofill asks the server for the fee, the account's Sequence and
+the latest validated ledger for every single transaction. AutofillContext
+keeps those for all transactions it fills:
+
+  - fee, reserves and load factor come from one server_state call per
+    ledger (at most), not per transaction;
+  - each account's next Sequence is read once and then counted locally;
+  - LastLedgerSequence is the latest validated ledger (pushed in by a
+    ledger feed, or read with the fee data) plus an offset.
+
+The fee follows a FeePolicy; the default scales the base fee by the
+server's current load factor (open-ledger escalation included), with a
+ceiling, so transactions still get in when the network is busy.
+
+Usage:
+
+    autofill = AutofillContext(client)
+    tracker.add_ledger_listener(autofill.on_ledger_closed)    # optional feed
+    tx_client = XrplTransactionClient(client, wallet, autofill=autofill)
+
+    signed = sign(autofill.fill(transaction), wallet)         # or by hand
+"""
+
+import dataclasses
+import math
+import threading
+import time
+
+from xrpl.models import requests
+from xrpl.models.transactions.transaction import TransactionType
+
+# Network IDs above this one must be set on every transaction.
+RESTRICTED_NETWORKS = 1024
+
+# Transactions that cost one owner reserve instead of the base fee.
+OWNER_RESERVE_COST = {TransactionType.ACCOUNT_DELETE, TransactionType.AMM_CREATE}
+
+
+class FeePolicy:
+    """
+    Fee in drops for one transaction given the cached server state.
+
+    headroom:      multiplier on top of the load-scaled fee, so a fee read
+                   a few seconds ago still clears a slightly busier ledger
+    max_fee_drops: ceiling on what one transaction may cost
+    """
+
+    def __init__(self, headroom: float = 1.2, max_fee_drops: int = 10_000):
+        self.headroom = headroom
+        self.max_fee_drops = max_fee_drops
+
+    def fee(self, base_fee: int, load_factor: float) -> int:
+        if load_factor <= 1:
+            return base_fee
+        return min(math.ceil(base_fee * load_factor * self.headroom), max(self.max_fee_drops, base_fee))
+
+
+class AutofillContext:
+    """
+    client:     a JsonRpcClient
+    offset:     ledgers added to the latest validated one for LastLedgerSequence
+    max_age:    seconds cached fee data is trusted when no ledger feed is
+                connected (about one ledger close)
+    fee_policy: a FeePolicy
+    """
+
+    def __init__(self, client, offset: int = 20, max_age: float = 4.0, fee_policy: FeePolicy = None):
+        self.client = client
+        self.offset = offset
+        self.max_age = max_age
+        self.fee_policy = fee_policy or FeePolicy()
+        self.ledger_index = None
+        self.base_fee = None
+        self.reserve_base = None
+        self.reserve_inc = None
+        self.load_factor = 1.0
+        self.network_id = None
+        self._state_ledger = None
+        self._state_time = 0.0
+        self._sequences = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    # --- ledger feed --------------------------------------------------------
+
+    def on_ledger_closed(self, ledger_index, **fields):
+        """
+        Feed for ValidationTracker / AccountMonitor ledger listeners; also
+        takes the fee_base / reserve_base / reserve_inc of a ledgerClosed
+        stream message.
+        """
+        with self._lock:
+            if self.ledger_index is None or ledger_index > self.ledger_index:
+                self.ledger_index = ledger_index
+            if "fee_base" in fields:
+                self.base_fee = int(fields["fee_base"])
+                self.reserve_base = int(fields.get("reserve_base", self.reserve_base or 0))
+                self.reserve_inc = int(fields.get("reserve_inc", self.reserve_inc or 0))
+
+    def handle_message(self, message):
+        """Applies a `ledgerClosed` message from a WebSocket ledger stream."""
+        if message.get("type") == "ledgerClosed":
+            fields = {key: message[key] for key in ("fee_base", "reserve_base", "reserve_inc") if key in message}
+            self.on_ledger_closed(message["ledger_index"], **fields)
+
+    # --- cached server state ------------------------------------------------
+
+    def _stale(self):
+        if self.base_fee is None or self._state_ledger != self.ledger_index:
+            # Nothing read yet, or the ledger feed has moved past it.
+            return True
+        return time.monotonic() - self._state_time > self.max_age
+
+    def refresh(self):
+        """Reads fee, reserves, load factor and validated ledger with one server_state call."""
+        response = self.client.request(requests.ServerState())
+        if not response.is_successful():
+            raise RuntimeError(f"server_state failed: {response.result}")
+        state = response.result["state"]
+        validated = state.get("validated_ledger", {})
+        load_base = state.get("load_base", 256) or 256
+        load = max(state.get("load_factor", load_base), state.get("load_factor_fee_escalation", 0))
+        with self._lock:
+            self.base_fee = int(validated.get("base_fee", 10))
+            self.reserve_base = int(validated.get("reserve_base", 0))
+            self.reserve_inc = int(validated.get("reserve_inc", 0))
+            self.load_factor = load / load_base
+            self.network_id = state.get("network_id")
+            if validated.get("seq") and (self.ledger_index is None or validated["seq"] > self.ledger_index):
+                self.ledger_index = validated["seq"]
+            self._state_ledger = self.ledger_index
+            self._state_time = time.monotonic()
+
+    def _ensure_fresh(self):
+        if self._stale():
+            # One thread refreshes; the others wait for it and reuse its read.
+            with self._refresh_lock:
+                if self._stale():
+                    self.refresh()
+
+    def fee(self, transaction=None) -> str:
+        """Fee in drops for `transaction` (or a reference transaction)."""
+        self._ensure_fresh()
+        if transaction is not None and transaction.transaction_type in OWNER_RESERVE_COST:
+            return str(self.reserve_inc)
+        base_fee = self.base_fee
+        fulfillment = getattr(transaction, "fulfillment", None)
+        if transaction is not None and transaction.transaction_type == TransactionType.ESCROW_FINISH and fulfillment:
+            # Same surcharge xrpl-py's autofill applies for crypto-conditions.
+            base_fee = math.ceil(base_fee * (33 + len(fulfillment.encode("utf-8")) / 16))
+        return str(self.fee_policy.fee(base_fee, self.load_factor))
+
+    def last_ledger_sequence(self) -> int:
+        self._ensure_fresh()
+        return self.ledger_index + self.offset
+
+    # --- sequences ----------------------------------------------------------
+
+    def next_sequence(self, account: str) -> int:
+        """Hands out the account's Sequences one by one, reading it only the first time."""
+        with self._lock:
+            sequence = self._sequences.get(account)
+            if sequence is not None:
+                self._sequences[account] = sequence + 1
+                return sequence
+        response = self.client.request(requests.AccountInfo(account=account, ledger_index="current"))
+        if not response.is_successful():
+            raise RuntimeError(f"account_info failed: {response.result}")
+        with self._lock:
+            # Another thread may have read it meanwhile; keep the counter it started.
+            sequence = self._sequences.setdefault(account, response.result["account_data"]["Sequence"])
+            self._sequences[account] = sequence + 1
+            return sequence
+
+    def resync(self, account: str):
+        """Forgets the local Sequence, e.g. after a rejected or expired transaction left a gap."""
+        with self._lock:
+            self._sequences.pop(account, None)
+
+    # --- filling ------------------------------------------------------------
+
+    def fill(self, transaction):
+        """Returns `transaction` with Sequence, Fee, LastLedgerSequence (and NetworkID) set."""
+        changes = {}
+        if transaction.fee is None:
+            changes["fee"] = self.fee(transaction)
+        if transaction.last_ledger_sequence is None:
+            changes["last_ledger_sequence"] = self.last_ledger_sequence()
+        if transaction.sequence is None:
+            changes["sequence"] = 0 if transaction.ticket_sequence is not None else self.next_sequence(transaction.account)
+        if transaction.network_id is None and self.network_id is not None and self.network_id > RESTRICTED_NETWORKS:
+            changes["network_id"] = self.network_id
+        return dataclasses.replace(transaction, **changes) if changes else transaction
+
+
+if __name__ == "__main__":
+    import os
+
+    from dotenv import load_dotenv
+    from xrpl.models.transactions import Payment
+    from xrpl.wallet import Wallet
+
+    from xrpl_base import PooledJsonRpcClient
+
+    load_dotenv()
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    WALLET_SEED = os.getenv("SEED_PHRASE_1")
+
+    autofill = AutofillContext(PooledJsonRpcClient(RPC_URL))
+    autofill.refresh()
+    print(f"Ledger {autofill.ledger_index}: base fee {autofill.base_fee} drops, "
+          f"load factor {autofill.load_factor:.2f}, reserve {autofill.reserve_base}/{autofill.reserve_inc} drops")
+
+    if WALLET_SEED:
+        wallet = Wallet.from_seed(WALLET_SEED)
+        for _ in range(3):
+            print(autofill.fill(Payment(account=wallet.classic_address, destination=wallet.classic_address, amount="1")))
@@ -7,52 +7,223 @@ from dotenv import load_dotenv
 # Import all necessary models and helpers
 from xrpl.clients import JsonRpcClient
 from xrpl.wallet import Wallet
-from xrpl.transaction import submit_and_wait
+from xrpl.transaction import autofill_and_sign, sign, submit, submit_and_wait
 from xrpl.models.transactions import (
     Payment, TrustSet, OfferCreate, NFTokenMint
 )
 from xrpl.models.amounts import IssuedCurrencyAmount
 from xrpl.utils import xrp_to_drops, str_to_hex
 from xrpl.models.transactions.nftoken_mint import NFTokenMintFlag
+from xrpl.models.response import Response, ResponseStatus, ResponseType
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.clients.utils import json_to_response, request_to_json_rpc
+from json import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import dataclasses
+import time
+import httpx
+
+from xrpl_metrics import default_registry, reply_error
+from xrpl_pagination import MarkerIterator
+from xrpl_singleflight import SingleFlight
+from xrpl_validation_tracker import PENDING_PREFIXES, ValidationTracker
+
+# rippled caps the size of a single HTTP request body, so large batches are
+# split into chunks of this many requests.
+MAX_BATCH_SIZE = 50
+
+
+def batch_to_json_rpc(request_list):
+    """
+    Wraps several request models in rippled's JSON-RPC batch envelope:
+    {"method": "batch", "params": [<request>, <request>, ...]}
+    """
+    return {
+        "method": "batch",
+        "params": [request_to_json_rpc(request) for request in request_list],
+    }
+
+
+def json_to_batch_responses(reply):
+    """Converts the list rippled returns for a batch into Response objects."""
+    responses = []
+    for entry in reply:
+        if "result" in entry:
+            responses.append(json_to_response(entry))
+        else:
+            # Entries rippled could not dispatch carry the error at top level.
+            responses.append(Response(
+                status=ResponseStatus.ERROR,
+                result=entry,
+                type=ResponseType.RESPONSE,
+            ))
+    return responses
+
+
+class PooledJsonRpcClient(JsonRpcClient):
+    """
+    A JsonRpcClient that keeps its HTTP connection alive between requests
+    (the stock client opens a new one per call) and can send several
+    requests in a single JSON-RPC batch.
+
+    It is still a JsonRpcClient, so it can be handed to submit_and_wait
+    and the other xrpl-py helpers unchanged; their requests go over the
+    same kept-alive connection.
+
+    Every exchange is recorded in `metrics` (an xrpl_metrics.MetricsRegistry).
+    """
+    def __init__(self, url: str, timeout: float = 10.0, metrics=default_registry):
+        super().__init__(url)
+        self.http = httpx.Client(timeout=timeout)
+        self.metrics = metrics
+        # Flipped off the first time the server rejects a batch envelope.
+        self.supports_batch = True
+
+    def _post(self, payload, timeout=None):
+        started = time.perf_counter()
+        try:
+            response = self.http.post(
+                self.url, json=payload, timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+            )
+        except httpx.HTTPError as e:
+            if self.metrics is not None:
+                self.metrics.record_call(payload["method"], time.perf_counter() - started, error=type(e).__name__)
+            raise
+        try:
+            reply = response.json()
+        except JSONDecodeError:
+            reply = None
+        if self.metrics is not None:
+            self.metrics.record_call(
+                payload["method"],
+                time.perf_counter() - started,
+                bytes_out=len(response.request.content),
+                bytes_in=len(response.content),
+                error=reply_error(reply) if reply is not None else response.status_code,
+            )
+        if reply is None:
+            raise XRPLRequestFailureException(
+                {"error": response.status_code, "error_message": response.text}
+            )
+        return reply
+
+    def request(self, request, timeout=None):
+        return json_to_response(self._post(request_to_json_rpc(request), timeout))
+
+    async def _request_impl(self, request, *, timeout=None):
+        # xrpl-py's helpers (submit_and_wait, autofill, get_fee, ...) end up
+        # here; without this they would open their own connection and skip
+        # the metrics.
+        return await asyncio.to_thread(self.request, request, timeout)
+
+    def request_batch(self, request_list, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        Sends `request_list` in as few HTTP exchanges as possible and returns
+        one Response per request, in order. Servers without batch support
+        get the requests one by one over the same kept-alive connection.
+        """
+        request_list = list(request_list)
+        responses = []
+        for start in range(0, len(request_list), max_batch_size):
+            chunk = request_list[start:start + max_batch_size]
+            if self.supports_batch:
+                try:
+                    reply = self._post(batch_to_json_rpc(chunk))
+                except XRPLRequestFailureException:
+                    reply = None
+                if isinstance(reply, list) and len(reply) == len(chunk):
+                    responses.extend(json_to_batch_responses(reply))
+                    continue
+                self.supports_batch = False
+            responses.extend(self.request(request) for request in chunk)
+        return responses
+
+    def close(self):
+        self.http.close()
+
 
 class XrplQueryClient:
     """
     Handles all READ-ONLY requests to the XRP Ledger.
     This class does not hold any private keys.
     """
-    def __init__(self, url: str):
-        self.client = JsonRpcClient(url)
+    def __init__(self, url, cache=None, coalesce: bool = True):
+        # `url` is one node's URL, a list of URLs to route over, or a ready
+        # client such as xrpl_router.EndpointPool.
+        if isinstance(url, str):
+            self.client = PooledJsonRpcClient(url)
+        elif isinstance(url, (list, tuple)):
+            from xrpl_router import EndpointPool
+            self.client = EndpointPool(url)
+        else:
+            self.client = url
+        # Optional response cache, e.g. xrpl_cache.LedgerCache().
+        self.cache = cache
+        # Identical read-only requests from concurrent threads share one RPC.
+        self.single_flight = SingleFlight() if coalesce else None
+
+    def _request(self, request, use_cache: bool = True):
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(request)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            result = self.single_flight.request(request, lambda: self.client.request(request).result)
+        else:
+            result = self.client.request(request).result
+        if use_cache and self.cache is not None:
+            self.cache.put(request, result)
+        return result
+
+    def _fetch_page(self, request):
+        # Pages streamed by the iter_* methods are read once; keep them out of the cache.
+        return self._request(request, use_cache=False)
+
+    def request_batch(self, request_list):
+        """
+        Sends several `requests.*` models in one JSON-RPC batch and returns
+        their results in the same order, e.g.:
+
+            info, lines, offers = query_client.request_batch([
+                requests.AccountInfo(account=address),
+                requests.AccountLines(account=address),
+                requests.AccountOffers(account=address),
+            ])
+        """
+        return [response.result for response in self.client.request_batch(request_list)]
 
     def get_server_info(self):
-        return self.client.request(requests.ServerInfo()).result
+        return self._request(requests.ServerInfo())
 
     def get_server_state(self):
-        return self.client.request(requests.ServerState()).result
+        return self._request(requests.ServerState())
 
-    def get_ledger(self, ledger_index="validated"):
-        return self.client.request(requests.Ledger(
-            ledger_index=ledger_index, 
-            transactions=True, 
-            expand=True
-        )).result
+    def get_ledger(self, ledger_index="validated", transactions=True, expand=True):
+        # transactions=False gives just the header, e.g. to read the ledger index.
+        return self._request(requests.Ledger(
+            ledger_index=ledger_index,
+            transactions=transactions,
+            expand=expand
+        ))
 
     def get_ledger_closed(self):
-        return self.client.request(requests.LedgerClosed()).result
+        return self._request(requests.LedgerClosed())
 
     def get_ledger_current(self):
-        return self.client.request(requests.LedgerCurrent()).result
+        return self._request(requests.LedgerCurrent())
 
-    def account_info(self, account: str):
-        return self.client.request(requests.AccountInfo(account=account)).result
+    def account_info(self, account: str, ledger_index=None):
+        return self._request(requests.AccountInfo(account=account, ledger_index=ledger_index))
 
     def account_currencies(self, account: str):
-        return self.client.request(requests.AccountCurrencies(account=account)).result
+        return self._request(requests.AccountCurrencies(account=account))
 
-    def account_lines(self, account: str, peer: str = None):
-        return self.client.request(requests.AccountLines(account=account, peer=peer)).result
+    def account_lines(self, account: str, peer: str = None, ledger_index=None):
+        return self._request(requests.AccountLines(account=account, peer=peer, ledger_index=ledger_index))
 
-    def account_nfts(self, account: str):
-        return self.client.request(requests.AccountNFTs(account=account)).result
+    def account_nfts(self, account: str, ledger_index=None):
+        return self._request(requests.AccountNFTs(account=account, ledger_index=ledger_index))
 
     def account_channels(self, account: str):
         # Note: ChannelAuthorize is a transaction type. 
@@ -60,49 +231,93 @@ class XrplQueryClient:
         # or a specific method if available (e.g., PaymentChannel)
         # This is likely an error in the original. 
         # Let's use the correct request:
-        return self.client.request(requests.AccountObjects(
+        return self._request(requests.AccountObjects(
             account=account, 
             type="payment_channel"
-        )).result
+        ))
 
     def account_objects(self, account: str, type: str = None):
-        return self.client.request(requests.AccountObjects(account=account, type=type)).result
+        return self._request(requests.AccountObjects(account=account, type=type))
 
     def account_offers(self, account: str):
-        return self.client.request(requests.AccountOffers(account=account)).result
+        return self._request(requests.AccountOffers(account=account))
 
-    def book_offers(self, taker_gets, taker_pays, limit=10):
-        return self.client.request(requests.BookOffers(
+    def book_offers(self, taker_gets, taker_pays, limit=10, ledger_index=None):
+        return self._request(requests.BookOffers(
             taker_gets=taker_gets, 
-            taker_pays=taker_pays, 
-            limit=limit
-        )).result
+            taker_pays=taker_pays,
+            limit=limit,
+            ledger_index=ledger_index
+        ))
 
     def nft_info(self, nft_id):
         # Note: NFTInfo is deprecated. Use NFTokenInfo
-        return self.client.request(requests.NFTokenInfo(nft_id=nft_id)).result
+        return self._request(requests.NFTokenInfo(nft_id=nft_id))
 
     def nft_buy_offers(self, nft_id):
-        return self.client.request(requests.NFTBuyOffers(nft_id=nft_id)).result
+        return self._request(requests.NFTBuyOffers(nft_id=nft_id))
 
     def nft_sell_offers(self, nft_id):
-        return self.client.request(requests.NFTSellOffers(nft_id=nft_id)).result
+        return self._request(requests.NFTSellOffers(nft_id=nft_id))
 
     def ripple_path_find(self, source_account, destination_account, destination_amount):
-        return self.client.request(requests.RipplePathFind(
+        return self._request(requests.RipplePathFind(
             source_account=source_account,
             destination_account=destination_account,
             destination_amount=destination_amount
-        )).result
+        ))
 
     def path_find(self, subcommand="create", **kwargs):
-        return self.client.request(requests.PathFind(subcommand=subcommand, **kwargs)).result
+        return self._request(requests.PathFind(subcommand=subcommand, **kwargs))
 
     def ledger_data(self, limit=10, marker=None):
-        return self.client.request(requests.LedgerData(limit=limit, marker=marker)).result
+        return self._request(requests.LedgerData(limit=limit, marker=marker))
 
     def manifest(self, public_key):
-        return self.client.request(requests.Manifest(public_key=public_key)).result
+        return self._request(requests.Manifest(public_key=public_key))
+
+    # --- Streaming variants of the paginated methods (see xrpl_pagination.py) ---
+
+    def iter_ledger_data(self, limit=256, marker=None, ledger_index="validated"):
+        return MarkerIterator(self._fetch_page, requests.LedgerData(
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "state")
+
+    def iter_account_lines(self, account: str, peer: str = None, limit=400, marker=None, ledger_index="validated"):
+        return MarkerIterator(self._fetch_page, requests.AccountLines(
+            account=account,
+            peer=peer,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "lines")
+
+    def iter_account_objects(self, account: str, type: str = None, limit=400, marker=None, ledger_index="validated"):
+        return MarkerIterator(self._fetch_page, requests.AccountObjects(
+            account=account,
+            type=type,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "account_objects")
+
+    def iter_account_offers(self, account: str, limit=400, marker=None, ledger_index="validated"):
+        return MarkerIterator(self._fetch_page, requests.AccountOffers(
+            account=account,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "offers")
+
+    def iter_account_nfts(self, account: str, limit=400, marker=None, ledger_index="validated"):
+        return MarkerIterator(self._fetch_page, requests.AccountNFTs(
+            account=account,
+            limit=limit,
+            marker=marker,
+            ledger_index=ledger_index
+        ), "account_nfts")
     
 
 
@@ -113,10 +328,146 @@ class XrplTransactionClient:
     Handles all WRITE operations (transactions) to the XRP Ledger.
     It securely holds a Wallet object to sign transactions.
     """
-    def __init__(self, client: JsonRpcClient, wallet: Wallet):
+    def __init__(self, client: JsonRpcClient, wallet: Wallet, metrics=default_registry, tracker=None, ticket_pool=None,
+                 autofill=None):
         self.client = client
         self.wallet = wallet
         self.account = wallet.classic_address # Get the address from the wallet
+        # Records submit-to-validation time and result per transaction type.
+        self.metrics = metrics
+        # Optional shared xrpl_validation_tracker.ValidationTracker. With one,
+        # transactions are confirmed by its single ledger watcher instead of
+        # a polling loop per transaction.
+        self.tracker = tracker
+        # Optional xrpl_tickets.TicketPool. With one, every transaction uses a
+        # Ticket instead of the next Sequence, so they can run in parallel.
+        self.ticket_pool = ticket_pool
+        # Optional xrpl_autofill.AutofillContext. With one, Fee, Sequence and
+        # LastLedgerSequence come from its per-ledger cache and local
+        # Sequence counter instead of three RPCs per transaction.
+        self.autofill = autofill
+
+    def _autofill_and_sign(self, transaction):
+        if self.autofill is None:
+            return autofill_and_sign(transaction, self.client, self.wallet)
+        return sign(self.autofill.fill(transaction), self.wallet)
+
+    def _resync(self, transaction):
+        # A rejected or expired transaction leaves its Sequence unused.
+        if self.autofill is not None and transaction.ticket_sequence is None:
+            self.autofill.resync(self.account)
+
+    def submit_tracked(self, transaction, on_signed=None):
+        """
+        Autofills, signs and submits `transaction` without waiting, and
+        returns a Future resolving to its ValidationTracker record
+        ({"hash", "validated", "result", "ledger_index", "meta"}).
+        `on_signed(signed)` is called with the signed transaction just
+        before it is submitted. If the submit raises, the transaction may
+        still have reached the network: track its hash again before
+        signing a replacement.
+
+        Without a ticket pool or an AutofillContext the Sequence comes from
+        xrpl-py's autofill, so submit from one thread at a time; with
+        either, from as many as you like.
+        """
+        if self.tracker is None:
+            self.tracker = ValidationTracker(self.client)
+            if self.autofill is not None:
+                self.tracker.add_ledger_listener(self.autofill.on_ledger_closed)
+        transaction_type = transaction.transaction_type.value
+        started = time.perf_counter()
+
+        ticket = None
+        if self.ticket_pool is not None:
+            ticket = self.ticket_pool.acquire()
+            transaction = dataclasses.replace(transaction, ticket_sequence=ticket)
+        try:
+            signed = self._autofill_and_sign(transaction)
+            if on_signed is not None:
+                on_signed(signed)
+            future = self.tracker.track(signed.get_hash(), signed.last_ledger_sequence)
+            try:
+                engine_result = submit(signed, self.client).result.get("engine_result", "unknown")
+            except Exception:
+                self.tracker.untrack(signed.get_hash())
+                self._resync(signed)
+                raise
+        except Exception:
+            if ticket is not None:
+                self.ticket_pool.release(ticket)
+            raise
+
+        if not engine_result.startswith(PENDING_PREFIXES):
+            self.tracker.untrack(signed.get_hash(), engine_result)
+        if ticket is not None:
+            future.add_done_callback(lambda done: self._settle_ticket(ticket, done.result()))
+        elif self.autofill is not None:
+            future.add_done_callback(lambda done: self._settle_sequence(signed, done.result()))
+
+        if self.metrics is not None:
+            future.add_done_callback(lambda done: self.metrics.record_transaction(
+                transaction_type, time.perf_counter() - started, done.result()["result"]
+            ))
+        return future
+
+    def _settle_sequence(self, signed, record):
+        if not record["validated"]:
+            self._resync(signed)
+
+    def _settle_ticket(self, ticket, record):
+        # A validated transaction used its Ticket up, whatever its result.
+        if record["validated"] or record["result"] == "tefNO_TICKET":
+            self.ticket_pool.consume(ticket)
+        else:
+            self.ticket_pool.release(ticket)
+
+    def submit_parallel(self, transactions, workers: int = 16):
+        """
+        Submits independent transactions from `workers` threads and returns
+        their results (see _submit) in order. Needs a ticket pool, since
+        concurrent transactions cannot share the Sequence.
+        """
+        if self.ticket_pool is None:
+            raise ValueError("submit_parallel needs a ticket_pool")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._submit, transactions))
+
+    def _submit(self, transaction):
+        """
+        Autofills, signs, submits and waits for validation. Returns the
+        validated result, or None (after printing the error) on failure.
+        """
+        if self.tracker is not None or self.ticket_pool is not None:
+            try:
+                record = self.submit_tracked(transaction).result()
+            except Exception as e:
+                print(f"Error submitting transaction: {e}")
+                return None
+            if not record["validated"]:
+                print(f"Transaction {record['hash']} failed: {record['result']}")
+                return None
+            return record
+
+        transaction_type = transaction.transaction_type.value
+        started = time.perf_counter()
+        try:
+            if self.autofill is not None:
+                transaction = self._autofill_and_sign(transaction)
+                # Already filled, and the fee was capped by the autofill's policy.
+                response = submit_and_wait(transaction, self.client, self.wallet, check_fee=False, autofill=False)
+            else:
+                response = submit_and_wait(transaction, self.client, self.wallet)
+        except Exception as e:
+            self._resync(transaction)
+            print(f"Error submitting transaction: {e}")
+            if self.metrics is not None:
+                self.metrics.record_transaction(transaction_type, time.perf_counter() - started, type(e).__name__)
+            return None
+        if self.metrics is not None:
+            result = response.result.get("meta", {}).get("TransactionResult", "unknown")
+            self.metrics.record_transaction(transaction_type, time.perf_counter() - started, result)
+        return response.result
 
     def send_xrp(self, destination: str, amount_xrp: float, destination_tag: int = None):
         """
@@ -135,12 +486,29 @@ class XrplTransactionClient:
         # This uses the "submit_and_wait" pattern from your docs
         # It automatically autofills fees, signs, submits, and verifies.
         # [Ref: Section II.D, cite: 2030-2041]
-        try:
-            response = submit_and_wait(payment_tx, self.client, self.wallet)
-            return response.result
-        except Exception as e:
-            print(f"Error submitting transaction: {e}")
-            return None
+        return self._submit(payment_tx)
+
+    def send_xrp_batch(self, payments, window: int = 200):
+        """
+        Sends many XRP payments without waiting for each to validate; see
+        xrpl_payment_engine.PaymentEngine. `payments` holds
+        (destination, amount_xrp[, destination_tag]) tuples. Returns one
+        result dict per payment, in order.
+        """
+        from xrpl_payment_engine import PaymentEngine
+        print(f"Preparing to send {len(payments)} payments...")
+        return PaymentEngine(self.client, self.wallet, window=window).send_payments(payments)
+
+    def mint_nft_batch(self, items, checkpoint_path: str = None):
+        """
+        Mints many NFTs (URIs, (uri, taxon) tuples or dicts) through
+        xrpl_bulk_mint.BulkMinter, on this client's tickets when it has a
+        ticket pool. Returns (minted, failed); NFTokenIDs go to the checkpoint.
+        """
+        from xrpl_bulk_mint import BulkMinter
+        minter = BulkMinter(self.client, self.wallet, checkpoint_path=checkpoint_path,
+                            ticket_pool=self.ticket_pool, tracker=self.tracker, autofill=self.autofill)
+        return minter.mint(items)
 
     def set_trust_line(self, issuer: str, currency: str, limit: str):
         """
@@ -160,12 +528,7 @@ class XrplTransactionClient:
             limit_amount=trust_limit
         )
         
-        try:
-            response = submit_and_wait(trust_set_tx, self.client, self.wallet)
-            return response.result
-        except Exception as e:
-            print(f"Error submitting transaction: {e}")
-            return None
+        return self._submit(trust_set_tx)
 
     def mint_nft(self, uri: str, taxon: int = 0, flags: int = NFTokenMintFlag.TF_TRANSFERABLE):
         """
@@ -181,12 +544,7 @@ class XrplTransactionClient:
             flags=flags
         )
         
-        try:
-            response = submit_and_wait(mint_tx, self.client, self.wallet)
-            return response.result
-        except Exception as e:
-            print(f"Error submitting transaction: {e}")
-            return None
+        return self._submit(mint_tx)
 
 if __name__ == "__main__":
     load_dotenv()
@@ -199,30 +557,42 @@ if __name__ == "__main__":
 
     query_client = XrplQueryClient(RPC_URL)
 
-    pprint(query_client.get_server_info())
-    pprint(query_client.get_server_state())
-    pprint(query_client.get_ledger())
-    pprint(query_client.get_ledger_closed())
-    pprint(query_client.get_ledger_current())
+    # Build the whole snapshot as one batch instead of a round trip per call.
+    snapshot = [
+        ("server_info", requests.ServerInfo()),
+        ("server_state", requests.ServerState()),
+        ("ledger", requests.Ledger(ledger_index="validated", transactions=True, expand=True)),
+        ("ledger_closed", requests.LedgerClosed()),
+        ("ledger_current", requests.LedgerCurrent()),
+    ]
 
     if ACCOUNT_ADDRESS:
-        pprint(query_client.account_info(ACCOUNT_ADDRESS))
-        pprint(query_client.account_currencies(ACCOUNT_ADDRESS))
-        pprint(query_client.account_lines(ACCOUNT_ADDRESS))
-        pprint(query_client.account_nfts(ACCOUNT_ADDRESS))
-        pprint(query_client.account_channels(ACCOUNT_ADDRESS))
-        pprint(query_client.account_objects(ACCOUNT_ADDRESS))
-        pprint(query_client.account_offers(ACCOUNT_ADDRESS))
-
-    pprint(query_client.ledger_data(limit=5))
+        snapshot += [
+            ("account_info", requests.AccountInfo(account=ACCOUNT_ADDRESS)),
+            ("account_currencies", requests.AccountCurrencies(account=ACCOUNT_ADDRESS)),
+            ("account_lines", requests.AccountLines(account=ACCOUNT_ADDRESS)),
+            ("account_nfts", requests.AccountNFTs(account=ACCOUNT_ADDRESS)),
+            ("account_channels", requests.AccountObjects(account=ACCOUNT_ADDRESS, type="payment_channel")),
+            ("account_objects", requests.AccountObjects(account=ACCOUNT_ADDRESS)),
+            ("account_offers", requests.AccountOffers(account=ACCOUNT_ADDRESS)),
+        ]
+
+    snapshot.append(("ledger_data", requests.LedgerData(limit=5)))
 
     if NFT_ID:
-        pprint(query_client.nft_info(NFT_ID))
-        pprint(query_client.nft_buy_offers(NFT_ID))
-        pprint(query_client.nft_sell_offers(NFT_ID))
+        snapshot += [
+            ("nft_info", requests.NFTokenInfo(nft_id=NFT_ID)),
+            ("nft_buy_offers", requests.NFTBuyOffers(nft_id=NFT_ID)),
+            ("nft_sell_offers", requests.NFTSellOffers(nft_id=NFT_ID)),
+        ]
 
     if MANIFEST_PUB_KEY:
-        pprint(query_client.manifest(MANIFEST_PUB_KEY))
+        snapshot.append(("manifest", requests.Manifest(public_key=MANIFEST_PUB_KEY)))
+
+    names, request_list = zip(*snapshot)
+    for name, result in zip(names, query_client.request_batch(request_list)):
+        print(f"\n--- {name} ---")
+        pprint(result)
 
     if WALLET_SEED:
         wallet = Wallet(seed=WALLET_SEED, sequence=0)
@@ -0,0 +1,76 @@
+"""
+Benchmark: one snapshot of 15 read-only requests, sent
+  1. one by one with the stock JsonRpcClient (new connection per call),
+  2. one by one over PooledJsonRpcClient's kept-alive connection,
+  3. as a single JSON-RPC batch with PooledJsonRpcClient.request_batch.
+
+Runs against the local stand-in server in xrpl_stub_server.py, which adds a
+fixed delay per HTTP exchange to simulate the round trip to a remote node.
+
+Usage:
+    python xrpl_batch_benchmark.py [delay_ms] [rounds]
+"""
+
+import sys
+import time
+
+from xrpl.clients import JsonRpcClient
+from xrpl.models import requests
+
+from xrpl_base import PooledJsonRpcClient
+from xrpl_stub_server import StubRippled
+
+ACCOUNT = "rNcmpNiUjUjrWhod2Vr1fgQPtZm9QyPVRV"
+NFT_ID = "00000000955CF0E765491900ECA6C630CCCE9566A407F9264DB3191000BBB976"
+
+SNAPSHOT = [
+    requests.ServerInfo(),
+    requests.ServerState(),
+    requests.Ledger(ledger_index="validated", transactions=True, expand=True),
+    requests.LedgerClosed(),
+    requests.LedgerCurrent(),
+    requests.AccountInfo(account=ACCOUNT),
+    requests.AccountCurrencies(account=ACCOUNT),
+    requests.AccountLines(account=ACCOUNT),
+    requests.AccountNFTs(account=ACCOUNT),
+    requests.AccountObjects(account=ACCOUNT, type="payment_channel"),
+    requests.AccountObjects(account=ACCOUNT),
+    requests.AccountOffers(account=ACCOUNT),
+    requests.LedgerData(limit=5),
+    requests.NFTBuyOffers(nft_id=NFT_ID),
+    requests.NFTSellOffers(nft_id=NFT_ID),
+]
+
+
+def timed(label, rounds, fn):
+    fn()  # warm up (connection setup, imports)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - start) / rounds * 1000
+    print(f"{label:<34}{per_round:>10.1f} ms / snapshot")
+    return per_round
+
+
+def main():
+    delay_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with StubRippled(delay=delay_ms / 1000) as server:
+        stock = JsonRpcClient(server.url)
+        pooled = PooledJsonRpcClient(server.url)
+
+        print(f"[*] {len(SNAPSHOT)} requests per snapshot, {delay_ms:.0f} ms per round trip, {rounds} rounds")
+        serial = timed("serial, JsonRpcClient", rounds,
+                       lambda: [stock.request(request) for request in SNAPSHOT])
+        timed("serial, PooledJsonRpcClient", rounds,
+              lambda: [pooled.request(request) for request in SNAPSHOT])
+        batched = timed("batch, PooledJsonRpcClient", rounds,
+                        lambda: pooled.request_batch(SNAPSHOT))
+        print(f"[*] batch speed-up over serial JsonRpcClient: {serial / batched:.1f}x")
+
+        pooled.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Bulk NFT minting.
+
+BulkMinter mints a whole collection from an iterable of items or a
+streaming CSV / NDJSON manifest, through one of two pipelines:
+
+  - sequence mode (default): xrpl_payment_engine.PipelinedSubmitter signs
+    and submits windows of NFTokenMints back-to-back with locally numbered
+    Sequences;
+  - ticket mode (pass a TicketPool): up to `workers` mints in flight at
+    once, each on its own Ticket, so one failure never holds up the rest.
+
+The NDJSON checkpoint file is keyed by URI, so editing or reordering the
+manifest between runs is safe (rows with the same URI are one item). Each
+mint is recorded twice: once as signed, with its hash, Sequence or Ticket
+and LastLedgerSequence, BEFORE it is submitted; and once finished, with
+its result and NFTokenID (read from the metadata with get_nftoken_id).
+Running again with the same checkpoint skips everything already minted,
+and first follows every hash an earlier run submitted without recording
+a result until it validates or expires, so nothing that was in flight
+when that run died is minted twice.
+
+Manifest formats (one item per row/line; taxon, flags and transfer_fee are
+optional):
+
+    uri,taxon,flags,transfer_fee              # CSV with a header row
+    https://example.com/nft/1.json,7,8,500
+
+    {"uri": "https://example.com/nft/1.json", "taxon": 7}    # NDJSON
+
+Usage:
+
+    python xrpl_bulk_mint.py collection.csv [checkpoint.ndjson] [--tickets]
+"""
+
+import csv
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from xrpl.models.transactions import NFTokenMint
+from xrpl.models.transactions.nftoken_mint import NFTokenMintFlag
+from xrpl.utils import get_nftoken_id, str_to_hex
+from xrpl.wallet import Wallet
+
+from xrpl_payment_engine import PipelinedSubmitter
+from xrpl_validation_tracker import ValidationTracker
+
+
+def read_manifest(path: str):
+    """Yields one item dict per row of a CSV or NDJSON (.ndjson / .jsonl) manifest, lazily."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".ndjson", ".jsonl")):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for row in rows:
+            yield {key: value for key, value in row.items() if value not in (None, "")}
+
+
+def load_checkpoint(path: str):
+    """{uri: [entry, ...]} from a checkpoint file, each URI's entries in file order."""
+    entries = {}
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault(entry["uri"], []).append(entry)
+    return entries
+
+
+def unresolved_submissions(entries):
+    """A URI's "submitted" entries whose hash never got a finished entry."""
+    finished = {entry.get("hash") for entry in entries if entry.get("state") != "submitted"}
+    return [entry for entry in entries if entry.get("state") == "submitted" and entry["hash"] not in finished]
+
+
+def extract_nftoken_id(meta):
+    if not meta:
+        return None
+    # rippled adds nftoken_id to NFTokenMint metadata; older servers don't.
+    return meta.get("nftoken_id") or get_nftoken_id(meta)
+
+
+class BulkMinter:
+    """
+    client:          a JsonRpcClient (xrpl_base.PooledJsonRpcClient batches submits)
+    checkpoint_path: NDJSON file recording every signed and finished mint; enables resume
+    ticket_pool:     an xrpl_tickets.TicketPool switches to ticket mode
+    window:          sequence mode: mints signed and in flight at once
+    workers:         ticket mode: mints in flight at once
+    autofill:        ticket mode: an xrpl_autofill.AutofillContext shared by all mints
+    """
+
+    def __init__(
+        self,
+        client,
+        wallet: Wallet,
+        checkpoint_path: str = None,
+        ticket_pool=None,
+        tracker=None,
+        autofill=None,
+        window: int = 200,
+        workers: int = 32,
+        default_taxon: int = 0,
+        default_flags: int = NFTokenMintFlag.TF_TRANSFERABLE,
+        max_attempts: int = 3,
+    ):
+        self.client = client
+        self.wallet = wallet
+        self.account = wallet.classic_address
+        self.checkpoint_path = checkpoint_path
+        self.ticket_pool = ticket_pool
+        self.tracker = tracker
+        self.autofill = autofill
+        self.window = window
+        self.workers = workers
+        self.default_taxon = default_taxon
+        self.default_flags = default_flags
+        self.max_attempts = max_attempts
+        self.minted = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._checkpoint = None
+        self._started = None
+
+    @staticmethod
+    def _item(item):
+        if isinstance(item, str):
+            return {"uri": item}
+        if not isinstance(item, dict):
+            return dict(zip(("uri", "taxon"), item))
+        return item
+
+    def _transaction(self, item):
+        item = self._item(item)
+        transfer_fee = item.get("transfer_fee")
+        return NFTokenMint(
+            account=self.account,
+            uri=str_to_hex(item["uri"]),
+            nftoken_taxon=int(item.get("taxon", self.default_taxon)),
+            flags=int(item.get("flags", self.default_flags)),
+            transfer_fee=int(transfer_fee) if transfer_fee is not None else None,
+        )
+
+    def _write(self, entry):
+        if self._checkpoint is not None:
+            self._checkpoint.write(json.dumps(entry) + "\n")
+            self._checkpoint.flush()
+
+    def _signed(self, item, record):
+        """Records a signed mint before it is submitted."""
+        entry = {"uri": self._item(item)["uri"], "state": "submitted", "hash": record["hash"]}
+        for field in ("sequence", "ticket", "last_ledger"):
+            if record.get(field) is not None:
+                entry[field] = record[field]
+        with self._lock:
+            self._write(entry)
+
+    def _entry(self, uri, record):
+        succeeded = record.get("result") == "tesSUCCESS"
+        return {
+            "uri": uri,
+            "result": record.get("result"),
+            "hash": record.get("hash"),
+            "ledger_index": record.get("ledger_index"),
+            "nftoken_id": extract_nftoken_id(record.get("meta")) if succeeded else None,
+        }
+
+    def _finish(self, item, record):
+        entry = self._entry(self._item(item)["uri"], record)
+        with self._lock:
+            if entry["result"] == "tesSUCCESS":
+                self.minted += 1
+            else:
+                self.failed += 1
+            self._write(entry)
+            done = self.minted + self.failed
+            if done % 100 == 0:
+                rate = done / (time.perf_counter() - self._started)
+                print(f"{self.minted} minted, {self.failed} failed ({rate:.1f}/s)")
+
+    def _reconcile(self, in_doubt):
+        """
+        Waits for every mint an earlier run submitted but never finished
+        ({uri: [submitted entries]}) to validate or expire, records the
+        outcome and returns the URIs that turned out minted.
+        """
+        print(f"Checking {len(in_doubt)} mints left in flight by the last run")
+        tracker = self.tracker or ValidationTracker(self.client)
+        futures = {
+            uri: [tracker.track(entry["hash"], entry.get("last_ledger")) for entry in entries]
+            for uri, entries in in_doubt.items()
+        }
+        minted = set()
+        try:
+            for uri, pending in futures.items():
+                for future in pending:
+                    record = future.result()
+                    self._write(self._entry(uri, record))
+                    if record["result"] == "tesSUCCESS":
+                        minted.add(uri)
+        finally:
+            if tracker is not self.tracker:
+                tracker.stop()
+        return minted
+
+    def mint(self, items):
+        """
+        Mints every item not already recorded as minted in the checkpoint.
+        Items are URIs, (uri, taxon) tuples or dicts with uri / taxon /
+        flags / transfer_fee, e.g. from read_manifest(). Returns
+        (minted, failed) for this run.
+        """
+        done = set()
+        in_doubt = {}
+        for uri, entries in load_checkpoint(self.checkpoint_path).items():
+            if any(entry.get("result") == "tesSUCCESS" for entry in entries):
+                done.add(uri)
+            elif unresolved_submissions(entries):
+                in_doubt[uri] = unresolved_submissions(entries)
+        if done:
+            print(f"Resuming: {len(done)} already minted")
+
+        self.minted = self.failed = 0
+        self._started = time.perf_counter()
+        if self.checkpoint_path:
+            self._checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+        try:
+            if in_doubt:
+                done |= self._reconcile(in_doubt)
+
+            def todo():
+                for item in items:
+                    uri = self._item(item)["uri"]
+                    if uri not in done:
+                        done.add(uri)
+                        yield item
+
+            if self.ticket_pool is not None:
+                self._mint_with_tickets(todo())
+            else:
+                self._mint_with_sequence(todo())
+        finally:
+            if self._checkpoint is not None:
+                self._checkpoint.close()
+                self._checkpoint = None
+        print(f"Done: {self.minted} minted, {self.failed} failed in {time.perf_counter() - self._started:.1f}s")
+        return self.minted, self.failed
+
+    def _mint_with_sequence(self, todo):
+        submitter = PipelinedSubmitter(
+            self.client, self.wallet, window=self.window, max_attempts=self.max_attempts, tracker=self.tracker
+        )
+        # Read the manifest a few windows at a time instead of all at once.
+        while True:
+            chunk = list(itertools.islice(todo, self.window * 5))
+            if not chunk:
+                return
+            transactions = [self._transaction(item) for item in chunk]
+            submitter.submit_many(
+                transactions,
+                on_result=lambda i, record: self._finish(chunk[i], record),
+                on_signed=lambda i, record: self._signed(chunk[i], record),
+            )
+
+    def _mint_with_tickets(self, todo):
+        from xrpl_base import XrplTransactionClient
+
+        tx_client = XrplTransactionClient(self.client, self.wallet, tracker=self.tracker,
+                                          ticket_pool=self.ticket_pool, autofill=self.autofill)
+        in_flight = threading.BoundedSemaphore(self.workers)
+
+        def mint_one(item):
+            try:
+                record = {}
+                for _ in range(self.max_attempts):
+                    signed = {}
+
+                    def on_signed(transaction):
+                        signed.update(hash=transaction.get_hash(), ticket=transaction.ticket_sequence,
+                                      last_ledger=transaction.last_ledger_sequence)
+                        self._signed(item, signed)
+
+                    try:
+                        record = tx_client.submit_tracked(self._transaction(item), on_signed=on_signed).result()
+                    except Exception as e:
+                        if not signed:
+                            record = {"result": type(e).__name__}
+                            continue
+                        # The submit may have reached the network anyway; signing a
+                        # new mint before this one expires could mint the item twice.
+                        record = tx_client.tracker.track(signed["hash"], signed["last_ledger"]).result()
+                    # Validated results (tes or tec) are final; others may be retried.
+                    if record["validated"] or record["result"].startswith("tem"):
+                        break
+                self._finish(item, record)
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for item in todo:
+                in_flight.acquire()
+                executor.submit(mint_one, item)
+
+if __name__ == "__main__":
+    import sys
+
+    from xrpl_base import PooledJsonRpcClient
+    from xrpl_tickets import TicketPool
+
+    load_dotenv()
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    MINTER_WALLET_SEED = os.getenv("SEED_PHRASE_1")
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    manifest = args[0]
+    checkpoint = args[1] if len(args) > 1 else manifest + ".checkpoint.ndjson"
+
+    client = PooledJsonRpcClient(RPC_URL)
+    wallet = Wallet.from_seed(MINTER_WALLET_SEED)
+    pool = TicketPool(client, wallet, target=200) if "--tickets" in sys.argv else None
+
+    minter = BulkMinter(client, wallet, checkpoint_path=checkpoint, ticket_pool=pool)
+    minter.mint(read_manifest(manifest))
+    print(f"NFTokenIDs are in {checkpoint}")
@@ -0,0 +1,193 @@
+"""
+Ledger-aware response cache for the read-only XRPL query clients.
+
+Entries are keyed by the request's method + params (which include the
+ledger it asks about), and kept under one of two policies:
+
+  - pinned:   the request names a specific ledger (integer ledger_index or
+              ledger_hash) and the answer is validated. It can never
+              change, so it is cached until evicted, and optionally also
+              persisted to a SQLite file so it survives restarts.
+  - floating: "current" / "validated" / "closed" or no ledger at all. The
+              answer is only good until the next ledger closes, so it is
+              dropped when the cache learns about a newer ledger, or after
+              `ttl` seconds (one ledger interval) if nobody tells it.
+
+Usage:
+
+    cache = LedgerCache(max_entries=50_000, disk_path="xrpl_cache.db")
+    query_client = XrplQueryClient(url, cache=cache)
+    ...
+    cache.on_ledger_closed(ledger_index)   # optional, e.g. from a ledger stream
+
+Anything with the same get(request) / put(request, result) methods can be
+plugged into the clients instead.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Methods whose answers depend only on their params and the ledger they are
+# read from. path_find is stateful and submit/sign methods are not reads.
+CACHEABLE_METHODS = {
+    "account_channels", "account_currencies", "account_info", "account_lines",
+    "account_nfts", "account_objects", "account_offers", "account_tx",
+    "book_offers", "gateway_balances", "ledger", "ledger_closed",
+    "ledger_current", "ledger_data", "ledger_entry", "manifest",
+    "nft_buy_offers", "nft_info", "nft_sell_offers", "nfts_by_issuer",
+    "ripple_path_find", "server_info", "server_state", "tx",
+}
+
+# Ledger shortcuts that point at a different ledger after every close.
+FLOATING_LEDGERS = {"current", "validated", "closed"}
+
+# Mainnet / testnet close roughly every 3-4 seconds.
+LEDGER_INTERVAL = 4.0
+
+
+def request_key(request) -> str:
+    """Canonical cache key for a request model: its params as sorted JSON."""
+    return json.dumps(request.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+
+
+def is_pinned(request) -> bool:
+    """True if the request names one specific ledger."""
+    params = request.to_dict()
+    if params.get("ledger_hash"):
+        return True
+    ledger_index = params.get("ledger_index")
+    return ledger_index is not None and ledger_index not in FLOATING_LEDGERS
+
+
+class LedgerCache:
+    """
+    Thread-safe in-memory LRU cache bounded by entry count and by the
+    approximate size of the cached JSON, with an optional on-disk tier for
+    pinned (immutable) entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = LEDGER_INTERVAL,
+        disk_path: str = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # Latest closed ledger we know of. Floating entries stored under an
+        # older ledger are stale.
+        self.ledger_index = None
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # key -> (result, ledger_index, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS xrpl_cache (key TEXT PRIMARY KEY, result TEXT NOT NULL);"
+            )
+            self._disk.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, request):
+        """Returns the cached result for `request`, or None on a miss."""
+        if request.method not in CACHEABLE_METHODS:
+            return None
+        key = request_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, ledger_index, expires_at, _ = entry
+                if expires_at is None or self._is_fresh(ledger_index, expires_at):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                self._evict(key)
+
+            if self._disk is not None and is_pinned(request):
+                row = self._disk.execute(
+                    "SELECT result FROM xrpl_cache WHERE key = ?;", (key,)
+                ).fetchone()
+                if row:
+                    result = json.loads(row[0])
+                    self._store(key, result, None, None, len(row[0]))
+                    self.hits += 1
+                    return result
+
+            self.misses += 1
+            return None
+
+    def put(self, request, result):
+        """Caches a successful `result` for `request` under the right policy."""
+        if request.method not in CACHEABLE_METHODS or "error" in result:
+            return
+        key = request_key(request)
+        payload = json.dumps(result, separators=(",", ":"))
+        pinned = is_pinned(request) and result.get("validated", False)
+
+        with self._lock:
+            if pinned:
+                self._store(key, result, None, None, len(payload))
+                if self._disk is not None:
+                    self._disk.execute(
+                        "INSERT OR REPLACE INTO xrpl_cache (key, result) VALUES (?, ?);",
+                        (key, payload),
+                    )
+                    self._disk.commit()
+                return
+
+            # A validated answer tells us which ledger closed last.
+            if result.get("validated") and isinstance(result.get("ledger_index"), int):
+                self._advance(result["ledger_index"])
+            self._store(key, result, self.ledger_index, time.monotonic() + self.ttl, len(payload))
+
+    def on_ledger_closed(self, ledger_index: int):
+        """Expires every floating entry; call this on each ledger close."""
+        with self._lock:
+            self._advance(ledger_index)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM xrpl_cache;")
+                self._disk.commit()
+
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+
+    # --- internals (call with the lock held) ------------------------------
+
+    def _is_fresh(self, ledger_index, expires_at):
+        return time.monotonic() < expires_at and ledger_index == self.ledger_index
+
+    def _advance(self, ledger_index):
+        if self.ledger_index is None or ledger_index > self.ledger_index:
+            self.ledger_index = ledger_index
+
+    def _store(self, key, result, ledger_index, expires_at, size):
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (result, ledger_index, expires_at, size)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key):
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,247 @@
+"""
+Per-method instrumentation for the XRPL clients.
+
+Every RPC that goes over the wire through PooledJsonRpcClient or
+AsyncXrplQueryClient is recorded in a MetricsRegistry: call count,
+latency histogram, bytes sent and received, and error codes, per method.
+XrplTransactionClient also records how long each transaction took from
+submission to validation and its engine result.
+
+All clients report to `default_registry` unless given another one (or
+metrics=None to switch it off). Sinks:
+
+    default_registry.snapshot()                  # in-process, a plain dict
+    prometheus_text()                            # Prometheus text format
+                                                 # (served by the Django app at /metrics/)
+    default_registry.add_sink(LogSink())         # one JSON log line per call
+
+Cached and coalesced answers never reach the network and are not counted,
+so the numbers describe the load actually put on rippled.
+"""
+
+import json
+import logging
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Ledgers close every 3-5 seconds, so submit-to-validation times cluster there.
+VALIDATION_BUCKETS = (2.0, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0, 15.0, 20.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts[i] holds values in (buckets[i-1], buckets[i]]."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float):
+        """Upper bound of the bucket holding the q-th quantile (None if empty)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.errors = Counter()
+        self.latency = Histogram(LATENCY_BUCKETS)
+
+
+class TransactionStats:
+    def __init__(self):
+        self.results = Counter()
+        self.validation = Histogram(VALIDATION_BUCKETS)
+
+
+class MetricsRegistry:
+    """Thread-safe store of call and transaction metrics, plus event sinks."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.methods = {}
+        self.transactions = {}
+        self._sinks = []
+
+    def add_sink(self, sink):
+        """sink(event: dict) is called for every recorded call and transaction."""
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink):
+        self._sinks.remove(sink)
+
+    def _emit(self, event):
+        for sink in self._sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                print(f"Metrics sink failed: {e}")
+
+    def record_call(self, method: str, seconds: float, bytes_out: int = 0, bytes_in: int = 0, error=None):
+        with self._lock:
+            stats = self.methods.get(method)
+            if stats is None:
+                stats = self.methods[method] = MethodStats()
+            stats.calls += 1
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+            stats.latency.observe(seconds)
+            if error is not None:
+                stats.errors[str(error)] += 1
+        if self._sinks:
+            self._emit({
+                "event": "xrpl_call", "method": method, "seconds": round(seconds, 6),
+                "bytes_out": bytes_out, "bytes_in": bytes_in, "error": error,
+            })
+
+    def record_transaction(self, transaction_type: str, seconds: float, result: str):
+        """`seconds` from submission to validation; `result` the engine result."""
+        with self._lock:
+            stats = self.transactions.get(transaction_type)
+            if stats is None:
+                stats = self.transactions[transaction_type] = TransactionStats()
+            stats.results[result] += 1
+            stats.validation.observe(seconds)
+        if self._sinks:
+            self._emit({
+                "event": "xrpl_transaction", "transaction_type": transaction_type,
+                "seconds": round(seconds, 3), "result": result,
+            })
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "methods": {
+                    method: {
+                        "calls": stats.calls,
+                        "bytes_out": stats.bytes_out,
+                        "bytes_in": stats.bytes_in,
+                        "errors": dict(stats.errors),
+                        "latency": stats.latency.to_dict(),
+                    }
+                    for method, stats in self.methods.items()
+                },
+                "transactions": {
+                    transaction_type: {
+                        "results": dict(stats.results),
+                        "validation": stats.validation.to_dict(),
+                    }
+                    for transaction_type, stats in self.transactions.items()
+                },
+            }
+
+    def reset(self):
+        with self._lock:
+            self.methods.clear()
+            self.transactions.clear()
+
+
+default_registry = MetricsRegistry()
+
+
+def reply_error(reply):
+    """The error code in a raw JSON-RPC reply, or None (also for batch replies)."""
+    if isinstance(reply, dict):
+        result = reply.get("result", reply)
+        if isinstance(result, dict):
+            return result.get("error")
+    return None
+
+
+class LogSink:
+    """Writes every event as one JSON line to the `xrpl.metrics` logger."""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("xrpl.metrics")
+        self.level = level
+
+    def __call__(self, event):
+        self.logger.log(self.level, json.dumps(event, default=str))
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name, labels, histogram):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else repr(bound)
+        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def prometheus_text(registry: MetricsRegistry = None) -> str:
+    """Renders the registry in the Prometheus text exposition format."""
+    registry = registry or default_registry
+    out = []
+    with registry._lock:
+        methods = sorted(registry.methods.items())
+        transactions = sorted(registry.transactions.items())
+
+        out += ["# HELP xrpl_rpc_calls_total RPC calls sent to rippled.", "# TYPE xrpl_rpc_calls_total counter"]
+        out += [f'xrpl_rpc_calls_total{{method="{_label(m)}"}} {s.calls}' for m, s in methods]
+
+        out += ["# HELP xrpl_rpc_errors_total RPC replies carrying an error, by error code.",
+                "# TYPE xrpl_rpc_errors_total counter"]
+        for m, s in methods:
+            out += [f'xrpl_rpc_errors_total{{method="{_label(m)}",error="{_label(e)}"}} {n}'
+                    for e, n in sorted(s.errors.items())]
+
+        out += ["# HELP xrpl_rpc_request_bytes_total Bytes of JSON-RPC request bodies sent.",
+                "# TYPE xrpl_rpc_request_bytes_total counter"]
+        out += [f'xrpl_rpc_request_bytes_total{{method="{_label(m)}"}} {s.bytes_out}' for m, s in methods]
+
+        out += ["# HELP xrpl_rpc_response_bytes_total Bytes of JSON-RPC response bodies received.",
+                "# TYPE xrpl_rpc_response_bytes_total counter"]
+        out += [f'xrpl_rpc_response_bytes_total{{method="{_label(m)}"}} {s.bytes_in}' for m, s in methods]
+
+        out += ["# HELP xrpl_rpc_latency_seconds Round-trip time of RPC calls.",
+                "# TYPE xrpl_rpc_latency_seconds histogram"]
+        for m, s in methods:
+            out += _histogram_lines("xrpl_rpc_latency_seconds", f'method="{_label(m)}"', s.latency)
+
+        out += ["# HELP xrpl_tx_results_total Submitted transactions by final engine result.",
+                "# TYPE xrpl_tx_results_total counter"]
+        for t, s in transactions:
+            out += [f'xrpl_tx_results_total{{type="{_label(t)}",result="{_label(r)}"}} {n}'
+                    for r, n in sorted(s.results.items())]
+
+        out += ["# HELP xrpl_tx_validation_seconds Time from submission to validation.",
+                "# TYPE xrpl_tx_validation_seconds histogram"]
+        for t, s in transactions:
+            out += _histogram_lines("xrpl_tx_validation_seconds", f'type="{_label(t)}"', s.validation)
+    return "\n".join(out) + "\n"
@@ -0,0 +1,366 @@
+"""
+Locally maintained order book for one currency pair.
+
+OrderBook loads the full book once and then keeps it current by applying
+the Offer entries created, modified and deleted in every validated
+transaction that touches the book. Quotes are answered from memory:
+
+    book = OrderBook(XRP(), IssuedCurrency(currency="USD", issuer=ISSUER))
+    await book.run(WS_URL)          # subscribe with a snapshot, apply deltas
+
+    book.best_bid(), book.best_ask()
+    book.asks.depth(0.55)           # base amount offered at 0.55 or better
+    book.asks.vwap(1_000)           # average price to buy 1,000 base
+
+Prices are always quote per one unit of base; amounts are in base units
+(XRP, not drops). Asks are offers selling base for quote, bids are offers
+buying base with quote. Offers are taken at face value: an offer whose
+owner no longer holds enough funds stays in the book until the ledger
+removes it.
+
+Without a WebSocket connection the book can also be loaded with
+load(query_client) and fed stream messages through handle_message().
+
+The server returns one page of each side (book_offers `limit`, at most 400;
+about 300 in a subscribe snapshot). When a side comes back full, the offers
+past its worst loaded price are unknown, so that side is marked
+`truncated` and only answers within the loaded range: depth() and vwap()
+return None for anything deeper, and offers that later arrive beyond it
+are kept but not counted.
+"""
+
+import asyncio
+import itertools
+import os
+from bisect import bisect_left, bisect_right, insort
+
+from dotenv import load_dotenv
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.models.currencies import XRP, IssuedCurrency
+from xrpl.models.requests import Subscribe
+from xrpl.models.requests.subscribe import SubscribeBook
+
+from xrpl_account_monitor import affected_entries
+
+# Subscribing to a book needs a "taker" account; the price view does not
+# depend on it, so the neutral ACCOUNT_ONE address is used.
+DEFAULT_TAKER = "rrrrrrrrrrrrrrrrrrrrBZbvji"
+
+# Offers per side in a subscribe snapshot (rippled's default book page);
+# a side that fills it is assumed to have been cut off.
+SNAPSHOT_LIMIT = 300
+
+
+def _issue(currency):
+    """XRP() / IssuedCurrency / dict / amount -> ("XRP", None) or (code, issuer)."""
+    if isinstance(currency, str):
+        return ("XRP", None)  # an XRP amount in drops
+    if not isinstance(currency, dict):
+        currency = currency.to_dict()
+    if currency.get("currency", "XRP") == "XRP" and "issuer" not in currency:
+        return ("XRP", None)
+    return (currency["currency"], currency["issuer"])
+
+
+def _value(amount) -> float:
+    if isinstance(amount, str):
+        return int(amount) / 1_000_000
+    return float(amount["value"])
+
+
+class BookSide:
+    """
+    One side of the book, kept sorted best price first.
+
+    Offers at the same price keep their arrival order, as on the ledger;
+    a partially filled offer keeps its place in the queue.
+
+    `horizon` is None when the side was loaded in full. Otherwise it is
+    the worst price loaded: the side is only known to be complete for
+    prices strictly better than that, and quotes stop there.
+    """
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._keys = []     # sorted (sort_price, arrival) tuples
+        self._offers = {}   # ledger index -> (key, price, base_amount)
+        self._arrival = itertools.count()
+        self.horizon = None
+        self._dirty = True
+        self._prices = []
+        self._sort_prices = []
+        self._cum_base = []
+        self._cum_quote = []
+
+    def __len__(self):
+        return len(self._offers)
+
+    def __contains__(self, index):
+        return index in self._offers
+
+    @property
+    def truncated(self) -> bool:
+        return self.horizon is not None
+
+    def clear(self):
+        self._keys.clear()
+        self._offers.clear()
+        self.horizon = None
+        self._dirty = True
+
+    def _sort_price(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def _known(self, sort_price: float) -> bool:
+        return self.horizon is None or sort_price < self._sort_price(self.horizon)
+
+    def mark_truncated(self):
+        """Stops quotes at the worst price currently loaded (the server cut the side off there)."""
+        if self._keys:
+            worst = self._keys[-1][0]
+            self.horizon = -worst if self.descending else worst
+        self._dirty = True
+
+    def upsert(self, index, price: float, base_amount: float):
+        old = self._offers.get(index)
+        if old is not None:
+            if old[1] == price:
+                self._offers[index] = (old[0], price, base_amount)
+                self._dirty = True
+                return
+            self.remove(index)
+        key = (self._sort_price(price), next(self._arrival))
+        insort(self._keys, key)
+        self._offers[index] = (key, price, base_amount)
+        self._dirty = True
+
+    def remove(self, index):
+        old = self._offers.pop(index, None)
+        if old is None:
+            return False
+        del self._keys[bisect_left(self._keys, old[0])]
+        self._dirty = True
+        return True
+
+    def _rebuild(self):
+        # Cumulative sums are rebuilt at most once per change, on the first
+        # query after it, so every query is a bisect.
+        by_key = {key: (price, amount) for key, price, amount in self._offers.values()}
+        self._prices, self._sort_prices, self._cum_base, self._cum_quote = [], [], [], []
+        base = quote = 0.0
+        for key in self._keys:
+            if not self._known(key[0]):
+                break
+            price, amount = by_key[key]
+            base += amount
+            quote += amount * price
+            self._prices.append(price)
+            self._sort_prices.append(key[0])
+            self._cum_base.append(base)
+            self._cum_quote.append(quote)
+        self._dirty = False
+
+    def levels(self, count: int = None):
+        """[(price, base_amount), ...] aggregated per price, best first."""
+        if self._dirty:
+            self._rebuild()
+        levels = []
+        previous = 0.0
+        for i, price in enumerate(self._prices):
+            amount = self._cum_base[i] - previous
+            previous = self._cum_base[i]
+            if levels and levels[-1][0] == price:
+                levels[-1] = (price, levels[-1][1] + amount)
+            else:
+                if count is not None and len(levels) == count:
+                    break
+                levels.append((price, amount))
+        return levels
+
+    def best(self):
+        """(price, base_amount at that price) or None for an empty side."""
+        levels = self.levels(1)
+        return levels[0] if levels else None
+
+    def depth(self, price: float):
+        """Total base amount offered at `price` or better; None if that is past a truncated side's range."""
+        if self._dirty:
+            self._rebuild()
+        if not self._known(self._sort_price(price)):
+            return None
+        end = bisect_right(self._sort_prices, self._sort_price(price))
+        return self._cum_base[end - 1] if end else 0.0
+
+    def vwap(self, size: float):
+        """Average price to fill `size` base units, or None if the side is too thin (or not loaded that deep)."""
+        if self._dirty:
+            self._rebuild()
+        if size <= 0 or not self._cum_base or self._cum_base[-1] < size:
+            return None
+        i = bisect_left(self._cum_base, size)
+        filled_base = self._cum_base[i - 1] if i else 0.0
+        filled_quote = self._cum_quote[i - 1] if i else 0.0
+        return (filled_quote + (size - filled_base) * self._prices[i]) / size
+
+
+class OrderBook:
+    """
+    The book of `base` against `quote` (xrpl currency models), kept current
+    from validated transactions.
+    """
+
+    def __init__(self, base, quote):
+        self.base = base
+        self.quote = quote
+        self._base = _issue(base)
+        self._quote = _issue(quote)
+        self.asks = BookSide(descending=False)
+        self.bids = BookSide(descending=True)
+        self.ledger_index = None
+        self._listeners = []
+
+    def __repr__(self):
+        return f"OrderBook({self._base[0]}/{self._quote[0]}, bid={self.best_bid()}, ask={self.best_ask()})"
+
+    def add_listener(self, callback):
+        """callback(book) after every validated transaction that changed the book."""
+        self._listeners.append(callback)
+
+    # --- loading -----------------------------------------------------------
+
+    @property
+    def truncated(self) -> bool:
+        return self.asks.truncated or self.bids.truncated
+
+    def load_offers(self, asks=(), bids=(), asks_truncated: bool = False, bids_truncated: bool = False):
+        """
+        Replaces the book with ledger Offer objects (book_offers / subscribe
+        snapshot). Pass *_truncated when the server had more than it sent.
+        """
+        self.asks.clear()
+        self.bids.clear()
+        for offer in asks:
+            self.apply_offer(offer)
+        for offer in bids:
+            self.apply_offer(offer)
+        if asks_truncated:
+            self.asks.mark_truncated()
+        if bids_truncated:
+            self.bids.mark_truncated()
+
+    def load(self, query_client, limit: int = 400):
+        """Loads one page of each side from a validated ledger with an XrplQueryClient."""
+        asks = query_client.book_offers(self.base, self.quote, limit=limit, ledger_index="validated")
+        bids = query_client.book_offers(self.quote, self.base, limit=limit, ledger_index=asks["ledger_index"])
+        self.ledger_index = asks["ledger_index"]
+        ask_offers, bid_offers = asks.get("offers", []), bids.get("offers", [])
+        self.load_offers(
+            ask_offers, bid_offers,
+            asks_truncated="marker" in asks or len(ask_offers) >= limit,
+            bids_truncated="marker" in bids or len(bid_offers) >= limit,
+        )
+
+    # --- deltas ------------------------------------------------------------
+
+    def apply_offer(self, offer):
+        """Adds or updates one Offer (ledger entry fields); returns True if it is in this book."""
+        gets, pays = _issue(offer["TakerGets"]), _issue(offer["TakerPays"])
+        gets_value, pays_value = _value(offer["TakerGets"]), _value(offer["TakerPays"])
+        index = offer["index"]
+        if gets == self._base and pays == self._quote:
+            side, base_amount, price = self.asks, gets_value, (pays_value / gets_value if gets_value else 0.0)
+        elif gets == self._quote and pays == self._base:
+            side, base_amount, price = self.bids, pays_value, (gets_value / pays_value if pays_value else 0.0)
+        else:
+            return False
+        if base_amount <= 0:
+            side.remove(index)
+        else:
+            side.upsert(index, price, base_amount)
+        return True
+
+    def remove_offer(self, index):
+        return self.asks.remove(index) or self.bids.remove(index)
+
+    def apply_transaction(self, message):
+        """Applies the Offer changes in a validated transaction's metadata."""
+        changed = False
+        for change, fields, _ in affected_entries(message.get("meta", {}), "Offer"):
+            if change == "deleted":
+                changed |= self.remove_offer(fields["index"])
+            elif "TakerGets" in fields and "TakerPays" in fields:
+                changed |= self.apply_offer(fields)
+        if message.get("ledger_index") is not None:
+            self.ledger_index = message["ledger_index"]
+        if changed:
+            for callback in self._listeners:
+                callback(self)
+        return changed
+
+    def handle_message(self, message):
+        if message.get("type") == "transaction" and message.get("validated"):
+            return self.apply_transaction(message)
+        return False
+
+    # --- quotes ------------------------------------------------------------
+
+    def best_bid(self):
+        best = self.bids.best()
+        return best[0] if best else None
+
+    def best_ask(self):
+        best = self.asks.best()
+        return best[0] if best else None
+
+    def spread(self):
+        bid, ask = self.best_bid(), self.best_ask()
+        return None if bid is None or ask is None else ask - bid
+
+    def mid(self):
+        bid, ask = self.best_bid(), self.best_ask()
+        return None if bid is None or ask is None else (bid + ask) / 2
+
+    # --- streaming ---------------------------------------------------------
+
+    async def run(self, url: str, taker: str = DEFAULT_TAKER, reconnect_delay: float = 5.0):
+        """Subscribes to both sides of the book and applies deltas forever."""
+        book = SubscribeBook(taker_gets=self.base, taker_pays=self.quote, taker=taker, snapshot=True, both=True)
+        while True:
+            try:
+                async with AsyncWebsocketClient(url) as client:
+                    # The snapshot and the stream start together, so no
+                    # transaction falls between loading and applying deltas.
+                    response = await client.request(Subscribe(books=[book]))
+                    if not response.is_successful():
+                        raise RuntimeError(response.result)
+                    asks, bids = response.result.get("asks", []), response.result.get("bids", [])
+                    self.load_offers(
+                        asks, bids,
+                        asks_truncated=len(asks) >= SNAPSHOT_LIMIT,
+                        bids_truncated=len(bids) >= SNAPSHOT_LIMIT,
+                    )
+                    async for message in client:
+                        self.handle_message(message)
+            except Exception as e:
+                print(f"Order book connection lost: {e}")
+            await asyncio.sleep(reconnect_delay)
+
+
+def print_quote(book):
+    print(f"[{book.ledger_index}] bid {book.best_bid()}  ask {book.best_ask()}  "
+          f"asks {len(book.asks)}  bids {len(book.bids)}{'  (truncated)' if book.truncated else ''}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    WS_URL = os.getenv("XRPL_WS_URL", "wss://s.altnet.rippletest.net:51233")
+    ISSUER = os.getenv("BOOK_ISSUER", "rhub8VRN55s94qWKDv6jmDy1pUykJzF3wq")
+    CURRENCY = os.getenv("BOOK_CURRENCY", "USD")
+
+    order_book = OrderBook(XRP(), IssuedCurrency(currency=CURRENCY, issuer=ISSUER))
+    order_book.add_listener(print_quote)
+    try:
+        asyncio.run(order_book.run(WS_URL))
+    except KeyboardInterrupt:
+        pass
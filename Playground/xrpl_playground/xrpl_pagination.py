@@ -0,0 +1,125 @@
+"""
+Marker-based pagination for XRPL methods that return results in pages
+(ledger_data, account_lines, account_objects, account_offers, account_nfts,
+book_offers).
+
+The iterators yield one item at a time, keep at most two pages in memory
+(the one being consumed and the next one, which is fetched in the
+background while the caller works through the current one), and can be
+resumed from a saved position:
+
+    lines = query_client.iter_account_lines(issuer)
+    for line in lines:
+        ...
+        checkpoint = (lines.ledger_index, lines.marker)
+
+    # later, picks up at the start of the page that was being consumed
+    lines = query_client.iter_account_lines(issuer, ledger_index=checkpoint[0], marker=checkpoint[1])
+"""
+
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+
+
+class MarkerIterator:
+    """
+    Streams every item of a paginated request.
+
+    fetch: callable(request) -> result dict (the query client's _request)
+    request: the first request; its `marker` / `ledger_index` are the start
+    field: the key holding the items in each result ("lines", "state", ...)
+
+    After the first page, every following page is pinned to the ledger the
+    first page was read from, because markers are only valid in that ledger.
+    `marker` and `ledger_index` always describe where to resume from: the
+    start of the page the last yielded item came from.
+    """
+
+    def __init__(self, fetch, request, field: str):
+        self.fetch = fetch
+        self.request = request
+        self.field = field
+        self.marker = request.marker
+        self.ledger_index = request.ledger_index
+        self.ledger_hash = None
+        self.pages = 0
+
+    def _page_request(self, marker):
+        return dataclasses.replace(self.request, marker=marker, ledger_index=self.ledger_index)
+
+    def _fetch_page(self, marker):
+        result = self.fetch(self._page_request(marker))
+        if "error" in result:
+            raise XRPLRequestFailureException(result)
+        return result
+
+    def _pin(self, result):
+        # Answers read from a closed ledger say which one; pin to it.
+        if result.get("ledger_index") is not None:
+            self.ledger_index = int(result["ledger_index"])
+            self.ledger_hash = result.get("ledger_hash")
+
+    def __iter__(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            marker = self.marker
+            result = self._fetch_page(marker)
+            self._pin(result)
+            while True:
+                next_marker = result.get("marker")
+                prefetch = None
+                if next_marker is not None:
+                    prefetch = executor.submit(self._fetch_page, next_marker)
+
+                self.marker = marker
+                self.pages += 1
+                yield from result.get(self.field, [])
+
+                if prefetch is None:
+                    return
+                marker, result = next_marker, prefetch.result()
+
+
+class AsyncMarkerIterator(MarkerIterator):
+    """
+    Async variant: `fetch` is a coroutine function (the async client's
+    _request) and the next page is fetched by a background task.
+
+        async for line in query_client.iter_account_lines(issuer):
+            ...
+    """
+
+    async def _fetch_page(self, marker):
+        result = await self.fetch(self._page_request(marker))
+        if "error" in result:
+            raise XRPLRequestFailureException(result)
+        return result
+
+    def __iter__(self):
+        raise TypeError("AsyncMarkerIterator must be used with 'async for'")
+
+    async def __aiter__(self):
+        marker = self.marker
+        result = await self._fetch_page(marker)
+        self._pin(result)
+        while True:
+            next_marker = result.get("marker")
+            prefetch = None
+            if next_marker is not None:
+                prefetch = asyncio.create_task(self._fetch_page(next_marker))
+
+            self.marker = marker
+            self.pages += 1
+            try:
+                for item in result.get(self.field, []):
+                    yield item
+            except GeneratorExit:
+                if prefetch is not None:
+                    prefetch.cancel()
+                raise
+
+            if prefetch is None:
+                return
+            marker, result = next_marker, await prefetch
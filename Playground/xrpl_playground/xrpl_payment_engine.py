@@ -0,0 +1,286 @@
+"""
+Pipelined transaction submission from one account.
+
+submit_and_wait autofills, submits and then blocks until the transaction
+is validated, so one wallet manages about one transaction per ledger close.
+PipelinedSubmitter instead:
+
+  1. reads the account's Sequence and the open-ledger fee once,
+  2. signs a whole window of transactions ahead of time, numbering their
+     Sequence locally and giving them all the same LastLedgerSequence,
+  3. submits the signed blobs back-to-back (as JSON-RPC batches when the
+     client supports them) without waiting for any of them,
+  4. hands every hash to a ValidationTracker (xrpl_validation_tracker.py),
+     which resolves them all as the validated ledgers close.
+
+When a submission is rejected outright (tef/tel/tem), its Sequence becomes
+a gap that would stall everything signed after it, so the gap is filled
+with a no-op AccountSet and the rejected transaction is queued again with
+a fresh Sequence. Anything not validated by its LastLedgerSequence can no
+longer be applied, so it is retried too, after re-reading the Sequence.
+
+Usage:
+
+    engine = PaymentEngine(PooledJsonRpcClient(RPC_URL), wallet)
+    results = engine.send_payments([
+        (destination, 12.5),                 # (destination, amount_xrp)
+        (destination, 3, destination_tag),   # optional destination tag
+    ])
+    # one dict per payment, in order: hash, sequence, result, ledger_index, ...
+"""
+
+import dataclasses
+import os
+import time
+from collections import deque
+from concurrent.futures import wait
+
+from dotenv import load_dotenv
+from xrpl.models import requests
+from xrpl.models.transactions import AccountSet, Payment
+from xrpl.transaction import sign
+from xrpl.utils import xrp_to_drops
+from xrpl.wallet import Wallet
+
+from xrpl_validation_tracker import PENDING_PREFIXES, ValidationTracker
+
+# Rejections that no retry can fix.
+FINAL_PREFIXES = ("tem",)
+
+
+class PipelinedSubmitter:
+    """
+    Signs and submits many transactions from `wallet` without waiting for
+    each one to validate.
+
+    client:             a JsonRpcClient; xrpl_base.PooledJsonRpcClient (or
+                        xrpl_router.EndpointPool) also gets batched submits
+    window:             transactions signed and in flight at once
+    last_ledger_offset: ledgers each window has to validate in
+    max_fee_drops:      ceiling for the open-ledger fee paid per transaction
+    max_attempts:       submissions per transaction before giving up
+    tracker:            a shared ValidationTracker; by default the submitter
+                        runs its own for the duration of submit_many
+    """
+
+    def __init__(
+        self,
+        client,
+        wallet: Wallet,
+        window: int = 200,
+        last_ledger_offset: int = 20,
+        max_fee_drops: int = 5000,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        tracker: ValidationTracker = None,
+    ):
+        self.client = client
+        self.wallet = wallet
+        self.account = wallet.classic_address
+        self.window = window
+        self.last_ledger_offset = last_ledger_offset
+        self.max_fee_drops = max_fee_drops
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.tracker = tracker
+        self.sequence = None
+        self.fee = None
+        self.validated_ledger = None
+
+    # --- ledger state -------------------------------------------------------
+
+    def _result(self, request):
+        response = self.client.request(request)
+        if not response.is_successful():
+            raise RuntimeError(f"{request.method} failed: {response.result}")
+        return response.result
+
+    def sync(self):
+        """Re-reads the next Sequence, the open-ledger fee and the validated ledger."""
+        info = self._result(requests.AccountInfo(account=self.account, ledger_index="current"))
+        self.sequence = info["account_data"]["Sequence"]
+        drops = self._result(requests.Fee())["drops"]
+        fee = max(int(drops["base_fee"]), int(drops["open_ledger_fee"]))
+        self.fee = str(min(fee, self.max_fee_drops))
+        self.validated_ledger = self._validated_ledger_index()
+
+    def _validated_ledger_index(self):
+        return int(self._result(requests.Ledger(ledger_index="validated"))["ledger_index"])
+
+    # --- signing and submission ---------------------------------------------
+
+    def _sign(self, transaction, sequence, last_ledger):
+        transaction = dataclasses.replace(
+            transaction, sequence=sequence, fee=self.fee, last_ledger_sequence=last_ledger
+        )
+        signed = sign(transaction, self.wallet)
+        return signed.get_hash(), signed.blob()
+
+    def _submit_blobs(self, blobs):
+        submits = [requests.SubmitOnly(tx_blob=blob) for blob in blobs]
+        if hasattr(self.client, "request_batch"):
+            responses = self.client.request_batch(submits)
+        else:
+            responses = [self.client.request(submit) for submit in submits]
+        return [
+            response.result.get("engine_result") or response.result.get("error") or "unknown"
+            for response in responses
+        ]
+
+    def _fill_gap(self, sequence, last_ledger, tracker):
+        """Submits a no-op AccountSet at `sequence`; returns 1 if it was accepted."""
+        filler_hash, blob = self._sign(AccountSet(account=self.account), sequence, last_ledger)
+        tracker.track(filler_hash, last_ledger)
+        engine_result = self._submit_blobs([blob])[0]
+        if engine_result.startswith(PENDING_PREFIXES):
+            return 1
+        tracker.untrack(filler_hash)
+        return 0
+
+    # --- main loop ----------------------------------------------------------
+
+    def submit_many(self, transactions, on_result=None, on_signed=None):
+        """
+        Submits every transaction (unsigned models; Sequence, Fee and
+        LastLedgerSequence are filled in) and returns one result dict per
+        transaction, in order. `on_result(index, record)` is called as each
+        one becomes final; `on_signed(index, record)` after each signing,
+        before the blob is submitted, with its hash, sequence and
+        last_ledger (e.g. to record them somewhere that survives a crash).
+        """
+        transactions = list(transactions)
+        records = [
+            {"index": i, "transaction_type": tx.transaction_type.value, "hash": None, "sequence": None,
+             "last_ledger": None, "result": None, "ledger_index": None, "attempts": 0, "meta": None}
+            for i, tx in enumerate(transactions)
+        ]
+        queue = deque(range(len(transactions)))
+        tracker = self.tracker or ValidationTracker(self.client, poll_interval=self.poll_interval)
+        # Following ledgers from before the first submit means nothing is missed.
+        tracker.start()
+
+        def finish(i, result, meta=None, ledger_index=None):
+            records[i].update(result=result, meta=meta, ledger_index=ledger_index)
+            if on_result is not None:
+                on_result(i, records[i])
+
+        try:
+            self._submit_windows(transactions, records, queue, tracker, finish, on_signed)
+        finally:
+            if tracker is not self.tracker:
+                tracker.stop()
+        return records
+
+    def _submit_windows(self, transactions, records, queue, tracker, finish, on_signed=None):
+        while queue:
+            self.sync()
+            last_ledger = self.validated_ledger + self.last_ledger_offset
+            batch = [queue.popleft() for _ in range(min(self.window, len(queue)))]
+
+            signed = []
+            for i in batch:
+                hash_, blob = self._sign(transactions[i], self.sequence, last_ledger)
+                records[i].update(hash=hash_, sequence=self.sequence, last_ledger=last_ledger)
+                records[i]["attempts"] += 1
+                signed.append((i, blob))
+                self.sequence += 1
+                if on_signed is not None:
+                    on_signed(i, records[i])
+
+            futures = {records[i]["hash"]: tracker.track(records[i]["hash"], last_ledger) for i in batch}
+            engine_results = self._submit_blobs([blob for _, blob in signed])
+
+            pending = {}
+            retry = []
+            gaps = []
+            for (i, _), engine_result in zip(signed, engine_results):
+                if engine_result.startswith(PENDING_PREFIXES):
+                    pending[records[i]["hash"]] = i
+                    continue
+                tracker.untrack(records[i]["hash"])
+                if engine_result.startswith(FINAL_PREFIXES) or records[i]["attempts"] >= self.max_attempts:
+                    finish(i, engine_result)
+                else:
+                    retry.append(i)
+                if engine_result != "tefPAST_SEQ":
+                    gaps.append(records[i]["sequence"])
+
+            # A gap only matters if something signed after it is waiting on it.
+            highest_pending = max((records[i]["sequence"] for i in pending.values()), default=0)
+            fillers = 0
+            for sequence in gaps:
+                if sequence < highest_pending:
+                    fillers += self._fill_gap(sequence, last_ledger, tracker)
+
+            wait(futures[hash_] for hash_ in pending)
+            validated = 0
+            for hash_, i in pending.items():
+                outcome = futures[hash_].result()
+                if outcome["validated"]:
+                    finish(i, outcome["result"], outcome["meta"], outcome["ledger_index"])
+                    validated += 1
+                elif records[i]["attempts"] >= self.max_attempts:
+                    finish(i, "expired")
+                else:
+                    retry.append(i)
+
+            # Retries go first, in their original order.
+            queue.extendleft(sorted(retry, reverse=True))
+            print(f"Window of {len(batch)}: {validated} validated, {len(retry)} to retry, "
+                  f"{fillers} gaps filled, {len(queue)} left")
+
+
+class PaymentEngine(PipelinedSubmitter):
+    """PipelinedSubmitter for XRP payouts."""
+
+    def send_payments(self, payments, on_result=None):
+        """
+        payments: iterable of (destination, amount_xrp) or
+        (destination, amount_xrp, destination_tag). Returns one record per
+        payment, in order, with `destination` and `amount_xrp` added.
+        """
+        payments = [tuple(payment) + (None,) * (3 - len(payment)) for payment in payments]
+        transactions = [
+            Payment(
+                account=self.account,
+                destination=destination,
+                amount=xrp_to_drops(amount_xrp),
+                destination_tag=destination_tag,
+            )
+            for destination, amount_xrp, destination_tag in payments
+        ]
+        records = self.submit_many(transactions, on_result=on_result)
+        for record, (destination, amount_xrp, _) in zip(records, payments):
+            record.update(destination=destination, amount_xrp=amount_xrp)
+        return records
+
+
+if __name__ == "__main__":
+    import csv
+    import sys
+    from decimal import Decimal
+
+    from xrpl_base import PooledJsonRpcClient
+
+    load_dotenv()
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    WALLET_SEED = os.getenv("SEED_PHRASE_1")
+
+    # python xrpl_payment_engine.py payouts.csv   (rows: destination,amount_xrp[,destination_tag])
+    with open(sys.argv[1], newline="") as f:
+        payouts = [
+            (row[0], Decimal(row[1]), int(row[2]) if len(row) > 2 and row[2] else None)
+            for row in csv.reader(f) if row
+        ]
+
+    engine = PaymentEngine(PooledJsonRpcClient(RPC_URL), Wallet.from_seed(WALLET_SEED))
+    started = time.perf_counter()
+    results = engine.send_payments(payouts)
+    elapsed = time.perf_counter() - started
+
+    succeeded = sum(1 for record in results if record["result"] == "tesSUCCESS")
+    print(f"{succeeded}/{len(results)} payments succeeded in {elapsed:.1f}s")
+    for record in results:
+        if record["result"] != "tesSUCCESS":
+            print(f"  {record['destination']} {record['amount_xrp']} XRP: {record['result']}")
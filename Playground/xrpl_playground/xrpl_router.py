@@ -0,0 +1,306 @@
+"""
+Multi-endpoint routing for the XRPL clients.
+
+EndpointPool spreads requests over several rippled nodes:
+
+  - a background health check calls server_info on every node and records
+    its server_state, load_factor, io_latency_ms and complete_ledgers;
+  - each request goes to the fastest healthy node that actually has the
+    ledger the request asks for (by median measured round-trip time,
+    weighted by the node's load_factor);
+  - if that node has not answered by its own p95 latency, a second copy is
+    sent to the next best node and whichever answers first wins (hedging);
+  - a node that errors or reports a missing ledger is skipped and the next
+    one is tried (failover).
+
+EndpointPool is a JsonRpcClient, so it can be used anywhere a single-node
+client is, including XrplQueryClient and submit_and_wait:
+
+    query_client = XrplQueryClient(["https://node-a:51234", "https://node-b:51234"])
+    tx_client = XrplTransactionClient(EndpointPool([...]), wallet)
+
+Run this file to see routing, hedging and failover against local stand-in
+servers with injected delays.
+"""
+
+import asyncio
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.clients import JsonRpcClient
+from xrpl.models import requests
+
+from xrpl_base import PooledJsonRpcClient
+
+# server_state values of a node that is in sync with the network.
+SYNCED_STATES = {"full", "proposing", "validating"}
+
+# Errors that say "this node can't answer", not "the request is wrong".
+RETRYABLE_ERRORS = {"lgrNotFound", "noCurrent", "noNetwork", "notSynced", "tooBusy", "slowDown", "amendmentBlocked"}
+
+# Latency samples kept per node for the p50 / p95 figures.
+LATENCY_WINDOW = 200
+
+
+def parse_complete_ledgers(text: str):
+    """'32570-100,105-200' -> [(32570, 100), (105, 200)]; 'empty' -> []."""
+    ranges = []
+    for span in (text or "").split(","):
+        low, _, high = span.strip().partition("-")
+        if low.isdigit():
+            ranges.append((int(low), int(high or low)))
+    return ranges
+
+
+class Endpoint:
+    """One rippled node and what we currently know about it."""
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.client = PooledJsonRpcClient(url, timeout=timeout)
+        self.healthy = True
+        self.server_state = None
+        self.load_factor = 1.0
+        self.io_latency_ms = 0
+        self.ledger_ranges = []
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.failures = 0
+
+    def __repr__(self):
+        return f"Endpoint({self.url}, healthy={self.healthy}, p50={self.p50()})"
+
+    def record(self, seconds: float):
+        self.latencies.append(seconds)
+
+    def p50(self):
+        return statistics.median(self.latencies) if self.latencies else None
+
+    def p95(self):
+        if len(self.latencies) < 20:
+            return None
+        return statistics.quantiles(self.latencies, n=20)[-1]
+
+    def has_ledger(self, ledger_index) -> bool:
+        if ledger_index is None or not self.ledger_ranges:
+            return True  # "current"/"validated", or not health-checked yet
+        return any(low <= ledger_index <= high for low, high in self.ledger_ranges)
+
+    def score(self) -> float:
+        # Unmeasured nodes score 0 so they get tried and measured.
+        latency = (self.p50() or 0) + self.io_latency_ms / 1000
+        return latency * max(self.load_factor, 1.0)
+
+
+class EndpointPool(JsonRpcClient):
+    """
+    A JsonRpcClient that routes every request over several rippled nodes.
+
+    hedge_delay:     seconds to wait before hedging when a node has too few
+                     samples for a p95 yet
+    max_hedges:      extra copies of a slow request, besides failover retries
+    health_interval: seconds between background server_info checks (None
+                     disables the background thread; call check_health())
+    """
+
+    def __init__(
+        self,
+        urls,
+        timeout: float = 10.0,
+        hedge_delay: float = 0.1,
+        max_hedges: int = 1,
+        health_interval: float = 15.0,
+    ):
+        urls = list(urls)
+        super().__init__(urls[0])
+        self.endpoints = [Endpoint(url, timeout) for url in urls]
+        self.hedge_delay = hedge_delay
+        self.max_hedges = max_hedges
+        self.hedged = 0
+        self.failovers = 0
+        self._executor = ThreadPoolExecutor(max_workers=8 * len(self.endpoints))
+        self._stopped = threading.Event()
+
+        self.check_health()
+        if health_interval:
+            thread = threading.Thread(target=self._health_loop, args=(health_interval,), daemon=True)
+            thread.start()
+
+    # --- health ------------------------------------------------------------
+
+    def check_health(self):
+        """Refreshes every node's status from server_info, in parallel."""
+        list(self._executor.map(self._check_endpoint, self.endpoints))
+
+    def _check_endpoint(self, endpoint):
+        try:
+            started = time.perf_counter()
+            response = endpoint.client.request(requests.ServerInfo())
+            endpoint.record(time.perf_counter() - started)
+            info = response.result["info"]
+        except Exception:
+            endpoint.healthy = False
+            return
+        endpoint.server_state = info.get("server_state")
+        endpoint.load_factor = float(info.get("load_factor", 1))
+        endpoint.io_latency_ms = info.get("io_latency_ms", 0)
+        endpoint.ledger_ranges = parse_complete_ledgers(info.get("complete_ledgers"))
+        endpoint.healthy = endpoint.server_state in SYNCED_STATES
+
+    def _health_loop(self, interval):
+        while not self._stopped.wait(interval):
+            self.check_health()
+
+    def close(self):
+        self._stopped.set()
+        self._executor.shutdown(wait=False)
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+
+    # --- routing -----------------------------------------------------------
+
+    def candidates(self, ledger_index=None):
+        """Nodes able to serve `ledger_index`, best first."""
+        able = [endpoint for endpoint in self.endpoints if endpoint.has_ledger(ledger_index)]
+        healthy = [endpoint for endpoint in able if endpoint.healthy]
+        # With nothing healthy, still try everyone rather than fail outright.
+        return sorted(healthy or able or self.endpoints, key=Endpoint.score)
+
+    def _hedge_after(self, endpoint):
+        return endpoint.p95() or self.hedge_delay
+
+    def _send(self, endpoint, request):
+        started = time.perf_counter()
+        try:
+            response = endpoint.client.request(request)
+        except Exception:
+            endpoint.failures += 1
+            endpoint.healthy = False
+            raise
+        endpoint.record(time.perf_counter() - started)
+        return response
+
+    def request(self, request):
+        ledger_index = request.to_dict().get("ledger_index")
+        if not isinstance(ledger_index, int):
+            ledger_index = None
+        candidates = self.candidates(ledger_index)
+
+        pending = {}
+        launched = 0
+        hedges = 0
+        last_response, errors = None, []
+
+        def launch():
+            nonlocal launched
+            endpoint = candidates[launched]
+            launched += 1
+            pending[self._executor.submit(self._send, endpoint, request)] = endpoint
+
+        launch()
+        while pending:
+            can_hedge = hedges < self.max_hedges and launched < len(candidates)
+            timeout = self._hedge_after(candidates[0]) if can_hedge else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedges += 1
+                self.hedged += 1
+                launch()
+                continue
+
+            for future in done:
+                endpoint = pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    errors.append(f"{endpoint.url}: {e}")
+                    continue
+                if response.result.get("error") in RETRYABLE_ERRORS:
+                    last_response = response
+                    continue
+                return response
+
+            # Everything launched so far failed: fail over to the next node.
+            if not pending and launched < len(candidates):
+                self.failovers += 1
+                launch()
+
+        if last_response is not None:
+            return last_response
+        raise XRPLRequestFailureException({"error": "noEndpoint", "error_message": "; ".join(errors)})
+
+    def request_batch(self, request_list):
+        """Sends the whole batch to the best node, failing over on errors."""
+        request_list = list(request_list)
+        indexes = [request.to_dict().get("ledger_index") for request in request_list]
+        pinned = [index for index in indexes if isinstance(index, int)]
+        errors = []
+        for endpoint in self.candidates(max(pinned) if pinned else None):
+            try:
+                started = time.perf_counter()
+                responses = endpoint.client.request_batch(request_list)
+                endpoint.record(time.perf_counter() - started)
+                return responses
+            except Exception as e:
+                endpoint.healthy = False
+                errors.append(f"{endpoint.url}: {e}")
+        raise XRPLRequestFailureException({"error": "noEndpoint", "error_message": "; ".join(errors)})
+
+    async def _request_impl(self, request, *, timeout=None):
+        # xrpl-py's async helpers (submit_and_wait, autofill) end up here.
+        return await asyncio.to_thread(self.request, request)
+
+
+def _latency_report(label, samples):
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2] * 1000
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1000
+    print(f"{label:<28}p50 {p50:7.1f} ms   p99 {p99:7.1f} ms")
+
+
+if __name__ == "__main__":
+    from xrpl_base import XrplQueryClient
+    from xrpl_stub_server import StubRippled
+
+    # Node A: usually fastest but stalls for 400 ms on 3% of requests.
+    # Node B: steady 40 ms.
+    # Node C: fast, but only has recent history.
+    spiky = lambda: 0.4 if random.random() < 0.03 else 0.005
+    with StubRippled(delay=spiky) as node_a, \
+            StubRippled(delay=0.04) as node_b, \
+            StubRippled(delay=0.002, complete_ledgers="1500-999999") as node_c:
+        account = "rNcmpNiUjUjrWhod2Vr1fgQPtZm9QyPVRV"
+
+        for label, max_hedges in (("A+B, no hedging", 0), ("A+B, hedged at p95", 1)):
+            pool = EndpointPool([node_a.url, node_b.url], max_hedges=max_hedges, health_interval=None)
+            query_client = XrplQueryClient(pool)
+            samples = []
+            for _ in range(300):
+                started = time.perf_counter()
+                query_client.account_info(account)
+                samples.append(time.perf_counter() - started)
+            _latency_report(label, samples)
+            print(f"{'':<28}hedged copies: {pool.hedged}")
+            pool.close()
+
+        pool = EndpointPool([node_a.url, node_b.url, node_c.url], health_interval=None)
+        query_client = XrplQueryClient(pool)
+        print("\nRouting by ledger history:")
+        print(f"  ledger 1000 -> {[e.url for e in pool.candidates(1000)]}")
+        print(f"  ledger 2000 -> {[e.url for e in pool.candidates(2000)]}")
+        print(f"  get_ledger(1000) validated: {query_client.get_ledger(1000).get('validated')}")
+
+        pool.close()
+
+        print("\nFailover past a dead node:")
+        pool = EndpointPool(["http://127.0.0.1:9", node_a.url, node_b.url], health_interval=None)
+        dead = pool.endpoints[0]
+        dead.healthy = True  # pretend the last health check passed
+        query_client = XrplQueryClient(pool)
+        result = query_client.account_info(account)
+        print(f"  answered: {'account_data' in result}, failovers: {pool.failovers}, dead node healthy: {dead.healthy}")
+        pool.close()
@@ -0,0 +1,106 @@
+"""
+Request coalescing ("single-flight") for the read-only XRPL clients.
+
+When several threads (SingleFlight) or asyncio tasks (AsyncSingleFlight)
+ask for the same thing while an identical request is already on its way to
+the server, they wait for that one call and share its result instead of
+sending N identical RPCs. Nothing is kept once the call finishes; pair it
+with xrpl_cache.LedgerCache for reuse across time.
+
+Both query clients coalesce by default (keys are xrpl_cache.request_key, so
+only requests with identical method + params are merged). Shared results
+are the same dict object for every caller: treat them as read-only.
+"""
+
+import asyncio
+import threading
+
+from xrpl_cache import CACHEABLE_METHODS, request_key
+
+
+def should_coalesce(request) -> bool:
+    """Only read-only methods are safe to merge; submits never are."""
+    return request.method in CACHEABLE_METHODS
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group for synchronous callables."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0    # upstream calls actually made
+        self.shared = 0   # callers served by someone else's call
+
+    def do(self, key, fn):
+        """Runs fn() unless a call for `key` is in flight; then waits for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def request(self, request, fn):
+        """Coalesces `request` when it is read-only; fn() performs the call."""
+        if not should_coalesce(request):
+            return fn()
+        return self.do(request_key(request), fn)
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines running on one event loop."""
+
+    def __init__(self):
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, coroutine_fn):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coroutine_fn())
+            self._calls[key] = task
+            self.calls += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        # shield: one caller being cancelled must not cancel everyone's call.
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    async def request(self, request, coroutine_fn):
+        if not should_coalesce(request):
+            return await coroutine_fn()
+        return await self.do(request_key(request), coroutine_fn)
@@ -0,0 +1,357 @@
+"""
+Export a complete ledger state to a memory-mapped columnar snapshot.
+
+Layout of a snapshot directory:
+
+    manifest.json                  ledger index/hash, types, row counts, column kinds
+    AccountRoot/Balance.npy        one .npy file per field, one row per entry
+    AccountRoot/Account.npy
+    RippleState/Balance.value.npy  nested objects are flattened with dots
+    RippleState/HighLimit.issuer.npy
+    ...
+    <Type>/<col>.valid.npy         bool mask, only for columns some entries lack
+    <Type>/<col>.offsets.npy       variable-length strings (> 64 bytes) are
+    <Type>/<col>.data.npy          stored as offsets + one byte buffer
+    <Type>/_ids.npy, _rows.npy     object IDs sorted, with their row numbers
+
+Everything is plain NumPy .npy, so readers open it zero-copy with
+np.load(mmap_mode="r") and scan columns at NumPy speed:
+
+    snapshot = LedgerSnapshot("snapshot_85000000")
+    balances = snapshot.column("AccountRoot", "Balance")   # int64 drops, memory-mapped
+    print(balances.sum(), snapshot.get(some_object_id))
+
+Usage:
+    python xrpl_snapshot.py <ledger_index> <out_dir>
+"""
+
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+from dotenv import load_dotenv
+
+from xrpl_base import XrplQueryClient
+
+# Top-level fields holding an amount: digit strings there are XRP drops.
+AMOUNT_FIELDS = {
+    "Amount", "Balance", "DeliverMin", "LowLimit", "HighLimit", "SendMax",
+    "TakerGets", "TakerPays", "LPTokenBalance", "Fee",
+}
+
+# Strings up to this many bytes are stored fixed-width (S<n>); longer ones
+# (URIs, Domains, memos) go to offsets + data.
+FIXED_WIDTH_LIMIT = 64
+
+# Rows written to the memory-mapped columns per slice assignment.
+CHUNK_ROWS = 65536
+
+INT, FLOAT, FIXED_STR, VAR_STR = "int64", "float64", "fixed_str", "var_str"
+
+
+def flatten(entry, prefix=""):
+    """{'Balance': {'value': '1'}} -> {'Balance.value': '1'}; lists become JSON text."""
+    flat = {}
+    for key, value in entry.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value, separators=(",", ":"))
+        else:
+            flat[name] = value
+    return flat
+
+
+class _ColumnStats:
+    """What pass 1 learns about one column."""
+
+    def __init__(self, name):
+        self.name = name
+        self.present = 0
+        self.max_len = 0
+        self.total_len = 0
+        self.numeric = True   # every value so far fits the numeric kind
+        self.kind = None
+
+    def observe(self, value):
+        self.present += 1
+        if self.numeric:
+            self.numeric = self._fits_numeric(value)
+        text = value if isinstance(value, str) else json.dumps(value)
+        length = len(text.encode())
+        self.max_len = max(self.max_len, length)
+        self.total_len += length
+
+    def _fits_numeric(self, value):
+        if isinstance(value, bool):
+            return False
+        if isinstance(value, int):
+            return self._set_kind(INT) and -2**63 <= value < 2**63
+        if isinstance(value, float):
+            return self._set_kind(FLOAT)
+        if not isinstance(value, str):
+            return False
+        if self.name.endswith(".value"):
+            try:
+                float(value)
+            except ValueError:
+                return False
+            return self._set_kind(FLOAT)
+        if self.name in AMOUNT_FIELDS and value.isdigit() and len(value) <= 18:
+            return self._set_kind(INT)
+        return False
+
+    def _set_kind(self, kind):
+        if self.kind is None or self.kind == kind:
+            self.kind = kind
+            return True
+        if {self.kind, kind} == {INT, FLOAT}:
+            self.kind = FLOAT
+            return True
+        return False
+
+    def resolve(self):
+        if self.numeric and self.kind is not None:
+            return self.kind
+        return FIXED_STR if self.max_len <= FIXED_WIDTH_LIMIT else VAR_STR
+
+
+def _text(value):
+    if value is None:
+        return b""
+    return (value if isinstance(value, str) else json.dumps(value)).encode()
+
+
+def _iter_spill(path):
+    with open(path, encoding="utf-8") as spill:
+        for line in spill:
+            yield json.loads(line)
+
+
+def _iter_chunks(path):
+    chunk = []
+    for entry in _iter_spill(path):
+        chunk.append(entry)
+        if len(chunk) == CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _write_type(spill_path, type_dir, count):
+    """Turns one LedgerEntryType's spill file into memory-mapped columns."""
+    # Pass 1: discover columns and their kinds.
+    stats = {}
+    for entry in _iter_spill(spill_path):
+        for name, value in entry.items():
+            if name not in stats:
+                stats[name] = _ColumnStats(name)
+            stats[name].observe(value)
+
+    # Pass 2: allocate every column on disk, then fill it chunk by chunk.
+    os.makedirs(type_dir, exist_ok=True)
+    columns, outputs = {}, {}
+    for name, stat in stats.items():
+        kind = stat.resolve()
+        columns[name] = {"kind": kind, "nullable": stat.present < count}
+        base = os.path.join(type_dir, name)
+        out = {"kind": kind, "data_pos": 0}
+        if kind in (INT, FLOAT):
+            out["values"] = np.lib.format.open_memmap(f"{base}.npy", "w+", np.dtype(kind), (count,))
+        elif kind == FIXED_STR:
+            out["values"] = np.lib.format.open_memmap(f"{base}.npy", "w+", np.dtype(f"S{max(stat.max_len, 1)}"), (count,))
+        else:
+            out["offsets"] = np.lib.format.open_memmap(f"{base}.offsets.npy", "w+", np.int64, (count + 1,))
+            out["data"] = np.lib.format.open_memmap(f"{base}.data.npy", "w+", np.uint8, (max(stat.total_len, 1),))
+            out["offsets"][0] = 0
+        if stat.present < count:
+            out["valid"] = np.lib.format.open_memmap(f"{base}.valid.npy", "w+", np.bool_, (count,))
+        outputs[name] = out
+
+    row = 0
+    for chunk in _iter_chunks(spill_path):
+        stop = row + len(chunk)
+        for name, out in outputs.items():
+            raw = [entry.get(name) for entry in chunk]
+            if "valid" in out:
+                out["valid"][row:stop] = [value is not None for value in raw]
+            kind = out["kind"]
+            if kind == INT:
+                out["values"][row:stop] = [0 if value is None else int(value) for value in raw]
+            elif kind == FLOAT:
+                out["values"][row:stop] = [np.nan if value is None else float(value) for value in raw]
+            elif kind == FIXED_STR:
+                out["values"][row:stop] = [_text(value) for value in raw]
+            else:
+                encoded = [_text(value) for value in raw]
+                lengths = np.fromiter((len(text) for text in encoded), np.int64, len(encoded))
+                ends = out["data_pos"] + np.cumsum(lengths)
+                out["offsets"][row + 1:stop + 1] = ends
+                blob = b"".join(encoded)
+                out["data"][out["data_pos"]:out["data_pos"] + len(blob)] = np.frombuffer(blob, np.uint8)
+                out["data_pos"] += len(blob)
+        row = stop
+
+    for out in outputs.values():
+        for array in (out.get("values"), out.get("offsets"), out.get("data"), out.get("valid")):
+            if array is not None:
+                array.flush()
+
+    # Offset index: object IDs sorted, with the row each one lives in.
+    ids = np.load(os.path.join(type_dir, "index.npy"), mmap_mode="r")
+    order = np.argsort(ids, kind="stable")
+    np.save(os.path.join(type_dir, "_ids.npy"), ids[order])
+    np.save(os.path.join(type_dir, "_rows.npy"), order.astype(np.int64))
+    return columns
+
+
+def export_snapshot(query_client: XrplQueryClient, ledger_index: int, out_dir: str, page_size: int = 256):
+    """
+    Downloads every ledger entry of `ledger_index` with ledger_data and
+    writes the columnar snapshot to `out_dir`. Memory use stays flat: pages
+    are streamed into one spill file per LedgerEntryType, which is then
+    converted to columns in two sequential passes.
+    """
+    spill_dir = os.path.join(out_dir, "_spill")
+    os.makedirs(spill_dir, exist_ok=True)
+
+    spills, counts, downloaded = {}, {}, 0
+    entries = query_client.iter_ledger_data(limit=page_size, ledger_index=ledger_index)
+    try:
+        for entry in entries:
+            entry_type = entry["LedgerEntryType"]
+            if entry_type not in spills:
+                spills[entry_type] = open(os.path.join(spill_dir, f"{entry_type}.ndjson"), "w", encoding="utf-8")
+                counts[entry_type] = 0
+            spills[entry_type].write(json.dumps(flatten(entry), separators=(",", ":")))
+            spills[entry_type].write("\n")
+            counts[entry_type] += 1
+            downloaded += 1
+            if downloaded % 100_000 == 0:
+                print(f"[*] {downloaded} entries downloaded ({entries.pages} pages)")
+    finally:
+        for spill in spills.values():
+            spill.close()
+
+    manifest = {
+        "ledger_index": entries.ledger_index,
+        "ledger_hash": entries.ledger_hash,
+        "types": {},
+    }
+    for entry_type, count in sorted(counts.items()):
+        print(f"[*] Writing {count} {entry_type} entries...")
+        columns = _write_type(
+            os.path.join(spill_dir, f"{entry_type}.ndjson"),
+            os.path.join(out_dir, entry_type),
+            count,
+        )
+        manifest["types"][entry_type] = {"count": count, "columns": columns}
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    shutil.rmtree(spill_dir)
+    return out_dir
+
+
+class StringColumn:
+    """Read-only view over an offsets + data string column."""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row):
+        return bytes(self.data[self.offsets[row]:self.offsets[row + 1]]).decode()
+
+
+class LedgerSnapshot:
+    """Opens a snapshot written by export_snapshot; every column is memory-mapped."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.ledger_index = self.manifest["ledger_index"]
+        self._cache = {}
+
+    @property
+    def types(self):
+        return list(self.manifest["types"])
+
+    def count(self, entry_type: str) -> int:
+        return self.manifest["types"][entry_type]["count"]
+
+    def columns(self, entry_type: str):
+        return list(self.manifest["types"][entry_type]["columns"])
+
+    def _load(self, entry_type, filename):
+        key = (entry_type, filename)
+        if key not in self._cache:
+            self._cache[key] = np.load(os.path.join(self.path, entry_type, filename), mmap_mode="r")
+        return self._cache[key]
+
+    def column(self, entry_type: str, name: str):
+        """The whole column as a memory-mapped array (StringColumn for long strings)."""
+        kind = self.manifest["types"][entry_type]["columns"][name]["kind"]
+        if kind == VAR_STR:
+            return StringColumn(
+                self._load(entry_type, f"{name}.offsets.npy"),
+                self._load(entry_type, f"{name}.data.npy"),
+            )
+        return self._load(entry_type, f"{name}.npy")
+
+    def valid(self, entry_type: str, name: str):
+        """Bool mask of rows that have the field, or None if all of them do."""
+        if not self.manifest["types"][entry_type]["columns"][name]["nullable"]:
+            return None
+        return self._load(entry_type, f"{name}.valid.npy")
+
+    def lookup(self, object_id: str):
+        """Returns (LedgerEntryType, row) for an object ID, or None."""
+        needle = object_id.upper().encode()
+        for entry_type in self.types:
+            ids = self._load(entry_type, "_ids.npy")
+            position = np.searchsorted(ids, needle)
+            if position < len(ids) and ids[position] == needle:
+                return entry_type, int(self._load(entry_type, "_rows.npy")[position])
+        return None
+
+    def get(self, object_id: str):
+        """Rebuilds one entry (with flattened field names) from its columns."""
+        found = self.lookup(object_id)
+        if found is None:
+            return None
+        entry_type, row = found
+        entry = {}
+        for name, spec in self.manifest["types"][entry_type]["columns"].items():
+            mask = self.valid(entry_type, name)
+            if mask is not None and not mask[row]:
+                continue
+            value = self.column(entry_type, name)[row]
+            if spec["kind"] == FIXED_STR:
+                value = value.decode()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            entry[name] = value
+        return entry
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    if len(sys.argv) < 3:
+        print("Usage: python xrpl_snapshot.py <ledger_index> <out_dir>", file=sys.stderr)
+        sys.exit(1)
+
+    RPC_URL = os.getenv("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+    export_snapshot(XrplQueryClient(RPC_URL), int(sys.argv[1]), sys.argv[2])
+    snapshot = LedgerSnapshot(sys.argv[2])
+    for entry_type in snapshot.types:
+        print(f"{entry_type:<20}{snapshot.count(entry_type):>10} rows")
@@ -0,0 +1,412 @@
+"""
+A tiny local stand-in for a rippled JSON-RPC server.
+
+It answers the handful of methods the playground clients use with canned
+data, supports rippled's `"method": "batch"` envelope, and can inject a
+fixed delay per HTTP exchange so benchmarks see something that looks like
+network latency.
+
+`submit` is simulated too: signed blobs are checked against each account's
+Sequence (or Tickets), applied to the open ledger, and show up in `ledger`
+and `tx` once that ledger has closed, so submission pipelines can be run
+end to end without a network.
+
+Usage:
+
+    with StubRippled(delay=0.02) as server:
+        client = XrplQueryClient(server.url)
+        print(client.get_server_info())
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from xrpl.core.binarycodec import decode
+from xrpl.models.transactions.transaction import Transaction
+
+GENESIS_LEDGER = 1000
+
+
+class StubRippled:
+    """
+    Runs a ThreadingHTTPServer on 127.0.0.1 in a background thread.
+
+    delay:            seconds slept once per HTTP exchange (a whole batch
+                      pays it once, like a real round trip), or a callable
+                      returning that many seconds, e.g. to inject spikes
+    ledger_interval:  seconds between simulated ledger closes
+    complete_ledgers: range reported by server_info, e.g. "1000-5000"; when
+                      set, requests for other ledgers get lgrNotFound
+    handlers:         {method: callable(params) -> result dict} overrides
+    reject:           callable(tx_json) -> engine result (e.g. "telINSUF_FEE_P")
+                      or None, to make chosen submissions fail. A tec result
+                      is applied as on a real ledger: it uses up the
+                      Sequence (or Ticket) and validates, without effects
+    """
+
+    def __init__(
+        self,
+        delay=0.0,
+        ledger_interval: float = 3.5,
+        complete_ledgers: str = None,
+        load_factor: int = 1,
+        handlers: dict = None,
+        reject=None,
+        port: int = 0,
+    ):
+        self.delay = delay
+        self.ledger_interval = ledger_interval
+        self.complete_ledgers = complete_ledgers
+        self.load_factor = load_factor
+        self.handlers = {
+            "server_info": self._server_info,
+            "server_state": self._server_state,
+            "ledger_current": self._ledger_current,
+            "ledger_closed": self._ledger_closed,
+            "ledger": self._ledger,
+            "account_info": self._account_info,
+            "fee": self._fee,
+            "account_objects": self._account_objects,
+            "account_lines": self._account_lines,
+            "account_nfts": self._account_nfts,
+            "submit": self._submit,
+            "tx": self._tx,
+        }
+        self.handlers.update(handlers or {})
+        self.reject = reject
+        # Simulated ledger state, filled by `submit`.
+        # address -> {"Sequence": int, "Tickets": set, "Lines": {(currency, issuer): limit}, "NFTs": [...]}
+        self.accounts = {}
+        self.ledgers = {}        # ledger_index -> [transaction entries]
+        self.transactions = {}   # hash -> transaction entry
+        self._held = {}          # (address, Sequence) -> tx_json waiting for its turn
+        self._state_lock = threading.Lock()
+        self.request_count = 0
+        self._started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._server.daemon_threads = True
+        # Clients dropping kept-alive connections is normal; don't print tracebacks.
+        self._server.handle_error = lambda request, client_address: None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def validated_ledger(self) -> int:
+        elapsed = time.monotonic() - self._started_at
+        return GENESIS_LEDGER + int(elapsed / self.ledger_interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # --- request dispatch -------------------------------------------------
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 so clients can keep the connection alive.
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this the
+            # kept-alive connection stalls on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                delay = stub.delay() if callable(stub.delay) else stub.delay
+                if delay:
+                    time.sleep(delay)
+
+                if body.get("method") == "batch":
+                    reply = [stub.dispatch(entry) for entry in body.get("params", [])]
+                else:
+                    reply = stub.dispatch(body)
+
+                payload = json.dumps(reply).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def dispatch(self, body: dict) -> dict:
+        with self._lock:
+            self.request_count += 1
+        method = body.get("method")
+        params = (body.get("params") or [{}])[0]
+        handler = self.handlers.get(method)
+        ledger_index = params.get("ledger_index")
+        if self.complete_ledgers and isinstance(ledger_index, int) and not self._has_ledger(ledger_index):
+            result = {"error": "lgrNotFound", "error_message": "ledgerNotFound", "status": "error"}
+        elif handler is None:
+            # Unknown methods just echo their parameters back.
+            result = {"method": method, **params}
+        else:
+            result = handler(params)
+        result.setdefault("status", "success")
+        return {"result": result}
+
+    # --- canned handlers --------------------------------------------------
+
+    def _complete_ledgers(self) -> str:
+        return self.complete_ledgers or f"{GENESIS_LEDGER}-{self.validated_ledger}"
+
+    def _has_ledger(self, ledger_index: int) -> bool:
+        for span in self._complete_ledgers().split(","):
+            low, _, high = span.partition("-")
+            if int(low) <= ledger_index <= int(high or low):
+                return True
+        return False
+
+    def _server_info(self, params):
+        return {
+            "info": {
+                "build_version": "stub",
+                "complete_ledgers": self._complete_ledgers(),
+                "io_latency_ms": 1,
+                "load_factor": self.load_factor,
+                "server_state": "full",
+                "validated_ledger": {
+                    "seq": self.validated_ledger,
+                    "base_fee_xrp": 0.00001,
+                    "reserve_base_xrp": 1,
+                    "reserve_inc_xrp": 0.2,
+                },
+            }
+        }
+
+    def _server_state(self, params):
+        return {
+            "state": {
+                "complete_ledgers": self._complete_ledgers(),
+                "io_latency_ms": 1,
+                "load_base": 256,
+                "load_factor": 256 * self.load_factor,
+                "server_state": "full",
+                "validated_ledger": {
+                    "seq": self.validated_ledger,
+                    "base_fee": 10,
+                    "reserve_base": 1000000,
+                    "reserve_inc": 200000,
+                },
+            }
+        }
+
+    def _ledger_current(self, params):
+        return {"ledger_current_index": self.validated_ledger + 1}
+
+    def _ledger_closed(self, params):
+        return {"ledger_index": self.validated_ledger, "ledger_hash": "0" * 64}
+
+    def _ledger(self, params):
+        ledger_index = params.get("ledger_index", "validated")
+        if not isinstance(ledger_index, int):
+            ledger_index = self.validated_ledger
+        transactions = []
+        if params.get("transactions") and ledger_index <= self.validated_ledger:
+            entries = self.ledgers.get(ledger_index, [])
+            transactions = list(entries) if params.get("expand") else [entry["hash"] for entry in entries]
+        return {
+            "ledger_index": ledger_index,
+            "ledger_hash": f"{ledger_index:064X}",
+            "ledger": {"ledger_index": str(ledger_index), "closed": True, "transactions": transactions},
+            "validated": ledger_index <= self.validated_ledger,
+        }
+
+    def _account_info(self, params):
+        account = self.accounts.get(params.get("account"), {})
+        if params.get("ledger_index") == "validated":
+            ledger = {"ledger_index": self.validated_ledger, "validated": True}
+        else:
+            ledger = {"ledger_current_index": self.validated_ledger + 1, "validated": False}
+        return {
+            "account_data": {
+                "Account": params.get("account"),
+                "Balance": "100000000",
+                "Flags": 0,
+                "LedgerEntryType": "AccountRoot",
+                "OwnerCount": len(account.get("Tickets", ())),
+                "Sequence": account.get("Sequence", 1),
+                "TicketCount": len(account.get("Tickets", ())),
+            },
+            **ledger,
+        }
+
+    def _account_objects(self, params):
+        objects = []
+        if params.get("type") in (None, "ticket"):
+            tickets = sorted(self.accounts.get(params.get("account"), {}).get("Tickets", ()))
+            objects = [
+                {"Account": params.get("account"), "LedgerEntryType": "Ticket",
+                 "TicketSequence": ticket, "index": f"{ticket:064X}"}
+                for ticket in tickets
+            ]
+        return {"account": params.get("account"), "account_objects": objects, "validated": False}
+
+    def _account_lines(self, params):
+        lines = [
+            {"account": issuer, "balance": "0", "currency": currency, "limit": limit, "limit_peer": "0"}
+            for (currency, issuer), limit in sorted(self.accounts.get(params.get("account"), {}).get("Lines", {}).items())
+            if params.get("peer") in (None, issuer)
+        ]
+        return {"account": params.get("account"), "lines": lines, "validated": False}
+
+    def _account_nfts(self, params):
+        nfts = self.accounts.get(params.get("account"), {}).get("NFTs", [])
+        start = int(params.get("marker") or 0)
+        end = start + int(params.get("limit") or 100)
+        result = {"account": params.get("account"), "account_nfts": nfts[start:end], "validated": False}
+        if end < len(nfts):
+            result["marker"] = str(end)
+        return result
+
+    def _fee(self, params):
+        return {
+            "current_ledger_size": "10",
+            "expected_ledger_size": "100",
+            "ledger_current_index": self.validated_ledger + 1,
+            "drops": {
+                "base_fee": "10",
+                "median_fee": "5000",
+                "minimum_fee": "10",
+                "open_ledger_fee": "10",
+            },
+        }
+
+    # --- simulated submission ---------------------------------------------
+
+    def _submit(self, params):
+        blob = params.get("tx_blob")
+        if not blob:
+            return {"error": "invalidParams", "error_message": "Missing field 'tx_blob'.", "status": "error"}
+        tx_json = decode(blob)
+        tx_json["hash"] = Transaction.from_blob(blob).get_hash()
+        with self._state_lock:
+            engine_result = self._apply(tx_json)
+        return {
+            "accepted": engine_result in ("tesSUCCESS", "terPRE_SEQ"),
+            "engine_result": engine_result,
+            "engine_result_message": engine_result,
+            "tx_blob": blob,
+            "tx_json": tx_json,
+        }
+
+    def _apply(self, tx_json):
+        open_ledger = self.validated_ledger + 1
+        if tx_json.get("LastLedgerSequence", open_ledger) < open_ledger:
+            return "tefMAX_LEDGER"
+        if tx_json["hash"] in self.transactions:
+            return "tefALREADY"
+        engine_result = self.reject(tx_json) if self.reject is not None else None
+        if engine_result and not engine_result.startswith("tec"):
+            return engine_result
+
+        address = tx_json["Account"]
+        account = self.accounts.setdefault(address, {"Sequence": 1, "Tickets": set(), "Lines": {}, "NFTs": []})
+        if tx_json.get("TicketSequence"):
+            if tx_json["TicketSequence"] not in account["Tickets"]:
+                return "tefNO_TICKET"
+            account["Tickets"].discard(tx_json["TicketSequence"])
+        elif tx_json["Sequence"] < account["Sequence"]:
+            return "tefPAST_SEQ"
+        elif tx_json["Sequence"] > account["Sequence"]:
+            self._held[(address, tx_json["Sequence"])] = tx_json
+            return "terPRE_SEQ"
+        else:
+            account["Sequence"] += 1
+
+        if engine_result:
+            self._record(tx_json, account, open_ledger, engine_result)
+            return engine_result
+        self._record(tx_json, account, open_ledger)
+        # Transactions held for a missing Sequence may now go through.
+        while (address, account["Sequence"]) in self._held:
+            held = self._held.pop((address, account["Sequence"]))
+            if held.get("LastLedgerSequence", open_ledger) >= open_ledger:
+                account["Sequence"] += 1
+                self._record(held, account, open_ledger)
+        return "tesSUCCESS"
+
+    def _record(self, tx_json, account, ledger_index, result="tesSUCCESS"):
+        # Every transaction modifies its sender's AccountRoot (Sequence, fee);
+        # a payment also the destination's. A tec only charges the fee.
+        senders = (tx_json["Account"],) if result != "tesSUCCESS" else (tx_json["Account"], tx_json.get("Destination"))
+        affected = [
+            {"ModifiedNode": {"LedgerEntryType": "AccountRoot", "FinalFields": {"Account": address}}}
+            for address in dict.fromkeys(filter(None, senders))
+        ]
+        if result != "tesSUCCESS":
+            pass
+        elif tx_json["TransactionType"] == "TicketCreate":
+            first = account["Sequence"]
+            for ticket in range(first, first + tx_json["TicketCount"]):
+                account["Tickets"].add(ticket)
+                affected.append({"CreatedNode": {
+                    "LedgerEntryType": "Ticket",
+                    "LedgerIndex": f"{ticket:064X}",
+                    "NewFields": {"Account": tx_json["Account"], "TicketSequence": ticket},
+                }})
+            account["Sequence"] += tx_json["TicketCount"]
+        elif tx_json["TransactionType"] == "TrustSet":
+            limit = tx_json["LimitAmount"]
+            account["Lines"][(limit["currency"], limit["issuer"])] = limit["value"]
+        elif tx_json["TransactionType"] == "NFTokenMint":
+            nftoken_id = f"{len(self.transactions):064X}"
+            account["NFTs"].append({
+                "Flags": tx_json.get("Flags", 0), "Issuer": tx_json["Account"], "NFTokenID": nftoken_id,
+                "NFTokenTaxon": tx_json["NFTokenTaxon"], "URI": tx_json.get("URI"), "nft_serial": len(account["NFTs"]),
+            })
+            affected.append({"CreatedNode": {
+                "LedgerEntryType": "NFTokenPage",
+                "LedgerIndex": "F" * 64,
+                "NewFields": {"NFTokens": [{"NFToken": {"NFTokenID": nftoken_id, "URI": tx_json.get("URI")}}]},
+            }})
+        entries = self.ledgers.setdefault(ledger_index, [])
+        entry = {
+            "hash": tx_json["hash"],
+            "ledger_index": ledger_index,
+            "meta": {"AffectedNodes": affected, "TransactionIndex": len(entries), "TransactionResult": result},
+            "tx_json": tx_json,
+        }
+        entries.append(entry)
+        self.transactions[tx_json["hash"]] = entry
+
+    def _tx(self, params):
+        entry = self.transactions.get(params.get("transaction"))
+        if entry is None:
+            return {"error": "txnNotFound", "error_message": "Transaction not found.", "status": "error"}
+        return {**entry, "validated": entry["ledger_index"] <= self.validated_ledger}
+
+
+if __name__ == "__main__":
+    with StubRippled() as server:
+        print(f"Stand-in rippled listening on {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
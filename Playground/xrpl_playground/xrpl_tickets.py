@@ -0,0 +1,184 @@
+"""
+Ticket pool for submitting many transactions from one account in parallel.
+
+A transaction that uses a Ticket (TicketSequence) instead of the next
+Sequence does not depend on any other transaction of the account: it can
+be signed and submitted at any time, in any order, and a failure does not
+block the ones after it. TicketPool keeps a stock of the account's Tickets,
+hands one to each worker, and sends a TicketCreate in the background when
+the stock runs low.
+
+Usage:
+
+    pool = TicketPool(client, wallet, target=100)
+    tx_client = XrplTransactionClient(client, wallet, ticket_pool=pool)
+
+    # send_xrp / set_trust_line / mint_nft now use Tickets, so they can be
+    # called from many threads at once:
+    results = tx_client.submit_parallel(transactions, workers=32)
+
+A TicketCreate that fails (e.g. tecINSUFFICIENT_RESERVE) is retried with
+exponential backoff; after `max_failures` failures in a row, acquire()
+raises TicketRefillError instead of waiting for Tickets that won't come.
+"""
+
+import threading
+import time
+from collections import deque
+
+from xrpl.models.requests import AccountObjects, AccountObjectType
+from xrpl.models.transactions import TicketCreate
+from xrpl.transaction import submit_and_wait
+from xrpl.wallet import Wallet
+
+from xrpl_account_monitor import affected_entries
+from xrpl_pagination import MarkerIterator
+
+# An account may own at most this many Tickets at a time.
+MAX_TICKETS = 250
+
+
+class TicketRefillError(RuntimeError):
+    """The pool is empty and creating more Tickets keeps failing."""
+
+
+class TicketPool:
+    """
+    target:    Tickets to keep in stock (at most MAX_TICKETS, including
+               ones handed out and not yet used)
+    low_water: stock level that triggers a background TicketCreate;
+               defaults to a quarter of `target`
+    backoff:   seconds before retrying a failed TicketCreate, doubling
+               with each failure in a row (at most 60)
+    max_failures: failed TicketCreates in a row before giving up
+    """
+
+    def __init__(
+        self,
+        client,
+        wallet: Wallet,
+        target: int = 50,
+        low_water: int = None,
+        backoff: float = 2.0,
+        max_failures: int = 5,
+    ):
+        self.client = client
+        self.wallet = wallet
+        self.account = wallet.classic_address
+        self.target = min(target, MAX_TICKETS)
+        self.low_water = target // 4 if low_water is None else low_water
+        self._available = deque()
+        self._leased = set()
+        self._condition = threading.Condition()
+        self._refilling = False
+        self._loaded = False
+        self.created = 0
+        self.backoff = backoff
+        self.max_failures = max_failures
+        self.failures = 0
+        self.last_error = None
+        self._retry_at = 0.0
+
+    def __len__(self):
+        return len(self._available)
+
+    def load(self):
+        """
+        Reads the Tickets the account already owns (e.g. left over from a
+        previous run). Also clears earlier refill failures.
+        """
+        fetch = lambda request: self.client.request(request).result
+        request = AccountObjects(account=self.account, type=AccountObjectType.TICKET,
+                                 limit=400, ledger_index="validated")
+        owned = [entry["TicketSequence"] for entry in MarkerIterator(fetch, request, "account_objects")]
+        with self._condition:
+            self._available = deque(sorted(set(owned) - self._leased))
+            self._loaded = True
+            self.failures = 0
+            self._retry_at = 0.0
+            self._condition.notify_all()
+        return len(owned)
+
+    def acquire(self, timeout: float = None) -> int:
+        """
+        Takes a Ticket, waiting for a refill if none is left. Raises
+        TicketRefillError once refilling has failed `max_failures` times.
+        """
+        if not self._loaded:
+            self.load()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._available:
+                if self.failures >= self.max_failures:
+                    raise TicketRefillError(
+                        f"Creating Tickets for {self.account} failed {self.failures} times: {self.last_error}"
+                    )
+                # Also retries a refill that failed while we were waiting.
+                self._maybe_refill()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No Ticket available for {self.account} after {timeout}s")
+                if not self._refilling:
+                    # Wake up when the backoff ends to try again.
+                    retry_in = max(self._retry_at - time.monotonic(), 0.01)
+                    remaining = retry_in if remaining is None else min(remaining, retry_in)
+                self._condition.wait(remaining)
+            ticket = self._available.popleft()
+            self._leased.add(ticket)
+            self._maybe_refill()
+            return ticket
+
+    def release(self, ticket: int):
+        """Returns an unused Ticket (its transaction was rejected or expired)."""
+        with self._condition:
+            if ticket in self._leased:
+                self._leased.discard(ticket)
+                self._available.append(ticket)
+                self._condition.notify()
+
+    def consume(self, ticket: int):
+        """Forgets a Ticket that was used up (or turned out not to exist)."""
+        with self._condition:
+            self._leased.discard(ticket)
+
+    # --- refilling ----------------------------------------------------------
+
+    def _maybe_refill(self):
+        # Called with the condition held.
+        if self._refilling or len(self._available) > self.low_water:
+            return
+        if self.failures >= self.max_failures or time.monotonic() < self._retry_at:
+            return
+        count = min(self.target - len(self._available), MAX_TICKETS - len(self._available) - len(self._leased))
+        if count <= 0:
+            return
+        self._refilling = True
+        threading.Thread(target=self._refill, args=(count,), daemon=True).start()
+
+    def _refill(self, count):
+        tickets = []
+        error = None
+        try:
+            response = submit_and_wait(TicketCreate(account=self.account, ticket_count=count), self.client, self.wallet)
+            meta = response.result.get("meta", {})
+            # submit_and_wait doesn't raise on tec results; they create nothing.
+            if meta.get("TransactionResult") != "tesSUCCESS":
+                error = meta.get("TransactionResult", "no result")
+            tickets = [
+                fields["TicketSequence"]
+                for change, fields, _ in affected_entries(meta, "Ticket")
+                if change == "created"
+            ]
+        except Exception as e:
+            error = e
+        with self._condition:
+            self._available.extend(tickets)
+            self.created += len(tickets)
+            if tickets:
+                self.failures = 0
+            else:
+                self.failures += 1
+                self.last_error = error or "no Tickets created"
+                self._retry_at = time.monotonic() + min(self.backoff * 2 ** (self.failures - 1), 60.0)
+            self._refilling = False
+            self._condition.notify_all()
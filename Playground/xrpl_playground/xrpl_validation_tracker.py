@@ -0,0 +1,233 @@
+"""
+One ledger-close watcher for any number of submitted transactions.
+
+submit_and_wait runs its own polling loop per transaction. ValidationTracker
+follows validated ledgers once, in a single background thread, and checks
+each ledger's transaction hashes against a table of pending submissions:
+
+    tracker = ValidationTracker(client)
+    future = tracker.track(tx_hash, last_ledger_sequence)   # before submitting
+    ...submit...                # and tracker.untrack(tx_hash) if it is rejected
+    record = future.result()    # or future.add_done_callback(...), or
+                                # await asyncio.wrap_future(future)
+
+Every future resolves to a record dict:
+
+    {"hash": ..., "validated": True, "result": "tesSUCCESS",
+     "ledger_index": 1234, "meta": {...}}
+
+or, once a validated ledger passes the transaction's LastLedgerSequence
+without including it, {"validated": False, "result": "expired", ...}. An
+expired transaction can never be applied, so it is safe to re-sign.
+
+One `ledger` call per closed ledger covers every pending hash; metadata is
+fetched only for the hashes that matched (with `tx`, or the expanded ledger
+when many matched). Pair it with a ledger stream by calling notify() from
+e.g. AccountMonitor.add_ledger_listener to react as soon as a ledger closes.
+"""
+
+import threading
+from concurrent.futures import Future
+
+from xrpl.models import requests
+
+# Submission results after which the blob may still end up in a ledger.
+PENDING_PREFIXES = ("tes", "tec", "ter")
+
+
+def transaction_meta(entry):
+    """Metadata of an expanded ledger/tx entry in API v1 or v2 shape."""
+    return entry.get("meta") or entry.get("metaData") or {}
+
+
+def resolved_record(hash_, result, meta=None, ledger_index=None, validated=False):
+    return {"hash": hash_, "validated": validated, "result": result, "ledger_index": ledger_index, "meta": meta}
+
+
+class _Pending:
+    __slots__ = ("future", "last_ledger", "callbacks")
+
+    def __init__(self, last_ledger):
+        self.future = Future()
+        self.last_ledger = last_ledger
+        self.callbacks = []
+
+
+class ValidationTracker:
+    """
+    client:           a JsonRpcClient (batched `tx` lookups when it has request_batch)
+    poll_interval:    seconds between checks for a new validated ledger
+    expand_threshold: matches in one ledger above which the expanded ledger
+                      is fetched instead of one `tx` lookup per match
+    """
+
+    def __init__(self, client, poll_interval: float = 1.0, expand_threshold: int = 20):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.expand_threshold = expand_threshold
+        # Last validated ledger that has been fully checked.
+        self.ledger_index = None
+        self.resolved = 0
+        self.expired = 0
+        self._pending = {}
+        self._ledger_listeners = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add_ledger_listener(self, callback):
+        """callback(ledger_index) after each validated ledger has been checked."""
+        self._ledger_listeners.append(callback)
+
+    # --- lifecycle ----------------------------------------------------------
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return self
+            # Re-check the latest validated ledger too, in case something
+            # tracked right now was already included in it.
+            self.ledger_index = self._validated_ledger_index() - 1
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def notify(self, ledger_index=None):
+        """Wakes the tracker now instead of at the next poll (e.g. on ledgerClosed)."""
+        self._wake.set()
+
+    # --- tracking -----------------------------------------------------------
+
+    def track(self, hash_: str, last_ledger_sequence: int = None, callback=None) -> Future:
+        """
+        Starts watching `hash_`. Returns a Future resolving to its record;
+        `callback(record)` is also called when it resolves. Transactions
+        without a LastLedgerSequence are only resolved once validated.
+
+        Track before submitting: a ledger that closes between the submit
+        and this call would otherwise only be caught at expiry.
+        """
+        self.start()
+        with self._lock:
+            pending = self._pending.get(hash_)
+            if pending is None:
+                pending = self._pending[hash_] = _Pending(last_ledger_sequence)
+            if callback is not None:
+                pending.callbacks.append(callback)
+        return pending.future
+
+    def untrack(self, hash_: str, result: str = None):
+        """
+        Stops watching `hash_` (e.g. its submission was rejected). With a
+        `result`, its future resolves to an unvalidated record carrying it.
+        """
+        with self._lock:
+            pending = self._pending.pop(hash_, None)
+        if pending is not None and result is not None:
+            pending.future.set_result(resolved_record(hash_, result))
+
+    def _resolve(self, record):
+        with self._lock:
+            pending = self._pending.pop(record["hash"], None)
+        if pending is None:
+            return
+        if record["validated"]:
+            self.resolved += 1
+        else:
+            self.expired += 1
+        pending.future.set_result(record)
+        for callback in pending.callbacks:
+            try:
+                callback(record)
+            except Exception as e:
+                print(f"Validation callback failed: {e}")
+
+    # --- ledger following ---------------------------------------------------
+
+    def _result(self, request):
+        response = self.client.request(request)
+        if not response.is_successful():
+            raise RuntimeError(f"{request.method} failed: {response.result}")
+        return response.result
+
+    def _validated_ledger_index(self):
+        return int(self._result(requests.Ledger(ledger_index="validated"))["ledger_index"])
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Validation tracker error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def poll(self):
+        """Checks every validated ledger closed since the last poll."""
+        validated = self._validated_ledger_index()
+        while self.ledger_index < validated and not self._stopped.is_set():
+            ledger_index = self.ledger_index + 1
+            if self._pending:
+                self._check_ledger(ledger_index)
+            self.ledger_index = ledger_index
+            self._expire(ledger_index)
+            for callback in self._ledger_listeners:
+                callback(ledger_index)
+
+    def _check_ledger(self, ledger_index):
+        result = self._result(requests.Ledger(ledger_index=ledger_index, transactions=True))
+        hashes = result["ledger"].get("transactions", [])
+        with self._lock:
+            mine = [hash_ for hash_ in hashes if hash_ in self._pending]
+        if not mine:
+            return
+        if len(mine) > self.expand_threshold:
+            result = self._result(requests.Ledger(ledger_index=ledger_index, transactions=True, expand=True))
+            metas = {entry["hash"]: transaction_meta(entry) for entry in result["ledger"]["transactions"]}
+        else:
+            metas = {hash_: transaction_meta(entry) for hash_, entry in zip(mine, self._lookup(mine))}
+        for hash_ in mine:
+            meta = metas.get(hash_, {})
+            self._resolve(resolved_record(
+                hash_, meta.get("TransactionResult", "unknown"), meta, ledger_index, validated=True
+            ))
+
+    def _lookup(self, hashes):
+        lookups = [requests.Tx(transaction=hash_) for hash_ in hashes]
+        if hasattr(self.client, "request_batch"):
+            responses = self.client.request_batch(lookups)
+        else:
+            responses = [self.client.request(lookup) for lookup in lookups]
+        return [response.result for response in responses]
+
+    def _expire(self, ledger_index):
+        with self._lock:
+            expired = [
+                hash_ for hash_, pending in self._pending.items()
+                if pending.last_ledger is not None and pending.last_ledger <= ledger_index
+            ]
+        if not expired:
+            return
+        # A hash registered while its ledger was being checked could have
+        # been missed; ask for it directly before calling it expired.
+        for hash_, entry in zip(expired, self._lookup(expired)):
+            if entry.get("validated"):
+                meta = transaction_meta(entry)
+                self._resolve(resolved_record(
+                    hash_, meta.get("TransactionResult", "unknown"), meta,
+                    entry.get("ledger_index"), validated=True,
+                ))
+            else:
+                self._resolve(resolved_record(hash_, "expired"))
@@ -0,0 +1,133 @@
+"""
+Load test: the async XRPL-backed API endpoints served by one ASGI worker
+(uvicorn) vs one synchronous WSGI worker, both talking to the local
+stand-in rippled (Playground/xrpl_playground/xrpl_stub_server.py) with a
+fixed delay per exchange, like a remote node.
+
+Under WSGI every request holds the worker until the node has answered;
+under ASGI the worker moves on to the next request while it waits.
+
+Uses the database configured for the project (DJANGO_SETTINGS_MODULE).
+
+Usage:
+    python asgi_loadtest.py [requests] [concurrency] [delay_ms]
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(os.environ.get("XRPL_LIB_DIR", str(BASE_DIR.parent / "Playground" / "xrpl_playground")))
+
+from xrpl_stub_server import StubRippled  # noqa: E402
+
+ACCOUNT = "rNcmpNiUjUjrWhod2Vr1fgQPtZm9QyPVRV"
+PATHS = [
+    "/api/ledger/",
+    f"/api/account/{ACCOUNT}/",
+    f"/api/account/{ACCOUNT}/nfts/",
+]
+
+# One request at a time, like a single sync worker; a deep accept queue so
+# waiting clients queue up instead of being refused.
+WSGI_SERVER = (
+    "from wsgiref.simple_server import make_server, WSGIRequestHandler, WSGIServer\n"
+    "from xrpl_platform.wsgi import application\n"
+    "class Server(WSGIServer):\n"
+    "    request_queue_size = 1024\n"
+    "class Quiet(WSGIRequestHandler):\n"
+    "    def log_message(self, *args): pass\n"
+    "make_server('127.0.0.1', {port}, application, Server, Quiet).serve_forever()\n"
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, port, env):
+    if mode == "asgi":
+        command = [sys.executable, "-m", "uvicorn", "xrpl_platform.asgi:application",
+                   "--host", "127.0.0.1", "--port", str(port), "--workers", "1", "--log-level", "warning"]
+    else:
+        command = [sys.executable, "-c", WSGI_SERVER.format(port=port)]
+    return subprocess.Popen(command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL)
+
+
+def wait_ready(url, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url + PATHS[0], timeout=2.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not come up")
+
+
+async def run_load(url, total, concurrency):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, timeout=60.0, limits=limits) as client:
+        async def one(i):
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(PATHS[i % len(PATHS)])
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    delay_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    print(f"{total} requests, {concurrency} concurrent, {delay_ms:.0f} ms per XRPL round trip\n")
+    with StubRippled(delay=delay_ms / 1000) as stub:
+        env = {**os.environ, "XRPL_RPC_URL": stub.url}
+        for mode in ("wsgi", "asgi"):
+            port = free_port()
+            url = f"http://127.0.0.1:{port}"
+            server = start_server(mode, port, env)
+            try:
+                wait_ready(url)
+                stats = asyncio.run(run_load(url, total, concurrency))
+            finally:
+                server.terminate()
+                server.wait()
+            print(f"{mode.upper():5} {stats['rps']:8.1f} req/s   p50 {stats['p50']:7.1f} ms   "
+                  f"p95 {stats['p95']:7.1f} ms   {stats['errors']} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Structured log line per XRPL call, on top of the /metrics/ endpoint.
+        if settings.XRPL_METRICS_LOG:
+            from xrpl_metrics import LogSink, default_registry
+            default_registry.add_sink(LogSink())
@@ -0,0 +1,161 @@
+"""
+Keeps XrplWallet.balance in step with the ledger.
+
+BalanceSync works through the wallets a chunk at a time: one streamed
+query, account_info for the whole chunk as JSON-RPC batches sent from a
+few threads at once, and one bulk_update of the balances that changed per
+chunk, in a transaction. Incremental mode first reads the recent
+validated ledgers and only syncs the wallets their transactions touched.
+
+Usage:
+
+    from core.balance_sync import BalanceSync
+
+    stats = BalanceSync().sync_all()
+    stats = BalanceSync().sync_recent(ledgers=20)
+
+or `python manage.py sync_balances [--recent N | --since-ledger N]`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from xrpl.models import requests
+from xrpl.utils import drops_to_xrp
+
+from xrpl_account_monitor import affected_entries
+from xrpl_base import MAX_BATCH_SIZE, PooledJsonRpcClient
+
+from .models import XrplWallet
+
+# XrplWallet.balance has 6 decimal places, one per drop.
+BALANCE_PLACES = Decimal("0.000001")
+
+
+class BalanceSync:
+    """
+    client:     a JsonRpcClient with request_batch; defaults to settings.XRPL_RPC_URL
+    chunk_size: wallets read, fetched and written together
+    workers:    account_info batches in flight at once
+    """
+
+    def __init__(self, client=None, chunk_size: int = 1000, workers: int = 8):
+        self.client = client or PooledJsonRpcClient(settings.XRPL_RPC_URL)
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def _new_stats(self):
+        return {"wallets": 0, "updated": 0, "unfunded": 0, "errors": 0}
+
+    # --- fetching -----------------------------------------------------------
+
+    def fetch_balances(self, addresses):
+        """
+        {address: balance in XRP} from validated account_info, for every
+        address that exists on the ledger. Unfunded addresses map to None;
+        addresses whose lookup failed are left out.
+        """
+        addresses = list(addresses)
+        batches = [addresses[i:i + MAX_BATCH_SIZE] for i in range(0, len(addresses), MAX_BATCH_SIZE)]
+        request_lists = [
+            [requests.AccountInfo(account=address, ledger_index="validated") for address in batch]
+            for batch in batches
+        ]
+        balances = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch, responses in zip(batches, executor.map(self.client.request_batch, request_lists)):
+                for address, response in zip(batch, responses):
+                    result = response.result
+                    if "account_data" in result:
+                        balances[address] = drops_to_xrp(result["account_data"]["Balance"])
+                    elif result.get("error") == "actNotFound":
+                        balances[address] = None
+        return balances
+
+    # --- writing ------------------------------------------------------------
+
+    def _sync_chunk(self, wallets, stats):
+        balances = self.fetch_balances(wallet.wallet_address for wallet in wallets)
+        changed = []
+        for wallet in wallets:
+            if wallet.wallet_address not in balances:
+                stats["errors"] += 1
+                continue
+            balance = balances[wallet.wallet_address]
+            if balance is None:
+                # Never funded, or deleted since the last sync: it holds nothing.
+                stats["unfunded"] += 1
+                balance = Decimal(0)
+            balance = balance.quantize(BALANCE_PLACES)
+            if wallet.balance != balance:
+                wallet.balance = balance
+                changed.append(wallet)
+        if changed:
+            with transaction.atomic():
+                XrplWallet.objects.bulk_update(changed, ["balance"], batch_size=self.chunk_size)
+        stats["wallets"] += len(wallets)
+        stats["updated"] += len(changed)
+
+    def sync_queryset(self, queryset):
+        """Syncs every wallet in `queryset`, streamed `chunk_size` rows at a time."""
+        stats = self._new_stats()
+        chunk = []
+        rows = queryset.only("id", "wallet_address", "balance").order_by("id").iterator(chunk_size=self.chunk_size)
+        for wallet in rows:
+            chunk.append(wallet)
+            if len(chunk) >= self.chunk_size:
+                self._sync_chunk(chunk, stats)
+                chunk = []
+        if chunk:
+            self._sync_chunk(chunk, stats)
+        return stats
+
+    def sync_all(self):
+        return self.sync_queryset(XrplWallet.objects.all())
+
+    # --- incremental mode ---------------------------------------------------
+
+    def validated_ledger_index(self) -> int:
+        return int(self.client.request(requests.Ledger(ledger_index="validated")).result["ledger_index"])
+
+    def touched_accounts(self, first_ledger: int, last_ledger: int):
+        """Addresses whose AccountRoot changed in validated ledgers first_ledger..last_ledger."""
+        ledger_requests = [
+            requests.Ledger(ledger_index=index, transactions=True, expand=True)
+            for index in range(first_ledger, last_ledger + 1)
+        ]
+        accounts = set()
+        # Expanded ledgers are big; a few per batch.
+        for start in range(0, len(ledger_requests), 5):
+            for response in self.client.request_batch(ledger_requests[start:start + 5]):
+                if not response.is_successful():
+                    raise RuntimeError(f"ledger failed: {response.result}")
+                for entry in response.result["ledger"].get("transactions", []):
+                    meta = entry.get("meta") or entry.get("metaData") or {}
+                    for _, fields, _ in affected_entries(meta, "AccountRoot"):
+                        if "Account" in fields:
+                            accounts.add(fields["Account"])
+        return accounts
+
+    def sync_recent(self, ledgers: int = 10, since_ledger: int = None):
+        """
+        Syncs only the wallets touched since `since_ledger` (exclusive), or
+        in the last `ledgers` validated ledgers. The stats include
+        `last_ledger`, to pass as `since_ledger` next time.
+        """
+        last_ledger = self.validated_ledger_index()
+        first_ledger = since_ledger + 1 if since_ledger is not None else last_ledger - ledgers + 1
+        stats = self._new_stats()
+        if first_ledger <= last_ledger:
+            touched = sorted(self.touched_accounts(first_ledger, last_ledger))
+            # Bounded IN-lists; each slice is streamed and synced like a full run.
+            for start in range(0, len(touched), self.chunk_size):
+                chunk_stats = self.sync_queryset(
+                    XrplWallet.objects.filter(wallet_address__in=touched[start:start + self.chunk_size])
+                )
+                for key, value in chunk_stats.items():
+                    stats[key] += value
+        stats["last_ledger"] = last_ledger
+        return stats
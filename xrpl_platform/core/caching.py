@@ -0,0 +1,161 @@
+"""
+Ledger-keyed response caching for the XRPL-backed (and ORM-heavy) API views.
+
+A response built while validated ledger N is the latest stays correct until
+a newer ledger validates, so every cached entry records the ledger it was
+built on. On each request the latest validated ledger index (itself cached
+for XRPL_LEDGER_POLL_SECONDS) decides what happens:
+
+  - entry built on that ledger: served from the cache, or 304 Not Modified
+    when the client already has it (If-None-Match);
+  - entry at most XRPL_CACHE_STALE_LEDGERS ledgers behind: served as is
+    while one background task rebuilds it (stale-while-revalidate);
+  - older or missing: rebuilt before responding.
+
+If the latest validated ledger can't be read (node unreachable, not
+synced), an existing entry is served as stale, and without one the view
+runs uncached and reports the error itself.
+
+The ETag is a hash of the body, so it survives ledgers that change nothing
+for that response, and Cache-Control lets browsers and proxies reuse it for
+about one ledger close. Views whose responses carry database or user fields
+pass private=True, which keeps them out of shared caches (proxies, CDNs)
+and lets only the browser reuse them. Entries live in the default Django
+cache, so they are per process with locmem and shared between workers with
+Redis.
+
+Usage:
+
+    @ledger_cached
+    async def api_ledger_status(request):
+        ...
+
+    @ledger_cached(private=True)
+    async def api_account_summary(request, address):
+        ...
+"""
+
+import asyncio
+import functools
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from .xrpl_clients import get_async_client
+
+LEDGER_KEY = "xrpl:validated_ledger"
+
+# Keeps background refresh tasks referenced until they finish.
+_refresh_tasks = set()
+
+
+async def latest_validated_ledger():
+    """
+    Latest validated ledger index, read at most once per
+    XRPL_LEDGER_POLL_SECONDS; None if the node can't tell us.
+    """
+    ledger_index = await cache.aget(LEDGER_KEY)
+    if ledger_index is None:
+        try:
+            result = await get_async_client().get_ledger("validated", transactions=False, expand=False)
+        except Exception as e:
+            print(f"Reading the validated ledger failed: {e}")
+            return None
+        if "error" in result or "ledger_index" not in result:
+            print(f"Reading the validated ledger failed: {result.get('error', result)}")
+            return None
+        ledger_index = int(result["ledger_index"])
+        await cache.aset(LEDGER_KEY, ledger_index, settings.XRPL_LEDGER_POLL_SECONDS)
+    return ledger_index
+
+
+def _cache_key(request):
+    return "xrpl-view:" + hashlib.sha1(request.get_full_path().encode()).hexdigest()
+
+
+async def _build(view, request, args, kwargs, key, ledger_index):
+    """Runs the view; caches and returns its entry, or (None, response) if it can't be cached."""
+    response = await view(request, *args, **kwargs)
+    if response.status_code != 200 or response.streaming:
+        return None, response
+    entry = {
+        "ledger": ledger_index,
+        "content": response.content,
+        "content_type": response["Content-Type"],
+        "etag": '"%s"' % hashlib.sha1(response.content).hexdigest(),
+    }
+    # Long enough to be served stale, and then some.
+    timeout = settings.XRPL_LEDGER_CLOSE_SECONDS * (settings.XRPL_CACHE_STALE_LEDGERS + 1) * 2
+    await cache.aset(key, entry, timeout)
+    return entry, response
+
+
+async def _revalidate(view, request, args, kwargs, key, ledger_index):
+    try:
+        await _build(view, request, args, kwargs, key, ledger_index)
+    except Exception as e:
+        print(f"Refreshing cached {request.path} failed: {e}")
+    finally:
+        await cache.adelete(key + ":refresh")
+
+
+def _respond(request, entry, state, private=False):
+    if entry["etag"] in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    close = settings.XRPL_LEDGER_CLOSE_SECONDS
+    response["ETag"] = entry["etag"]
+    response["Cache-Control"] = (
+        f"{'private' if private else 'public'}, max-age={close}, "
+        f"stale-while-revalidate={close * settings.XRPL_CACHE_STALE_LEDGERS}"
+    )
+    response["X-Ledger-Index"] = str(entry["ledger"])
+    response["X-Cache"] = state
+    return response
+
+
+def ledger_cached(view=None, *, private=False):
+    """
+    Caches a GET-only async view's 200 responses per path and latest
+    validated ledger. With private=True they are sent as Cache-Control:
+    private. Use as @ledger_cached or @ledger_cached(private=True).
+    """
+    if view is None:
+        return functools.partial(ledger_cached, private=private)
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return await view(request, *args, **kwargs)
+
+        key = _cache_key(request)
+        ledger_index = await latest_validated_ledger()
+        entry = await cache.aget(key)
+
+        if ledger_index is None:
+            # Can't tell how fresh anything is: an old answer beats an error.
+            if entry is not None:
+                return _respond(request, entry, "STALE", private)
+            return await view(request, *args, **kwargs)
+
+        if entry is not None and entry["ledger"] >= ledger_index:
+            return _respond(request, entry, "HIT", private)
+
+        if entry is not None and ledger_index - entry["ledger"] <= settings.XRPL_CACHE_STALE_LEDGERS:
+            # One rebuild at a time per key, across workers when the cache is shared.
+            if await cache.aadd(key + ":refresh", True, settings.XRPL_LEDGER_CLOSE_SECONDS * 2):
+                task = asyncio.create_task(_revalidate(view, request, args, kwargs, key, ledger_index))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return _respond(request, entry, "STALE", private)
+
+        entry, response = await _build(view, request, args, kwargs, key, ledger_index)
+        if entry is None:
+            return response
+        return _respond(request, entry, "MISS", private)
+
+    return wrapper
@@ -0,0 +1,178 @@
+"""
+Live ledger and account events for the browser, over Server-Sent Events.
+
+Every worker process keeps ONE upstream XRPL subscription: an
+AccountMonitor (xrpl_account_monitor.py) on XRPL_WS_URL watching the
+accounts its connected browsers follow, each account once however many
+browsers follow it. An account change is encoded as an SSE frame once and
+handed to the queues of the browsers following that account; a validated
+ledger goes to all of them.
+
+Each browser's queue holds at most XRPL_FEED_QUEUE_SIZE frames. Nothing
+waits for a browser that falls that far behind: its backlog is dropped and
+replaced by one `resync` event, after which it re-reads the accounts it
+follows (GET /api/account/<address>/) and carries on from the live feed.
+
+Events sent by GET /api/stream/?accounts=<address>,<address>:
+
+    event: ledger    data: {"ledger_index": 123}
+    event: account   data: {"address": ..., "balance_xrp": ..., "sequence": ...,
+                            "owner_count": ..., "ledger_index": ..., "tx_hash": ...,
+                            "deleted": false}
+    event: resync    data: {}
+"""
+
+import asyncio
+import json
+import weakref
+
+from django.conf import settings
+from xrpl.utils import drops_to_xrp
+
+from xrpl_account_monitor import AccountMonitor
+
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+_feeds = weakref.WeakKeyDictionary()
+
+
+def sse_frame(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+RESYNC_FRAME = sse_frame("resync", {})
+
+
+def account_frame(address, state, message) -> bytes:
+    """The `account` event for an AccountRoot state (None once deleted)."""
+    state = state or {}
+    return sse_frame("account", {
+        "address": address,
+        "balance_xrp": str(drops_to_xrp(state["Balance"])) if "Balance" in state else None,
+        "sequence": state.get("Sequence"),
+        "owner_count": state.get("OwnerCount", 0),
+        "ledger_index": message.get("ledger_index") if message else None,
+        "tx_hash": message.get("transaction", {}).get("hash") or message.get("hash") if message else None,
+        "deleted": not state,
+    })
+
+
+class FeedClient:
+    """One connected browser: the accounts it follows and its bounded queue of frames."""
+
+    def __init__(self, accounts, queue_size: int):
+        self.accounts = frozenset(accounts)
+        self.queue = asyncio.Queue(queue_size)
+        self.resyncs = 0
+
+    def push(self, frame: bytes):
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Too far behind to catch up event by event; start it over.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_FRAME)
+            self.resyncs += 1
+
+
+class LiveFeed:
+    """
+    Fans one AccountMonitor's events out to the FeedClients of this event loop.
+
+    url:        XRPL WebSocket endpoint
+    queue_size: frames buffered per browser before it is told to resync
+    """
+
+    def __init__(self, url: str, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.monitor = AccountMonitor(url)
+        self.monitor.add_listener(self._on_account)
+        self.monitor.add_ledger_listener(self._on_ledger)
+        self.clients = set()
+        self._followers = {}  # address -> set of FeedClients following it
+        self._tasks = set()
+        self._monitor_task = None
+
+    def _spawn(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # --- fan-out ------------------------------------------------------------
+
+    def _on_account(self, address, old_state, new_state, message):
+        followers = self._followers.get(address)
+        if not followers:
+            return
+        frame = account_frame(address, new_state, message)
+        for client in followers:
+            client.push(frame)
+
+    def _on_ledger(self, ledger_index):
+        frame = sse_frame("ledger", {"ledger_index": ledger_index})
+        for client in self.clients:
+            client.push(frame)
+
+    # --- clients ------------------------------------------------------------
+
+    def connect(self, accounts) -> FeedClient:
+        """Registers a browser following `accounts`, queued up with what is already known."""
+        client = FeedClient(accounts, self.queue_size)
+        self.clients.add(client)
+        new = []
+        for address in client.accounts:
+            followers = self._followers.setdefault(address, set())
+            if not followers:
+                new.append(address)
+            followers.add(client)
+            state = self.monitor.accounts.get(address)
+            if state is not None:
+                client.push(account_frame(address, state, None))
+        if self.monitor.ledger_index is not None:
+            client.push(sse_frame("ledger", {"ledger_index": self.monitor.ledger_index}))
+
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = self._spawn(self.monitor.run())
+        if new:
+            # Loaded in the background; their first state arrives through _on_account.
+            self._spawn(self.monitor.watch(new))
+        return client
+
+    def disconnect(self, client: FeedClient):
+        self.clients.discard(client)
+        gone = []
+        for address in client.accounts:
+            followers = self._followers.get(address)
+            if followers is None:
+                continue
+            followers.discard(client)
+            if not followers:
+                del self._followers[address]
+                gone.append(address)
+        if gone:
+            self._spawn(self.monitor.unwatch(gone))
+
+    async def stream(self, client: FeedClient, heartbeat: float = 15.0):
+        """The SSE body for `client`; disconnects it when the browser goes away."""
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(client.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream.
+                    frame = KEEPALIVE_FRAME
+                yield frame
+        finally:
+            self.disconnect(client)
+
+
+def get_live_feed() -> LiveFeed:
+    """The LiveFeed for the running event loop (one per ASGI worker), created on first use."""
+    loop = asyncio.get_running_loop()
+    feed = _feeds.get(loop)
+    if feed is None:
+        feed = _feeds[loop] = LiveFeed(settings.XRPL_WS_URL, settings.XRPL_FEED_QUEUE_SIZE)
+    return feed
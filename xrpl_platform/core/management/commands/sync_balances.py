@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.balance_sync import BalanceSync
+from xrpl_base import PooledJsonRpcClient
+
+
+class Command(BaseCommand):
+    help = "Refreshes XrplWallet.balance from the validated ledger, in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000,
+                            help="Wallets read, fetched and written together.")
+        parser.add_argument("--workers", type=int, default=8,
+                            help="account_info batches in flight at once.")
+        parser.add_argument("--recent", type=int, metavar="N",
+                            help="Only sync wallets touched in the last N validated ledgers.")
+        parser.add_argument("--since-ledger", type=int, metavar="LEDGER",
+                            help="Only sync wallets touched after this ledger (see the last_ledger printed).")
+        parser.add_argument("--url", help="rippled JSON-RPC URL (default: settings.XRPL_RPC_URL).")
+
+    def handle(self, *args, **options):
+        client = PooledJsonRpcClient(options["url"]) if options["url"] else None
+        service = BalanceSync(client, chunk_size=options["chunk_size"], workers=options["workers"])
+
+        started = time.perf_counter()
+        if options["since_ledger"] is not None or options["recent"] is not None:
+            stats = service.sync_recent(ledgers=options["recent"] or 10, since_ledger=options["since_ledger"])
+        else:
+            stats = service.sync_all()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Synced {stats['wallets']} wallets in {elapsed:.1f}s: {stats['updated']} updated, "
+            f"{stats['unfunded']} unfunded, {stats['errors']} lookups failed"
+        ))
+        if "last_ledger" in stats:
+            self.stdout.write(f"last_ledger={stats['last_ledger']}")
@@ -21,4 +21,66 @@
         // Log any errors that occurred during the process
         console.error('Error fetching API data:', error);
     }
-})();
\ No newline at end of file
+})();
+
+// Live ledger and balance updates, pushed by the server over one
+// Server-Sent Events connection per page (/api/stream/).
+//   <span data-xrpl-ledger></span>             latest validated ledger
+//   <span data-xrpl-account="rAddress"></span>  that account's XRP balance
+// Other scripts can listen for 'xrpl:ledger' and 'xrpl:account' events on
+// document; event.detail is the data sent by the server.
+document.addEventListener('DOMContentLoaded', () => {
+    const ledgerElements = document.querySelectorAll('[data-xrpl-ledger]');
+    const accountElements = document.querySelectorAll('[data-xrpl-account]');
+    if (ledgerElements.length === 0 && accountElements.length === 0) return;
+
+    const accounts = [...new Set([...accountElements].map((el) => el.dataset.xrplAccount))];
+
+    function showBalance(address, balance) {
+        accountElements.forEach((el) => {
+            if (el.dataset.xrplAccount === address) el.textContent = balance ?? 'not funded';
+        });
+    }
+
+    // Re-read the accounts once; used when the stream says we missed updates.
+    async function resync() {
+        for (const address of accounts) {
+            try {
+                const response = await fetch(`/api/account/${address}/`);
+                if (response.status === 404) {
+                    showBalance(address, null);
+                } else if (response.ok) {
+                    const data = await response.json();
+                    showBalance(address, data.balance_xrp);
+                }
+            } catch (error) {
+                console.error(`Error loading ${address}:`, error);
+            }
+        }
+    }
+
+    // EventSource reconnects by itself if the connection drops. It gives up
+    // for good when the server has no live feed (204 from a WSGI server);
+    // the accounts are then shown once, as they are now.
+    const source = new EventSource(`/api/stream/?accounts=${accounts.join(',')}`);
+
+    source.addEventListener('error', () => {
+        if (source.readyState === EventSource.CLOSED) resync();
+    });
+
+    source.addEventListener('ledger', (event) => {
+        const data = JSON.parse(event.data);
+        ledgerElements.forEach((el) => { el.textContent = data.ledger_index; });
+        document.dispatchEvent(new CustomEvent('xrpl:ledger', { detail: data }));
+    });
+
+    source.addEventListener('account', (event) => {
+        const data = JSON.parse(event.data);
+        showBalance(data.address, data.deleted ? null : data.balance_xrp);
+        document.dispatchEvent(new CustomEvent('xrpl:account', { detail: data }));
+    });
+
+    source.addEventListener('resync', resync);
+
+    window.addEventListener('beforeunload', () => source.close());
+});
@@ -8,6 +8,27 @@ document.addEventListener('DOMContentLoaded', () => {
 
     let pollingInterval; // To store the interval timer
 
+    // The donation account's balance is pushed live by main.js (only shown
+    // when the page has a donation address). A rise while a payment is
+    // pending means it is on the ledger; no need to wait for the next poll.
+    const donationBalance = document.getElementById('donation-balance');
+    let lastBalance = null;
+    let balanceBeforePayment = null;
+
+    document.addEventListener('xrpl:account', (event) => {
+        const data = event.detail;
+        if (!donationBalance || data.address !== donationBalance.dataset.xrplAccount) return;
+        lastBalance = data.deleted ? null : Number(data.balance_xrp);
+
+        if (pollingInterval && balanceBeforePayment !== null && lastBalance > balanceBeforePayment) {
+            clearInterval(pollingInterval); // Stop checking
+            pollingInterval = null;
+            qrContainer.classList.add('hidden');
+            messageContainer.textContent = `Success! Payment received in ledger ${data.ledger_index}.`;
+            messageContainer.style.color = 'green';
+        }
+    });
+
     // Helper function to get Django's CSRF token
     function getCookie(name) {
         let cookieValue = null;
@@ -38,6 +59,7 @@ document.addEventListener('DOMContentLoaded', () => {
         qrContainer.classList.add('hidden');
         messageContainer.textContent = '';
         if (pollingInterval) clearInterval(pollingInterval);
+        balanceBeforePayment = lastBalance;
 
         try {
             // This is the backend API endpoint you will need to create.
@@ -98,6 +120,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 // 'resolved' means the user has signed or rejected
                 if (data.resolved) {
                     clearInterval(pollingInterval); // Stop checking
+                    pollingInterval = null;
                     qrContainer.classList.add('hidden'); // Hide the QR code
 
                     if (data.signed) {
@@ -116,6 +139,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 console.error('Error polling for status:', error);
                 // If polling fails, stop to avoid flooding
                 clearInterval(pollingInterval);
+                pollingInterval = null;
                 messageContainer.textContent = 'Error checking payment status.';
             }
         }, 2000); // Check every 2 seconds
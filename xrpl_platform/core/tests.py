@@ -1,3 +1,127 @@
-from django.test import TestCase
+import asyncio
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.test import AsyncRequestFactory, SimpleTestCase, override_settings
+
+from . import caching
+from .caching import LEDGER_KEY, ledger_cached
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    XRPL_LEDGER_POLL_SECONDS=60,
+    XRPL_CACHE_STALE_LEDGERS=2,
+)
+class LedgerCachedTests(SimpleTestCase):
+    """ledger_cached with the latest validated ledger set directly in the cache."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+        self.calls = 0
+
+        @ledger_cached
+        async def view(request):
+            self.calls += 1
+            return JsonResponse({"calls": self.calls})
+
+        @ledger_cached(private=True)
+        async def private_view(request):
+            return JsonResponse({"user": "alice"})
+
+        @ledger_cached
+        async def failing_view(request):
+            return JsonResponse({"status": "error"}, status=502)
+
+        self.view = view
+        self.private_view = private_view
+        self.failing_view = failing_view
+
+    async def get(self, view, path="/api/thing/", **headers):
+        return await view(self.factory.get(path, headers=headers))
+
+    async def set_ledger(self, ledger_index):
+        await cache.aset(LEDGER_KEY, ledger_index)
+
+    async def test_miss_then_hit_on_the_same_ledger(self):
+        await self.set_ledger(1000)
+        first = await self.get(self.view)
+        second = await self.get(self.view)
+
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["X-Ledger-Index"], "1000")
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(first["Cache-Control"].startswith("public, "))
+
+    async def test_matching_etag_gets_304(self):
+        await self.set_ledger(1000)
+        first = await self.get(self.view)
+        again = await self.get(self.view, If_None_Match=first["ETag"])
+        other = await self.get(self.view, If_None_Match='"something-else"')
+
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again["ETag"], first["ETag"])
+        self.assertEqual(other.status_code, 200)
+        self.assertEqual(self.calls, 1)
+
+    async def test_stale_entry_is_served_while_it_is_rebuilt(self):
+        await self.set_ledger(1000)
+        first = await self.get(self.view)
+
+        await self.set_ledger(1002)
+        stale = await self.get(self.view)
+        self.assertEqual(stale["X-Cache"], "STALE")
+        self.assertEqual(stale.content, first.content)
+        await asyncio.gather(*caching._refresh_tasks)
+
+        fresh = await self.get(self.view)
+        self.assertEqual((fresh["X-Cache"], fresh["X-Ledger-Index"]), ("HIT", "1002"))
+        self.assertNotEqual(fresh["ETag"], first["ETag"])
+        self.assertEqual(self.calls, 2)
+
+    async def test_entry_too_old_is_rebuilt_before_responding(self):
+        await self.set_ledger(1000)
+        await self.get(self.view)
+
+        await self.set_ledger(1003)
+        response = await self.get(self.view)
+
+        self.assertEqual((response["X-Cache"], response["X-Ledger-Index"]), ("MISS", "1003"))
+        self.assertEqual(self.calls, 2)
+
+    async def test_entries_are_per_path(self):
+        await self.set_ledger(1000)
+        await self.get(self.view, "/api/thing/?a=1")
+        response = await self.get(self.view, "/api/thing/?a=2")
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(self.calls, 2)
+
+    async def test_errors_are_not_cached(self):
+        await self.set_ledger(1000)
+        first = await self.get(self.failing_view)
+        second = await self.get(self.failing_view)
+
+        self.assertEqual((first.status_code, second.status_code), (502, 502))
+        self.assertFalse(second.has_header("X-Cache"))
+
+    async def test_private_views_stay_out_of_shared_caches(self):
+        await self.set_ledger(1000)
+        response = await self.get(self.private_view)
+
+        self.assertTrue(response["Cache-Control"].startswith("private, "))
+
+    async def test_unknown_ledger_serves_the_old_entry_or_runs_uncached(self):
+        await self.set_ledger(1000)
+        first = await self.get(self.view)
+
+        with mock.patch.object(caching, "latest_validated_ledger", mock.AsyncMock(return_value=None)):
+            stale = await self.get(self.view)
+            uncached = await self.get(self.view, "/api/thing/?new=1")
+
+        self.assertEqual((stale["X-Cache"], stale.content), ("STALE", first.content))
+        self.assertFalse(uncached.has_header("X-Cache"))
+        self.assertEqual(self.calls, 2)
@@ -13,4 +13,13 @@ urlpatterns = [
     path('api/key-login/', views.api_key_login, name='api_key_login'),
     path('login/', views.login_page_view, name='login_page'),
     path('payment/', views.payment_page, name='payment_page'),
+    path('metrics/', views.metrics, name='metrics'),
+    # Stored wallets (database reads and writes)
+    path('api/wallets/', views.api_wallets, name='api_wallets'),
+    # Async XRPL-backed endpoints (served natively under ASGI)
+    path('api/ledger/', views.api_ledger_status, name='api_ledger_status'),
+    path('api/account/<str:address>/', views.api_account_summary, name='api_account_summary'),
+    path('api/account/<str:address>/nfts/', views.api_account_nfts, name='api_account_nfts'),
+    # Live ledger/balance events (Server-Sent Events)
+    path('api/stream/', views.api_stream, name='api_stream'),
 ]
\ No newline at end of file
@@ -1,8 +1,20 @@
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+import asyncio
 import json
 from django.http import JsonResponse
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.core.addresscodec import is_valid_classic_address
+from xrpl.utils import drops_to_xrp, hex_to_str
+from xrpl_metrics import prometheus_text
+
+from .caching import ledger_cached
+from .live_feed import get_live_feed
+from .models import XrplWallet
+from .xrpl_clients import get_async_client
 # Create your views here.
 
 def homepage(request):
@@ -28,7 +40,8 @@ def payment_page(request):
     It just renders a simple HTML template.
     """
     # This will look for a template at 'core/templates/core/payment_page.html'
-    return render(request, 'payment_page.html')
+    # The donation account's balance is shown live (see js/main.js).
+    return render(request, 'payment_page.html', {'donation_address': settings.XRPL_DONATION_ADDRESS})
 
 
 def api_data(request):
@@ -142,3 +155,221 @@ def api_key_login(request):
             {"status": "error", "message": "An internal server error occurred"}, 
             status=500
         )
+
+
+def metrics(request):
+    """
+    Prometheus scrape endpoint: per-method XRPL call counts, latency
+    histograms, bytes in/out and error codes, plus submit-to-validation
+    times, for the XRPL clients running in this process.
+    """
+    return HttpResponse(prometheus_text(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# --- Async XRPL-backed API ---
+# These await the XRPL node and the database without holding a thread, so
+# one ASGI worker can serve many requests that are waiting on the node.
+# Their responses are cached per validated ledger (see core/caching.py).
+
+def xrpl_error_response(result):
+    """JsonResponse for an XRPL error result: 404 for unknown accounts, 502 otherwise."""
+    status = 404 if result.get("error") == "actNotFound" else 502
+    return JsonResponse(
+        {"status": "error", "error": result.get("error"), "message": result.get("error_message")},
+        status=status,
+    )
+
+
+@ledger_cached(private=True)
+async def api_account_summary(request, address):
+    """
+    Balance, sequence, trust lines and NFT count of an account from the
+    validated ledger, plus what the database knows about it.
+    """
+    if not is_valid_classic_address(address):
+        return JsonResponse({'status': 'error', 'message': f'Invalid address: {address}'}, status=400)
+
+    client = get_async_client()
+    try:
+        info, lines, nfts, wallet = await asyncio.gather(
+            client.account_info(address, ledger_index="validated"),
+            client.account_lines(address, ledger_index="validated"),
+            client.account_nfts(address, ledger_index="validated"),
+            XrplWallet.objects.filter(wallet_address=address).afirst(),
+        )
+    except XRPLRequestFailureException as e:
+        return xrpl_error_response({"error": e.error, "error_message": e.error_message})
+    except Exception as e:
+        print(f"Error loading account {address}: {e}")
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=502)
+    if "error" in info:
+        return xrpl_error_response(info)
+
+    account_data = info["account_data"]
+    return JsonResponse({
+        'address': address,
+        'ledger_index': info.get("ledger_index"),
+        'balance_xrp': str(drops_to_xrp(account_data["Balance"])),
+        'sequence': account_data["Sequence"],
+        'owner_count': account_data.get("OwnerCount", 0),
+        'trust_lines': [
+            {
+                'currency': line["currency"],
+                'issuer': line["account"],
+                'balance': line["balance"],
+                'limit': line["limit"],
+            }
+            for line in lines.get("lines", [])
+        ],
+        # First page only; see api_account_nfts for the full list.
+        'nft_count': len(nfts.get("account_nfts", [])),
+        'nft_count_complete': "marker" not in nfts,
+        'stored_wallet': {
+            'username': wallet.username,
+            'balance': str(wallet.balance),
+        } if wallet else None,
+    })
+
+
+@ledger_cached
+async def api_ledger_status(request):
+    """Latest validated ledger, fees, reserves and server load."""
+    client = get_async_client()
+    try:
+        server_info, current = await asyncio.gather(
+            client.get_server_info(),
+            client.get_ledger_current(),
+        )
+    except XRPLRequestFailureException as e:
+        return xrpl_error_response({"error": e.error, "error_message": e.error_message})
+    except Exception as e:
+        print(f"Error reading ledger status: {e}")
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=502)
+    if "error" in server_info:
+        return xrpl_error_response(server_info)
+
+    info = server_info["info"]
+    validated = info.get("validated_ledger", {})
+    return JsonResponse({
+        'server_state': info.get("server_state"),
+        'validated_ledger': validated.get("seq"),
+        'current_ledger': current.get("ledger_current_index"),
+        'complete_ledgers': info.get("complete_ledgers"),
+        'base_fee_xrp': validated.get("base_fee_xrp"),
+        'reserve_base_xrp': validated.get("reserve_base_xrp"),
+        'reserve_inc_xrp': validated.get("reserve_inc_xrp"),
+        'load_factor': info.get("load_factor"),
+    })
+
+
+@ledger_cached
+async def api_account_nfts(request, address):
+    """
+    NFTs owned by an account, following account_nfts markers up to
+    ?limit= (default 100, at most 1000).
+    """
+    try:
+        limit = min(int(request.GET.get("limit", 100)), 1000)
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'limit must be an integer'}, status=400)
+
+    nfts = []
+    try:
+        async for nft in get_async_client().iter_account_nfts(address, limit=min(limit, 400)):
+            nfts.append({
+                'nft_id': nft["NFTokenID"],
+                'issuer': nft.get("Issuer"),
+                'taxon': nft.get("NFTokenTaxon"),
+                'flags': nft.get("Flags", 0),
+                'transfer_fee': nft.get("TransferFee", 0),
+                'uri': hex_to_str(nft["URI"]) if nft.get("URI") else None,
+            })
+            if len(nfts) >= limit:
+                break
+    except XRPLRequestFailureException as e:
+        return xrpl_error_response({"error": e.error, "error_message": e.error_message})
+    except Exception as e:
+        print(f"Error listing NFTs for {address}: {e}")
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=502)
+
+    return JsonResponse({'address': address, 'count': len(nfts), 'nfts': nfts})
+
+
+async def api_stream(request):
+    """
+    Server-Sent Events: `ledger` on every validated ledger, and `account`
+    whenever one of ?accounts= (comma separated, at most
+    XRPL_FEED_MAX_ACCOUNTS) changes. See core/live_feed.py.
+
+    Only served under ASGI. A WSGI server (runserver, wsgi.py) would hold a
+    thread per browser and run the feed on a throwaway event loop, so there
+    it answers 204 No Content, which tells EventSource not to reconnect.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+
+    accounts = [address for address in request.GET.get("accounts", "").split(",") if address]
+    if len(accounts) > settings.XRPL_FEED_MAX_ACCOUNTS:
+        return JsonResponse(
+            {'status': 'error', 'message': f'At most {settings.XRPL_FEED_MAX_ACCOUNTS} accounts'}, status=400
+        )
+    invalid = [address for address in accounts if not is_valid_classic_address(address)]
+    if invalid:
+        return JsonResponse({'status': 'error', 'message': f'Invalid address: {invalid[0]}'}, status=400)
+
+    feed = get_live_feed()
+    client = feed.connect(accounts)
+    response = StreamingHttpResponse(
+        feed.stream(client, settings.XRPL_FEED_HEARTBEAT_SECONDS), content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Tells nginx not to buffer the stream.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# --- Stored wallets ---
+# Plain database reads and writes, through Django's async ORM and the
+# connection pool (see DATABASES in settings.py).
+
+@csrf_exempt  # JSON endpoint, like api_post_data
+async def api_wallets(request):
+    """
+    GET: the stored wallets, newest first (?limit=, default 50, at most 500).
+    POST {"username": ..., "wallet_address": ...}: stores the wallet, or
+    renames it if the address is already stored (201 / 200).
+    """
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({'status': 'error', 'message': 'Invalid JSON'}, status=400)
+        address = data.get('wallet_address', '')
+        username = data.get('username', '')
+        if not is_valid_classic_address(address):
+            return JsonResponse({'status': 'error', 'message': f'Invalid address: {address}'}, status=400)
+        if not username or len(username) > 100:
+            return JsonResponse({'status': 'error', 'message': 'username must be 1-100 characters'}, status=400)
+
+        wallet, created = await XrplWallet.objects.aupdate_or_create(
+            wallet_address=address, defaults={'username': username}
+        )
+        return JsonResponse({
+            'status': 'success',
+            'created': created,
+            'wallet': {'username': wallet.username, 'wallet_address': wallet.wallet_address,
+                       'balance': str(wallet.balance)},
+        }, status=201 if created else 200)
+
+    if request.method != 'GET':
+        return JsonResponse({'status': 'error', 'message': 'Only GET and POST are allowed'}, status=405)
+    try:
+        limit = max(min(int(request.GET.get("limit", 50)), 500), 0)
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'limit must be an integer'}, status=400)
+
+    wallets = [
+        {'username': wallet.username, 'wallet_address': wallet.wallet_address, 'balance': str(wallet.balance)}
+        async for wallet in XrplWallet.objects.order_by('-id')[:limit]
+    ]
+    return JsonResponse({'count': len(wallets), 'wallets': wallets})
@@ -0,0 +1,25 @@
+"""
+XRPL clients shared by the views.
+
+An AsyncXrplQueryClient's connection pool belongs to the event loop it was
+first used on, so there is one client per running loop: under ASGI that is
+one per worker process, shared by every request it serves.
+"""
+
+import asyncio
+import weakref
+
+from django.conf import settings
+
+from xrpl_async_base import AsyncXrplQueryClient
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> AsyncXrplQueryClient:
+    """The AsyncXrplQueryClient for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncXrplQueryClient(settings.XRPL_RPC_URL)
+    return client
@@ -0,0 +1,38 @@
+"""
+Production serving profile: Gunicorn supervising uvicorn workers.
+
+Each worker is a separate process running the ASGI app with its own event
+loop, XRPL clients, live feed and database connection pool, so the async
+views keep their concurrency and a CPU-bound request only stalls one
+worker. Gunicorn restarts workers that crash, hang or reach max_requests.
+
+    gunicorn -c xrpl_platform/gunicorn.conf.py
+
+Settings come from the environment:
+    WEB_CONCURRENCY   worker processes (default: 2 per CPU + 1)
+    PORT              port to listen on (default 8000)
+"""
+
+import multiprocessing
+import os
+
+# The Django project dir, wherever Gunicorn is started from.
+chdir = os.path.dirname(os.path.abspath(__file__))
+wsgi_app = "xrpl_platform.asgi:application"
+worker_class = "uvicorn_worker.UvicornWorker"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Live feed streams stay open indefinitely; timeout only catches workers
+# whose event loop stops answering Gunicorn's heartbeat.
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then; jitter keeps them from restarting together.
+max_requests = 10000
+max_requests_jitter = 1000
+
+accesslog = "-" if os.environ.get("ACCESS_LOG", "0") == "1" else None
+errorlog = "-"
@@ -0,0 +1,177 @@
+"""
+Benchmark: requests/s and latency percentiles under each serving profile of
+api_data (GET /api/data/, no database: the serving stack alone) and of
+api_wallets, which goes through the ORM and the connection handling being
+compared: GET /api/wallets/ reads the newest 50 stored wallets and POST
+/api/wallets/ upserts one of WRITE_ADDRESSES (a SELECT plus an INSERT or
+UPDATE in a transaction).
+
+  runserver   the Django dev server, a new database connection per request
+  uvicorn     one uvicorn worker, a new database connection per request
+  persistent  Gunicorn + uvicorn workers, CONN_MAX_AGE connections
+  pooled      Gunicorn + uvicorn workers, psycopg pool (the production default)
+
+Every profile gets the same warm-up, request count and concurrency. Runs
+against the Postgres configured for the project, e.g. a local one, which is
+migrated first and gets up to WRITE_ADDRESSES rows of benchmark wallets:
+
+    docker compose up -d db
+    POSTGRES_HOST=localhost POSTGRES_DB=xrpl_db python serving_benchmark.py
+
+Usage:
+    python serving_benchmark.py [requests] [concurrency] [workers] [profile ...]
+"""
+
+import asyncio
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import django
+import httpx
+from xrpl.core.addresscodec import encode_classic_address
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Rows the write benchmark spreads its upserts over.
+WRITE_ADDRESSES = [encode_classic_address(bytes([i % 256, i // 256]) * 10) for i in range(1, 201)]
+
+
+def wallet_payload(n):
+    return {"username": f"benchmark-{n}", "wallet_address": WRITE_ADDRESSES[n % len(WRITE_ADDRESSES)]}
+
+
+# (name, method, path, JSON body or a function of the request number)
+ENDPOINTS = [
+    ("api_data", "GET", "/api/data/", None),
+    ("api_wallets", "GET", "/api/wallets/", None),
+    ("api_wallets_post", "POST", "/api/wallets/", wallet_payload),
+]
+
+# Environment per profile, on top of the caller's.
+PROFILES = {
+    "runserver": {"DB_POOL": "0", "DB_CONN_MAX_AGE": "0"},
+    "uvicorn": {"DB_POOL": "0", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "0", "DB_CONN_MAX_AGE": "60"},
+    "pooled": {"DB_POOL": "1"},
+}
+
+WARMUP_REQUESTS = 200
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(profile, port, workers, env):
+    if profile == "runserver":
+        command = [sys.executable, "manage.py", "runserver", "--noreload", f"127.0.0.1:{port}"]
+    elif profile == "uvicorn":
+        command = [sys.executable, "-m", "uvicorn", "xrpl_platform.asgi:application",
+                   "--host", "127.0.0.1", "--port", str(port), "--workers", "1", "--log-level", "warning"]
+    else:
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+                   "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--log-level", "warning"]
+    return subprocess.Popen(command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_ready(url, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url + ENDPOINTS[0][2], timeout=2.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not come up")
+
+
+def check_database(env):
+    """
+    Fails early, with Django's message, if the configured database can't be
+    reached; then applies the migrations the api_wallets benchmark needs.
+    """
+    result = subprocess.run(
+        [sys.executable, "manage.py", "shell", "-c",
+         "from django.db import connection; connection.ensure_connection()"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        sys.exit(f"Can't connect to the database (is Postgres running and POSTGRES_* set?): {error}")
+    subprocess.run([sys.executable, "manage.py", "migrate", "--noinput", "-v", "0"], cwd=BASE_DIR, env=env, check=True)
+
+
+def percentile(latencies, fraction):
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+
+async def run_load(url, method, path, payload, total, concurrency):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, timeout=60.0, limits=limits) as client:
+        async def one(n):
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    body = payload(n) if callable(payload) else payload
+                    response = await client.request(method, path, json=body)
+                    if not response.is_success:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(n) for n in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "errors": errors,
+    }
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1) * 2 + 1
+    profiles = sys.argv[4:] or list(PROFILES)
+
+    print(f"{total} requests per endpoint, {concurrency} concurrent, {workers} Gunicorn workers")
+    print(f"Python {platform.python_version()}, Django {django.get_version()}, {os.cpu_count()} CPUs\n")
+    check_database({**os.environ, **PROFILES["pooled"]})
+
+    for profile in profiles:
+        env = {**os.environ, **PROFILES[profile]}
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = start_server(profile, port, workers, env)
+        try:
+            wait_ready(url)
+            for name, method, path, payload in ENDPOINTS:
+                asyncio.run(run_load(url, method, path, payload, WARMUP_REQUESTS, concurrency))
+                stats = asyncio.run(run_load(url, method, path, payload, total, concurrency))
+                print(f"{profile:10} {name:14} {stats['rps']:8.1f} req/s   p50 {stats['p50']:7.1f} ms   "
+                      f"p99 {stats['p99']:7.1f} ms   {stats['errors']} errors")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,33 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from asgiref.wsgi import WsgiToAsgi
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from whitenoise import WhiteNoise
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'xrpl_platform.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+STATIC_PREFIX = '/' + settings.STATIC_URL.lstrip('/')
+
+
+def _not_found(environ, start_response):
+    start_response('404 Not Found', [('Content-Type', 'text/plain')])
+    return [b'Not Found']
+
+
+# Static files (STATIC_ROOT, filled by collectstatic) are answered here,
+# ahead of Django: WhiteNoise is WSGI-only, and as Django middleware it
+# would push every request, async views included, through a thread.
+static_application = WsgiToAsgi(
+    WhiteNoise(_not_found, root=settings.STATIC_ROOT, prefix=settings.STATIC_URL, autorefresh=settings.DEBUG)
+)
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'].startswith(STATIC_PREFIX):
+        await static_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -11,11 +11,18 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The XRPL client modules (xrpl_base, xrpl_metrics, ...) live in the
+# Playground and import each other as top-level modules.
+XRPL_LIB_DIR = os.environ.get("XRPL_LIB_DIR", str(BASE_DIR.parent / "Playground" / "xrpl_playground"))
+if XRPL_LIB_DIR not in sys.path:
+    sys.path.append(XRPL_LIB_DIR)
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -85,6 +92,33 @@ DATABASES = {
     }
 }
 
+# Connection reuse
+# By default every worker process keeps a psycopg pool of DB_POOL_MIN_SIZE
+# to DB_POOL_MAX_SIZE connections; each one is checked before it is handed
+# out and replaced after DB_POOL_MAX_LIFETIME seconds. Keep workers x
+# DB_POOL_MAX_SIZE below Postgres' max_connections. With DB_POOL=0 each
+# thread instead keeps its own connection for DB_CONN_MAX_AGE seconds,
+# health-checked before reuse.
+
+DB_POOL = os.environ.get("DB_POOL", "1") == "1"
+
+# Also makes the pool check connections before handing them out.
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+            # Seconds a request may wait for a free connection.
+            "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+            "max_idle": 300,
+            "max_lifetime": int(os.environ.get("DB_POOL_MAX_LIFETIME", "1800")),
+        },
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", "60"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -122,6 +156,16 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# `manage.py collectstatic` gathers everything here (the Docker image does
+# it at build time). Under ASGI, asgi.py serves this directory with
+# WhiteNoise, gzip-compressed copies included, before Django is reached.
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedStaticFilesStorage"},
+}
+
 
 # Add this line:
 # This tells Django to look for a folder named 'static'
@@ -130,6 +174,72 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
 
+# XRPL node used by the API views and server-side jobs such as
+# `manage.py sync_balances`.
+
+XRPL_RPC_URL = os.environ.get("XRPL_RPC_URL", "https://s.altnet.rippletest.net:51234")
+
+# Cache
+# Local memory by default (per process); set REDIS_URL (e.g.
+# redis://redis:6379/0) to share one cache between all workers.
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+# Ledger-keyed view cache (core/caching.py): how often the latest validated
+# ledger index is re-read, roughly how long a ledger stays open, and for how
+# many ledgers after its own a cached response may still be served (stale)
+# while it is recomputed in the background.
+
+XRPL_LEDGER_POLL_SECONDS = 1
+XRPL_LEDGER_CLOSE_SECONDS = 4
+XRPL_CACHE_STALE_LEDGERS = int(os.environ.get("XRPL_CACHE_STALE_LEDGERS", "2"))
+
+# Live feed (/api/stream/, core/live_feed.py): one XRPL WebSocket
+# subscription per worker, fanned out to the browsers; frames buffered per
+# browser before it is told to resync, accounts one browser may follow,
+# and seconds between keepalives on an idle stream.
+
+XRPL_WS_URL = os.environ.get("XRPL_WS_URL", "wss://s.altnet.rippletest.net:51233")
+XRPL_FEED_QUEUE_SIZE = 100
+XRPL_FEED_MAX_ACCOUNTS = 10
+XRPL_FEED_HEARTBEAT_SECONDS = 15
+
+# Account whose balance the payment page shows live (optional).
+
+XRPL_DONATION_ADDRESS = os.environ.get("XRPL_DONATION_ADDRESS", "")
+
+# XRPL client instrumentation
+# Set XRPL_METRICS_LOG=1 to also write one JSON log line per XRPL call
+# (logger "xrpl.metrics"). The Prometheus text is always served at /metrics/.
+
+XRPL_METRICS_LOG = os.environ.get("XRPL_METRICS_LOG", "0") == "1"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "xrpl.metrics": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 